@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+"""
+asyncio API for ADF to Markdown conversion.
+
+Parsing and rendering a big page is pure CPU work and may take hundreds of
+milliseconds, calling ``NodeDoc.from_dict(data).to_markdown()`` inside a
+coroutine blocks the event loop for that long. The functions in this module
+offload the conversion to an executor:
+
+- ``executor=None`` uses the default thread pool of the running loop.
+- Any ``concurrent.futures.Executor`` can be given. Use a
+  ``ProcessPoolExecutor`` to use more than one CPU core, the conversion
+  function :func:`convert` is a module level function, so it is picklable.
+
+Example::
+
+    import asyncio
+    from concurrent.futures import ProcessPoolExecutor
+    from atlas_doc_parser.aio import aconvert, aconvert_many
+
+    async def main(consumer):
+        md = await aconvert(data)
+
+        with ProcessPoolExecutor() as executor:
+            # ``consumer`` can be a sync or async iterable of raw ADF dicts
+            async for md in aconvert_many(consumer, executor=executor):
+                ...
+"""
+
+import typing as T
+import asyncio
+import functools
+import collections
+from concurrent.futures import Executor
+
+from .type_hint import T_DATA
+from .nodes.node_doc import NodeDoc
+
+
+def convert(
+    data: T_DATA,
+    ignore_error: bool = False,
+) -> str:
+    """
+    Convert a raw ADF document to Markdown.
+
+    This is the function that runs in the executor.
+    """
+    return NodeDoc.from_dict(data).to_markdown(ignore_error=ignore_error)
+
+
+async def aconvert(
+    data: T_DATA,
+    ignore_error: bool = False,
+    executor: T.Optional[Executor] = None,
+) -> str:
+    """
+    Convert a raw ADF document to Markdown without blocking the event loop.
+
+    :param data: The raw ADF document.
+    :param ignore_error: See :meth:`~atlas_doc_parser.mark_or_node.BaseNode.to_markdown`.
+    :param executor: The executor to run the conversion, ``None`` means the
+        default executor of the running loop.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor,
+        functools.partial(convert, data, ignore_error),
+    )
+
+
+async def _aiter(
+    items: T.Union[T.Iterable[T_DATA], T.AsyncIterable[T_DATA]],
+) -> T.AsyncIterator[T_DATA]:
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def aconvert_many(
+    items: T.Union[T.Iterable[T_DATA], T.AsyncIterable[T_DATA]],
+    ignore_error: bool = False,
+    executor: T.Optional[Executor] = None,
+    concurrency: int = 8,
+) -> T.AsyncIterator[str]:
+    """
+    Convert many raw ADF documents, yield the Markdown in input order.
+
+    At most ``concurrency`` conversions are in flight. The next document is
+    only pulled from ``items`` when a slot is free, so a slow consumer of the
+    results applies backpressure to the producer of ``items``.
+
+    If a conversion fails, the remaining in-flight conversions are cancelled
+    and the exception is raised.
+
+    :param items: Sync or async iterable of raw ADF documents.
+    :param ignore_error: See :meth:`~atlas_doc_parser.mark_or_node.BaseNode.to_markdown`.
+    :param executor: The executor to run the conversions, ``None`` means the
+        default executor of the running loop.
+    :param concurrency: Max number of in-flight conversions.
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+    pending: T.Deque[asyncio.Future] = collections.deque()
+    try:
+        async for data in _aiter(items):
+            if len(pending) >= concurrency:
+                yield await pending.popleft()
+            pending.append(
+                asyncio.ensure_future(aconvert(data, ignore_error, executor))
+            )
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
@@ -20,6 +20,37 @@ from .mark_or_node import BaseNode
 from .mark_or_node import T_NODE
 from .marks.parse_mark import parse_mark
 from .nodes.parse_node import parse_node
+from .cache import make_cache_key
+from .cache import ConversionCache
+from .arena import ArenaDoc
+from .raw_render import raw_to_markdown
+from .raw_render import raw_extract_text
+from .aio import aconvert
+from .aio import aconvert_many
+from .render_report import to_markdown_with_report
+from .profiler import Profiler
+from .synthetic import DocGenerator
+from .synthetic import write_jsonl
+from .validator import validate
+from .validator import parse_validated
+from .links import Edge
+from .links import extract_edges
+from .links import collect_edges
+from .outline import OutlineItem
+from .outline import Section
+from .renderer import DEFAULT_RENDERER
+from .renderer import render_nothing
+from .preview import PreviewRenderer
+from .preview import render_preview
+from .parallel import PARALLEL_MIN_BLOCKS
+from . import builder
+from .transform import Transformer
+from .interning import InternTable
+from .interning import interning
+from .resolve import BaseResolver
+from .resolve import InMemoryResolver
+from .resolve import ResolverCache
+from .resolve import render_resolved
 
 # -----------------------------------------------------------------------------
 # Marks
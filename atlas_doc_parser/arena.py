@@ -0,0 +1,668 @@
+# -*- coding: utf-8 -*-
+
+"""
+Columnar (arena) representation of an ADF document.
+
+:class:`~atlas_doc_parser.nodes.node_doc.NodeDoc` keeps one Python object per
+node plus one per ``attrs`` object, which is expensive when a whole corpus
+needs to stay resident. :class:`ArenaDoc` stores the same tree as a handful
+of parallel ``array.array`` columns indexed by node id (pre-order position,
+the root is ``0``):
+
+- ``types``: type id, an index into :data:`NODE_TYPES`
+- ``parent``, ``first_child``, ``next_sibling``: tree links, ``-1`` for none
+- ``mark_set``: index into :attr:`ArenaDoc.mark_sets`, ``-1`` for no marks
+- ``attrs_id``: index into :attr:`ArenaDoc.attrs_table`, ``-1`` for no attrs
+- ``text_start``, ``text_end``: offsets of the text node content in the
+  single :attr:`ArenaDoc.text` buffer, ``-1`` for non text nodes
+
+Identical attrs objects and mark sets are stored only once, which is very
+effective on real pages where thousands of text nodes share a handful of
+mark combinations.
+
+Example::
+
+    from atlas_doc_parser.arena import ArenaDoc
+
+    arena = ArenaDoc.from_dict(data)  # no intermediate node objects
+    md = arena.to_markdown()          # renders directly on the arrays
+    doc = arena.to_node()             # back to NodeDoc when needed
+"""
+
+import typing as T
+import sys
+import json
+from array import array
+from datetime import datetime, timezone
+
+from func_args.api import OPT
+
+from .type_hint import T_DATA
+from .type_enum import TypeEnum
+from .exc import UnimplementedTypeError
+from .telemetry import report_unimplemented_type, doc_scope
+from .mark_or_node import BaseMark, BaseNode
+from .markdown_helpers import (
+    strip_double_empty_line,
+    ATLASSIAN_LANG_TO_MARKDOWN_LANG_MAPPING,
+)
+from .marks.parse_mark import parse_mark
+from .nodes.parse_node import NODE_TYPE_TO_CLASS_MAPPING
+from .table_grid import TableGrid, attrs_cell_spans, escape_table_cell
+
+NODE_TYPES: list[str] = list(NODE_TYPE_TO_CLASS_MAPPING)
+"""
+All node types that can be stored in an :class:`ArenaDoc`, the type id of a
+node is the index of its type in this list.
+"""
+
+NODE_TYPE_ID: dict[str, int] = {type_: i for i, type_ in enumerate(NODE_TYPES)}
+
+NONE = -1
+HAS_CONTENT = 1  # flag bit, the node has a ``content`` list (maybe empty)
+
+_STRUCTURAL_FIELDS = {"type", "attrs", "content", "marks", "text"}
+
+
+def _json_key(data: T.Any) -> str:
+    return json.dumps(data, sort_keys=True, separators=(",", ":"))
+
+
+def _deep_sizeof(obj: T.Any, seen: set[int]) -> int:
+    """
+    ``sys.getsizeof()`` of the object and of everything it references,
+    classes excluded, the ids of the counted objects are added to ``seen``.
+    """
+    size = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, type):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        else:
+            dct = getattr(obj, "__dict__", None)
+            if dct is not None:
+                stack.append(dct)
+    return size
+
+
+class ArenaDoc:
+    """
+    An ADF document stored as parallel arrays.
+
+    Use :meth:`from_dict` or :meth:`from_node` to build an instance,
+    :meth:`to_node` to convert it back to node objects and :meth:`to_markdown`
+    to render it without materializing node objects.
+    """
+
+    __slots__ = (
+        "types",
+        "parent",
+        "first_child",
+        "next_sibling",
+        "mark_set",
+        "attrs_id",
+        "extra_id",
+        "text_start",
+        "text_end",
+        "flags",
+        "text",
+        "mark_sets",
+        "attrs_table",
+        "extras",
+        "_text_parts",
+        "_text_len",
+        "_last_child",
+        "_mark_set_index",
+        "_attrs_index",
+    )
+
+    def __init__(self):
+        self.types = array("B")
+        self.parent = array("i")
+        self.first_child = array("i")
+        self.next_sibling = array("i")
+        self.mark_set = array("i")
+        self.attrs_id = array("i")
+        self.extra_id = array("i")
+        self.text_start = array("i")
+        self.text_end = array("i")
+        self.flags = array("B")
+        self.text: str = ""
+        self.mark_sets: list[tuple[BaseMark, ...]] = []
+        self.attrs_table: list[T.Any] = []
+        self.extras: list[dict[str, T.Any]] = []
+        # build time only state, released by _finalize()
+        self._text_parts: list[str] = []
+        self._text_len = 0
+        self._last_child: dict[int, int] = {}
+        self._mark_set_index: dict[str, int] = {}
+        self._attrs_index: dict[tuple[type, str], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Approximate memory used by the arena: the node columns, the text
+        buffer and the shared ``mark_sets``, ``attrs_table`` and ``extras``
+        tables, measured with ``sys.getsizeof()`` recursively. An object
+        referenced more than once is counted once.
+        """
+        seen = set()
+        columns = (
+            self.types,
+            self.parent,
+            self.first_child,
+            self.next_sibling,
+            self.mark_set,
+            self.attrs_id,
+            self.extra_id,
+            self.text_start,
+            self.text_end,
+            self.flags,
+        )
+        return (
+            sum(sys.getsizeof(col) for col in columns)
+            + _deep_sizeof(self.text, seen)
+            + _deep_sizeof(self.mark_sets, seen)
+            + _deep_sizeof(self.attrs_table, seen)
+            + _deep_sizeof(self.extras, seen)
+        )
+
+    # --------------------------------------------------------------------------
+    # Build
+    # --------------------------------------------------------------------------
+    def _add_node(self, type_: str, parent: int) -> int:
+        i = len(self.types)
+        self.types.append(NODE_TYPE_ID[type_])
+        self.parent.append(parent)
+        self.first_child.append(NONE)
+        self.next_sibling.append(NONE)
+        self.mark_set.append(NONE)
+        self.attrs_id.append(NONE)
+        self.extra_id.append(NONE)
+        self.text_start.append(NONE)
+        self.text_end.append(NONE)
+        self.flags.append(0)
+        if parent != NONE:
+            last = self._last_child.get(parent, NONE)
+            if last == NONE:
+                self.first_child[parent] = i
+            else:
+                self.next_sibling[last] = i
+            self._last_child[parent] = i
+        return i
+
+    def _set_text(self, i: int, text: str):
+        self.text_start[i] = self._text_len
+        self._text_parts.append(text)
+        self._text_len += len(text)
+        self.text_end[i] = self._text_len
+
+    def _set_attrs(self, i: int, key: tuple[type, str], factory: T.Callable):
+        try:
+            attrs_id = self._attrs_index[key]
+        except KeyError:
+            attrs_id = len(self.attrs_table)
+            self.attrs_table.append(factory())
+            self._attrs_index[key] = attrs_id
+        self.attrs_id[i] = attrs_id
+
+    def _set_mark_set(self, i: int, key: str, factory: T.Callable):
+        try:
+            mark_set_id = self._mark_set_index[key]
+        except KeyError:
+            mark_set_id = len(self.mark_sets)
+            self.mark_sets.append(factory())
+            self._mark_set_index[key] = mark_set_id
+        self.mark_set[i] = mark_set_id
+
+    def _finalize(self):
+        self.text = "".join(self._text_parts)
+        self._text_parts = []
+        self._last_child = {}
+        self._mark_set_index = {}
+        self._attrs_index = {}
+
+    @classmethod
+    def from_node(cls, node: "BaseNode") -> "ArenaDoc":
+        """
+        Build an arena from a parsed node tree (usually a ``NodeDoc``).
+        """
+        arena = cls()
+        stack = [(node, NONE)]
+        while stack:
+            node, parent = stack.pop()
+            i = arena._add_node(node.type, parent)
+            fields = node.get_fields()
+            extra = {
+                name: getattr(node, name)
+                for name in fields
+                if name not in _STRUCTURAL_FIELDS
+            }
+            if extra:
+                arena.extra_id[i] = len(arena.extras)
+                arena.extras.append(extra)
+            attrs = getattr(node, "attrs", OPT)
+            if attrs is not OPT:
+                key = (type(attrs), repr(attrs))
+                arena._set_attrs(i, key, lambda: attrs)
+            marks = getattr(node, "marks", OPT)
+            if marks is not OPT:
+                key = repr(marks)
+                arena._set_mark_set(i, key, lambda: tuple(marks))
+            text = getattr(node, "text", OPT)
+            if text is not OPT:
+                arena._set_text(i, text)
+            content = getattr(node, "content", OPT)
+            if content is not OPT:
+                arena.flags[i] |= HAS_CONTENT
+                # push in reverse order so children are numbered in pre-order
+                for child in reversed(content):
+                    stack.append((child, i))
+        arena._finalize()
+        return arena
+
+    @classmethod
+    def from_dict(cls, dct: T_DATA) -> "ArenaDoc":
+        """
+        Build an arena directly from raw ADF JSON data, without creating
+        intermediate node objects.
+
+        Unimplemented node and mark types are skipped the same way
+        :meth:`~atlas_doc_parser.mark_or_node.BaseNode.from_dict` does.
+        """
+        with doc_scope():
+            arena = cls()
+            stack = [(dct, NONE)]
+            while stack:
+                dct, parent = stack.pop()
+                type_ = dct["type"]
+                try:
+                    klass = NODE_TYPE_TO_CLASS_MAPPING[type_]
+                except KeyError:
+                    if parent == NONE:
+                        raise UnimplementedTypeError(type_, "node")
+                    report_unimplemented_type(type_, "node")
+                    continue
+                i = arena._add_node(type_, parent)
+                fields = klass.get_fields()
+                extra = {
+                    name: dct[name]
+                    for name in fields
+                    if name not in _STRUCTURAL_FIELDS and name in dct
+                }
+                if extra:
+                    arena.extra_id[i] = len(arena.extras)
+                    arena.extras.append(extra)
+                if "attrs" in dct and "attrs" in fields:
+                    attrs_type = fields["attrs"].type
+                    raw_attrs = dct["attrs"]
+                    if hasattr(attrs_type, "from_dict"):
+                        key = (attrs_type, _json_key(raw_attrs))
+                        arena._set_attrs(i, key, lambda: attrs_type.from_dict(raw_attrs))
+                    else:  # pragma: no cover
+                        key = (type(raw_attrs), _json_key(raw_attrs))
+                        arena._set_attrs(i, key, lambda: raw_attrs)
+                if "marks" in dct and "marks" in fields:
+                    raw_marks = dct["marks"]
+                    arena._set_mark_set(
+                        i,
+                        _json_key(raw_marks),
+                        lambda: cls._parse_marks(raw_marks),
+                    )
+                if "text" in dct and "text" in fields:
+                    arena._set_text(i, dct["text"])
+                if "content" in dct and "content" in fields:
+                    arena.flags[i] |= HAS_CONTENT
+                    for child in reversed(dct["content"]):
+                        stack.append((child, i))
+            arena._finalize()
+            return arena
+
+    @staticmethod
+    def _parse_marks(raw_marks: list[T_DATA]) -> tuple[BaseMark, ...]:
+        marks = []
+        for d in raw_marks:
+            try:
+                marks.append(parse_mark(d))
+            except UnimplementedTypeError as e:
+                report_unimplemented_type(e.type_value, e.category)
+        return tuple(marks)
+
+    # --------------------------------------------------------------------------
+    # Access
+    # --------------------------------------------------------------------------
+    def type_of(self, i: int) -> str:
+        """Get the ADF type string of node ``i``."""
+        return NODE_TYPES[self.types[i]]
+
+    def iter_children(self, i: int) -> T.Iterator[int]:
+        """Iterate the node ids of the children of node ``i``."""
+        child = self.first_child[i]
+        while child != NONE:
+            yield child
+            child = self.next_sibling[child]
+
+    def get_attrs(self, i: int) -> T.Any:
+        """Get the attrs object of node ``i``, ``OPT`` if it has none."""
+        attrs_id = self.attrs_id[i]
+        if attrs_id == NONE:
+            return OPT
+        return self.attrs_table[attrs_id]
+
+    def get_marks(self, i: int) -> T.Union[tuple[BaseMark, ...], T.Literal[OPT]]:
+        """Get the marks of node ``i``, ``OPT`` if it has none."""
+        mark_set_id = self.mark_set[i]
+        if mark_set_id == NONE:
+            return OPT
+        return self.mark_sets[mark_set_id]
+
+    def get_text(self, i: int) -> T.Union[str, T.Literal[OPT]]:
+        """Get the text of text node ``i``, ``OPT`` if it has none."""
+        start = self.text_start[i]
+        if start == NONE:
+            return OPT
+        return self.text[start : self.text_end[i]]
+
+    def to_node(self, i: int = 0) -> "BaseNode":
+        """
+        Materialize node ``i`` (the whole document by default) as node objects.
+        """
+        klass = NODE_TYPE_TO_CLASS_MAPPING[self.type_of(i)]
+        kwargs = {}
+        extra_id = self.extra_id[i]
+        if extra_id != NONE:
+            kwargs.update(self.extras[extra_id])
+        attrs = self.get_attrs(i)
+        if attrs is not OPT:
+            kwargs["attrs"] = attrs
+        marks = self.get_marks(i)
+        if marks is not OPT:
+            kwargs["marks"] = list(marks)
+        text = self.get_text(i)
+        if text is not OPT:
+            kwargs["text"] = text
+        if self.flags[i] & HAS_CONTENT:
+            kwargs["content"] = [self.to_node(c) for c in self.iter_children(i)]
+        return klass(**kwargs)
+
+    # --------------------------------------------------------------------------
+    # Markdown
+    # --------------------------------------------------------------------------
+    def to_markdown(self, ignore_error: bool = False) -> str:
+        """
+        Render the document to Markdown directly from the arrays.
+
+        The output is identical to ``self.to_node().to_markdown()``. Node types
+        without an array based renderer are materialized one subtree at a time
+        and rendered by their node class.
+        """
+        return self._render(0, ignore_error)
+
+    def _render(self, i: int, ignore_error: bool = False, level: int = 0) -> str:
+        type_ = self.types[i]
+        try:
+            renderer = _RENDERERS[type_]
+        except KeyError:
+            return self.to_node(i).to_markdown(ignore_error=ignore_error)
+        return renderer(self, i, ignore_error, level)
+
+    def _apply_marks(self, i: int, md: str) -> str:
+        marks = self.get_marks(i)
+        if marks is not OPT:
+            for mark in marks:
+                md = mark.to_markdown(md)
+        return md
+
+    def _content_to_markdown(self, i: int, ignore_error: bool) -> str:
+        lst = []
+        for child in self.iter_children(i):
+            try:
+                lst.append(self._render(child))
+            except Exception as e:  # pragma: no cover
+                if ignore_error:
+                    pass
+                else:
+                    raise e
+        return "".join(lst)
+
+    def _render_doc(self, i: int, ignore_error: bool, level: int) -> str:
+        lst = []
+        for child in self.iter_children(i):
+            try:
+                if self.types[child] in _PADDED_TYPE_IDS:
+                    md = "\n" + self._render(child) + "\n"
+                else:
+                    md = self._render(child)
+                lst.append(md)
+            except Exception as e:  # pragma: no cover
+                if ignore_error:
+                    pass
+                else:
+                    raise e
+        return strip_double_empty_line("\n".join(lst))
+
+    def _render_text(self, i: int, ignore_error: bool, level: int) -> str:
+        return self._apply_marks(i, self.get_text(i))
+
+    def _render_paragraph(self, i: int, ignore_error: bool, level: int) -> str:
+        md = self._content_to_markdown(i, ignore_error)
+        return self._apply_marks(i, md) + "\n"
+
+    def _render_heading(self, i: int, ignore_error: bool, level: int) -> str:
+        return (
+            "\n\n"
+            + "{} {}".format(
+                "#" * self.get_attrs(i).level,
+                self._content_to_markdown(i, ignore_error),
+            )
+            + "\n\n"
+        )
+
+    def _render_content(self, i: int, ignore_error: bool, level: int) -> str:
+        return self._content_to_markdown(i, ignore_error)
+
+    def _render_hard_break(self, i: int, ignore_error: bool, level: int) -> str:
+        return "  \n"
+
+    def _render_rule(self, i: int, ignore_error: bool, level: int) -> str:
+        return "\n\n---\n\n"
+
+    def _render_mention(self, i: int, ignore_error: bool, level: int) -> str:
+        attrs = self.get_attrs(i)
+        if isinstance(attrs.text, str):
+            return attrs.text
+        else:
+            return "@Unknown"
+
+    def _render_emoji(self, i: int, ignore_error: bool, level: int) -> str:
+        attrs = self.get_attrs(i)
+        if isinstance(attrs.text, str):
+            return attrs.text
+        elif isinstance(attrs.shortName, str):
+            return attrs.shortName
+        else:
+            raise NotImplementedError
+
+    def _render_status(self, i: int, ignore_error: bool, level: int) -> str:
+        return f"`{self.get_attrs(i).text}`"
+
+    def _render_date(self, i: int, ignore_error: bool, level: int) -> str:
+        sec = int(self.get_attrs(i).timestamp) / 1000
+        return str(datetime.fromtimestamp(sec, tz=timezone.utc).date())
+
+    def _render_inline_card(self, i: int, ignore_error: bool, level: int) -> str:
+        url = self.get_attrs(i).url
+        if isinstance(url, str):
+            return f"[{url}]({url})"
+        else:
+            raise NotImplementedError
+
+    def _render_block_card(self, i: int, ignore_error: bool, level: int) -> str:
+        url = self.get_attrs(i).url
+        if isinstance(url, str):
+            return f"\n[{url}]({url})\n"
+        else:
+            raise NotImplementedError
+
+    def _render_code_block(self, i: int, ignore_error: bool, level: int) -> str:
+        code = self._content_to_markdown(i, ignore_error)
+        lang = ""
+        attrs = self.get_attrs(i)
+        if attrs is not OPT:
+            if isinstance(attrs.language, str):
+                lang = ATLASSIAN_LANG_TO_MARKDOWN_LANG_MAPPING.get(
+                    attrs.language,
+                    attrs.language,
+                )
+        if lang == "none":
+            lang = ""
+        return f"```{lang}\n{code}\n```"
+
+    def _render_list(
+        self,
+        i: int,
+        ignore_error: bool,
+        level: int,
+        ordered: bool,
+    ) -> str:
+        lines = []
+        indent = "    " * level
+        list_type_id = self.types[i]
+        if ordered:
+            attrs = self.get_attrs(i)
+            if level == 0 and isinstance(attrs.order, int):
+                current_num = attrs.order
+            else:
+                current_num = 1
+        for item in self.iter_children(i):
+            if self.types[item] != _LIST_ITEM_ID:
+                continue
+            content_lines = []
+            for node in self.iter_children(item):
+                try:
+                    if self.types[node] == list_type_id:
+                        content_lines.append(self._render(node, level=level + 1))
+                    else:
+                        content_lines.append(self._render(node).rstrip())
+                except Exception as e:  # pragma: no cover
+                    if ignore_error:
+                        pass
+                    else:
+                        raise e
+            item_lines = "\n".join(content_lines).split("\n")
+            if ordered:
+                lines.append(f"{indent}{current_num}. {item_lines[0]}")
+                current_num += 1
+            else:
+                lines.append(f"{indent}- {item_lines[0]}")
+            lines.extend(item_lines[1:])
+        return "\n".join(lines)
+
+    def _render_bullet_list(self, i: int, ignore_error: bool, level: int) -> str:
+        return self._render_list(i, ignore_error, level, ordered=False)
+
+    def _render_ordered_list(self, i: int, ignore_error: bool, level: int) -> str:
+        return self._render_list(i, ignore_error, level, ordered=True)
+
+    def _render_task_list(self, i: int, ignore_error: bool, level: int) -> str:
+        lines = []
+        indent = "    " * level
+        for item in self.iter_children(i):
+            item_type = self.types[item]
+            if item_type == _TASK_ITEM_ID:
+                content_parts = []
+                for node in self.iter_children(item):
+                    try:
+                        content_parts.append(self._render(node))
+                    except Exception as e:  # pragma: no cover
+                        if ignore_error:
+                            pass
+                        else:
+                            raise e
+                item_content = "".join(content_parts).rstrip()
+                state = self.get_attrs(item).state
+                checkbox = "[x]" if state == "DONE" else "[ ]"
+                lines.append(f"{indent}- {checkbox} {item_content}")
+            elif item_type == _TASK_LIST_ID:
+                try:
+                    lines.append(self._render(item, ignore_error, level + 1))
+                except Exception as e:  # pragma: no cover
+                    if ignore_error:
+                        pass
+                    else:
+                        raise e
+        return "\n".join(lines)
+
+    def _render_table(self, i: int, ignore_error: bool, level: int) -> str:
+        cells = [list(self.iter_children(row)) for row in self.iter_children(i)]
+        types = self.types
+        grid = TableGrid.from_rows(cells, self._cell_spans)
+        header = bool(cells) and any(
+            types[cell] == _TABLE_HEADER_ID for cell in cells[0]
+        )
+        return grid.to_markdown(
+            render_cell=lambda cell: self._render(cell, ignore_error),
+            header=header,
+            ignore_error=ignore_error,
+        )
+
+    def _cell_spans(self, i: int) -> tuple[int, int]:
+        return attrs_cell_spans(self.get_attrs(i))
+
+    def _render_table_row(self, i: int, ignore_error: bool, level: int) -> str:
+        cells = [self._render(cell, ignore_error) for cell in self.iter_children(i)]
+        return "| " + " | ".join(cells) + " |"
+
+    def _render_table_cell(self, i: int, ignore_error: bool, level: int) -> str:
+        return escape_table_cell(self._content_to_markdown(i, ignore_error))
+
+
+_LIST_ITEM_ID = NODE_TYPE_ID[TypeEnum.listItem.value]
+_TASK_ITEM_ID = NODE_TYPE_ID[TypeEnum.taskItem.value]
+_TASK_LIST_ID = NODE_TYPE_ID[TypeEnum.taskList.value]
+_TABLE_HEADER_ID = NODE_TYPE_ID[TypeEnum.tableHeader.value]
+_PADDED_TYPE_IDS = {
+    NODE_TYPE_ID[TypeEnum.bulletList.value],
+    NODE_TYPE_ID[TypeEnum.orderedList.value],
+    NODE_TYPE_ID[TypeEnum.codeBlock.value],
+}
+
+_RENDERERS: dict[int, T.Callable[[ArenaDoc, int, bool, int], str]] = {
+    NODE_TYPE_ID[type_.value]: renderer
+    for type_, renderer in [
+        (TypeEnum.doc, ArenaDoc._render_doc),
+        (TypeEnum.text, ArenaDoc._render_text),
+        (TypeEnum.paragraph, ArenaDoc._render_paragraph),
+        (TypeEnum.heading, ArenaDoc._render_heading),
+        (TypeEnum.listItem, ArenaDoc._render_content),
+        (TypeEnum.taskItem, ArenaDoc._render_content),
+        (TypeEnum.mediaSingle, ArenaDoc._render_content),
+        (TypeEnum.hardBreak, ArenaDoc._render_hard_break),
+        (TypeEnum.rule, ArenaDoc._render_rule),
+        (TypeEnum.mention, ArenaDoc._render_mention),
+        (TypeEnum.emoji, ArenaDoc._render_emoji),
+        (TypeEnum.status, ArenaDoc._render_status),
+        (TypeEnum.date, ArenaDoc._render_date),
+        (TypeEnum.inlineCard, ArenaDoc._render_inline_card),
+        (TypeEnum.blockCard, ArenaDoc._render_block_card),
+        (TypeEnum.codeBlock, ArenaDoc._render_code_block),
+        (TypeEnum.bulletList, ArenaDoc._render_bullet_list),
+        (TypeEnum.orderedList, ArenaDoc._render_ordered_list),
+        (TypeEnum.taskList, ArenaDoc._render_task_list),
+        (TypeEnum.table, ArenaDoc._render_table),
+        (TypeEnum.tableRow, ArenaDoc._render_table_row),
+        (TypeEnum.tableCell, ArenaDoc._render_table_cell),
+        (TypeEnum.tableHeader, ArenaDoc._render_table_cell),
+    ]
+}
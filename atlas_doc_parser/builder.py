@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+"""
+Build large ADF documents programmatically, as raw dicts.
+
+Building a 10k row table through the node constructors creates five objects
+per cell, and ``to_dict()`` walks them all again to get the JSON payload.
+The functions of this module build the raw ADF dicts directly, with plain
+dict literals, no node objects and no per-instance checks: the input is
+trusted, the output is valid ADF as long as the arguments have the
+documented types. This is one to two orders of magnitude faster than the
+object path, see ``tests_load/test_builder.py``.
+
+When node objects are needed, e.g. to render Markdown, parse the result with
+:func:`~atlas_doc_parser.validator.parse_trusted`.
+
+Example::
+
+    from atlas_doc_parser import builder
+
+    data = builder.doc(
+        [
+            builder.heading("Status", level=2),
+            builder.table_from_rows(
+                ([row.name, row.owner, row.status] for row in rows),
+                header=["Name", "Owner", "Status"],
+            ),
+            *builder.paragraphs(notes),
+        ]
+    )
+    payload = builder.to_json(data)
+"""
+
+import typing as T
+import json
+
+from .type_hint import T_DATA
+from .type_enum import TypeEnum
+
+_TEXT = TypeEnum.text.value
+_PARAGRAPH = TypeEnum.paragraph.value
+_HEADING = TypeEnum.heading.value
+_TABLE = TypeEnum.table.value
+_TABLE_ROW = TypeEnum.tableRow.value
+_TABLE_CELL = TypeEnum.tableCell.value
+_TABLE_HEADER = TypeEnum.tableHeader.value
+_BULLET_LIST = TypeEnum.bulletList.value
+_LIST_ITEM = TypeEnum.listItem.value
+_DOC = TypeEnum.doc.value
+
+
+def _to_str(value: T.Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    return str(value)
+
+
+def text(
+    value: str,
+    marks: T.Optional[list[T_DATA]] = None,
+) -> T_DATA:
+    """
+    A ``text`` node.
+
+    :param value: The text, must not be empty.
+    :param marks: Raw mark dicts, e.g. ``[{"type": "strong"}]``.
+    """
+    if marks:
+        return {"type": _TEXT, "text": value, "marks": marks}
+    return {"type": _TEXT, "text": value}
+
+
+def paragraph(
+    value: T.Any = None,
+    marks: T.Optional[list[T_DATA]] = None,
+) -> T_DATA:
+    """
+    A ``paragraph`` node with one text node, ``value`` is converted with
+    ``str()``. ADF doesn't allow empty text nodes, an empty value or ``None``
+    gives an empty paragraph.
+    """
+    value = _to_str(value)
+    if not value:
+        return {"type": _PARAGRAPH, "content": []}
+    return {"type": _PARAGRAPH, "content": [text(value, marks)]}
+
+
+def paragraphs(values: T.Iterable[T.Any]) -> list[T_DATA]:
+    """
+    A ``paragraph`` node per value, see :func:`paragraph`.
+    """
+    results = []
+    for value in values:
+        value = _to_str(value)
+        if value:
+            content = [{"type": _TEXT, "text": value}]
+        else:
+            content = []
+        results.append({"type": _PARAGRAPH, "content": content})
+    return results
+
+
+def heading(value: T.Any, level: int = 1) -> T_DATA:
+    """
+    A ``heading`` node, ``level`` is 1 to 6.
+    """
+    value = _to_str(value)
+    content = [{"type": _TEXT, "text": value}] if value else []
+    return {"type": _HEADING, "attrs": {"level": level}, "content": content}
+
+
+def bullet_list(values: T.Iterable[T.Any]) -> T_DATA:
+    """
+    A ``bulletList`` node with one item, holding one paragraph, per value.
+    """
+    return {
+        "type": _BULLET_LIST,
+        "content": [
+            {"type": _LIST_ITEM, "content": [para]}
+            for para in paragraphs(values)
+        ],
+    }
+
+
+def _row(values: T.Iterable[T.Any], cell_type: str) -> T_DATA:
+    cells = []
+    for value in values:
+        value = _to_str(value)
+        if value:
+            content = [{"type": _TEXT, "text": value}]
+        else:
+            content = []
+        cells.append(
+            {
+                "type": cell_type,
+                "content": [{"type": _PARAGRAPH, "content": content}],
+            }
+        )
+    return {"type": _TABLE_ROW, "content": cells}
+
+
+def table_from_rows(
+    rows: T.Iterable[T.Iterable[T.Any]],
+    header: T.Optional[T.Iterable[T.Any]] = None,
+) -> T_DATA:
+    """
+    A ``table`` node from rows of values, each value is one cell with one
+    paragraph, see :func:`paragraph`.
+
+    :param rows: The values of each row, it can be a generator.
+    :param header: The values of the header row, made of ``tableHeader``
+        cells.
+    """
+    content = []
+    if header is not None:
+        content.append(_row(header, _TABLE_HEADER))
+    for values in rows:
+        content.append(_row(values, _TABLE_CELL))
+    return {"type": _TABLE, "content": content}
+
+
+def doc(content: list[T_DATA]) -> T_DATA:
+    """
+    The root ``doc`` node.
+    """
+    return {"type": _DOC, "version": 1, "content": content}
+
+
+def to_json(data: T_DATA) -> str:
+    """
+    Serialize raw ADF to compact JSON, the form expected by the Jira and
+    Confluence REST APIs.
+    """
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+
+"""
+Persistent, content-addressed cache for ADF to Markdown conversion.
+
+Batch jobs often re-convert the same documents again and again while only a
+small fraction of them actually changed. :class:`ConversionCache` stores the
+Markdown output of ``NodeDoc.from_dict(data).to_markdown()`` in a local SQLite
+file, keyed by a hash of:
+
+- the canonical JSON form of the ADF document (key order and whitespace
+  independent),
+- the ``atlas_doc_parser`` version (a new release may render differently),
+- the render options (e.g. ``ignore_error``).
+
+Unchanged documents are served from the cache without parsing them at all.
+
+Example::
+
+    from atlas_doc_parser.cache import ConversionCache
+
+    with ConversionCache(path="/tmp/adf-cache.sqlite") as cache:
+        for data in iter_pages():
+            md = cache.convert(data)
+        print(cache.stats)
+"""
+
+import typing as T
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+import dataclasses
+from pathlib import Path
+
+from ._version import __version__
+from .type_hint import T_DATA
+from .nodes.node_doc import NodeDoc
+
+
+def make_cache_key(
+    data: T_DATA,
+    ignore_error: bool = False,
+) -> str:
+    """
+    Compute the content-addressed cache key of an ADF document.
+
+    :param data: The raw ADF document (the ``json.loads`` output).
+    :param ignore_error: The render option that will be passed to
+        ``to_markdown()``. Different options produce different keys.
+    :return: A hex encoded sha256 digest.
+    """
+    canonical = json.dumps(
+        data,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    options = json.dumps({"ignore_error": ignore_error}, sort_keys=True)
+    h = hashlib.sha256()
+    h.update(__version__.encode("utf-8"))
+    h.update(b"\x00")
+    h.update(options.encode("utf-8"))
+    h.update(b"\x00")
+    h.update(canonical.encode("utf-8"))
+    return h.hexdigest()
+
+
+@dataclasses.dataclass
+class CacheStats:
+    """
+    Hit / miss statistics of a :class:`ConversionCache` instance.
+
+    :param hits: Number of lookups served from the cache.
+    :param misses: Number of lookups that required a conversion.
+    :param evictions: Number of entries removed by size based eviction.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+    def to_dict(self) -> dict[str, T.Union[int, float]]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+
+class ConversionCache:
+    """
+    SQLite backed cache of ADF to Markdown conversion results.
+
+    Entries are evicted in least-recently-used order once the total size of
+    the stored Markdown exceeds ``max_size`` bytes. The total size is kept
+    in memory and only re-read from the database when it is over budget.
+    A cache hit doesn't write to the database, the access times are kept in
+    memory and written by the next :meth:`set`, :meth:`flush` or
+    :meth:`close`.
+
+    :param path: Path of the SQLite database file. Use ``":memory:"`` for a
+        process-local cache.
+    :param max_size: Maximum total size in bytes (UTF-8 encoded Markdown) of
+        all cached entries.
+    """
+
+    def __init__(
+        self,
+        path: T.Union[str, Path] = ":memory:",
+        max_size: int = 512 * 1024 * 1024,
+    ):
+        self.path = str(path)
+        self.max_size = max_size
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, "
+            "markdown TEXT NOT NULL, "
+            "size INTEGER NOT NULL, "
+            "last_access REAL NOT NULL"
+            ")"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_entries_last_access "
+            "ON entries (last_access)"
+        )
+        self._conn.commit()
+        # running total of the size column, the file may already have entries
+        self._size = self._get_size()
+        # key -> last access time, not written yet
+        self._pending_access: dict[str, float] = {}
+
+    def __enter__(self) -> "ConversionCache":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (n,) = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+        return n
+
+    def close(self):
+        """Write the pending access times and close the SQLite connection."""
+        self.flush()
+        self._conn.close()
+
+    def flush(self):
+        """
+        Write the access times of the cache hits since the last write.
+        """
+        with self._lock:
+            self._flush_access()
+            self._conn.commit()
+
+    def _flush_access(self):
+        """
+        Must be called with the lock held.
+        """
+        if self._pending_access:
+            self._conn.executemany(
+                "UPDATE entries SET last_access = ? WHERE key = ?",
+                [(t, key) for key, t in self._pending_access.items()],
+            )
+            self._pending_access.clear()
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of all cached Markdown."""
+        with self._lock:
+            return self._get_size()
+
+    def _get_size(self) -> int:
+        (size,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        return size
+
+    def get(self, key: str) -> T.Optional[str]:
+        """
+        Get the cached Markdown for ``key``, or ``None`` if it is not cached.
+
+        This method does not update :attr:`stats`.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT markdown FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._pending_access[key] = time.time()
+        return row[0]
+
+    def set(self, key: str, markdown: str):
+        """
+        Store the Markdown for ``key`` and evict old entries if needed.
+        """
+        size = len(markdown.encode("utf-8"))
+        with self._lock:
+            self._pending_access.pop(key, None)
+            row = self._conn.execute(
+                "SELECT size FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, markdown, size, last_access) "
+                "VALUES (?, ?, ?, ?)",
+                (key, markdown, size, time.time()),
+            )
+            self._size += size - (row[0] if row else 0)
+            self._flush_access()
+            if self._size > self.max_size:
+                self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """
+        Remove the least recently used entries until the total size fits
+        into :attr:`max_size`. Must be called with the lock held.
+        """
+        # another connection may have changed the file, re-read the total
+        total = self._get_size()
+        if total <= self.max_size:
+            self._size = total
+            return
+        cursor = self._conn.execute(
+            "SELECT key, size FROM entries ORDER BY last_access ASC, rowid ASC"
+        )
+        to_delete = []
+        for key, size in cursor:
+            if total <= self.max_size:
+                break
+            to_delete.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", to_delete)
+        self._size = total
+        self.stats.evictions += len(to_delete)
+
+    def clear(self):
+        """Remove all cached entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+            self._size = 0
+            self._pending_access.clear()
+
+    def convert(
+        self,
+        data: T_DATA,
+        ignore_error: bool = False,
+    ) -> str:
+        """
+        Convert an ADF document to Markdown, serving unchanged documents
+        from the cache.
+
+        :param data: The raw ADF document (the ``json.loads`` output).
+        :param ignore_error: Passed to :meth:`NodeDoc.to_markdown`.
+        :return: The Markdown text.
+        """
+        key = make_cache_key(data, ignore_error=ignore_error)
+        md = self.get(key)
+        if md is not None:
+            with self._lock:
+                self.stats.hits += 1
+            return md
+        with self._lock:
+            self.stats.misses += 1
+        md = NodeDoc.from_dict(data).to_markdown(ignore_error=ignore_error)
+        self.set(key, md)
+        return md
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+"""
+The ADF content model, read from the node and mark dataclasses.
+
+The dataclasses were generated from the ADF JSON schema (see
+``scripts/s01-adf-json-schema-analysis``), their annotations carry the
+content model of the schema:
+
+- the allowed children of a node are the types of its ``content`` field,
+- the allowed marks of a node are the types of its ``marks`` field,
+- the attributes are the fields of its ``attrs`` dataclass,
+- a field without default, or with the ``REQ`` default, is required.
+
+:func:`build_specs` turns them into one flat :class:`TypeSpec` per
+implemented type, so tools like the synthetic document generator and the
+validator don't have to inspect annotations at runtime.
+"""
+
+import typing as T
+import dataclasses
+
+from func_args.api import REQ
+
+from .nodes.parse_node import NODE_TYPE_TO_CLASS_MAPPING
+from .marks.parse_mark import MARK_TYPE_TO_CLASS_MAPPING
+
+T_FIELD_SPEC = tuple[str, T.Any, bool]  # (name, annotation, required)
+
+# fields with dedicated handling, the other fields of a node or mark
+# dataclass are plain values, e.g. ``text`` of ``text``
+_STRUCTURE_FIELDS = {"type", "attrs", "content", "marks"}
+
+
+def is_required(field: dataclasses.Field) -> bool:
+    """
+    Whether the dataclass field must be given.
+    """
+    if field.default is REQ or field.default_factory is REQ:
+        return True
+    return (
+        field.default is dataclasses.MISSING
+        and field.default_factory is dataclasses.MISSING
+    )
+
+
+def is_scalar(annotation: T.Any) -> bool:
+    """
+    Whether the annotation is a JSON scalar type or a ``Literal``.
+    """
+    return annotation in (str, int, float, bool) or T.get_origin(annotation) is T.Literal
+
+
+def type_names(annotation: T.Any) -> list[str]:
+    """
+    Extract the class names from ``list[T.Union['NodeA', 'NodeB']]``.
+    """
+    args = T.get_args(annotation)
+    if not args:
+        return []
+    inner = args[0]
+    if T.get_origin(inner) is T.Union:
+        members = T.get_args(inner)
+    else:
+        members = (inner,)
+    names = []
+    for member in members:
+        if isinstance(member, T.ForwardRef):
+            names.append(member.__forward_arg__)
+        elif isinstance(member, str):
+            names.append(member)
+        elif isinstance(member, type):
+            names.append(member.__name__)
+    return names
+
+
+@dataclasses.dataclass(frozen=True)
+class TypeSpec:
+    """
+    The content model of one node or mark type.
+
+    :param type: The ADF type string.
+    :param category: Either ``"node"`` or ``"mark"``.
+    :param klass: The node or mark class.
+    :param fields: Plain value fields, e.g. ``text`` of ``text``.
+    :param children: Allowed child node types, in schema order.
+    :param content_required: Whether the ``content`` field is required.
+    :param marks: Allowed mark types.
+    :param attrs_class: The ``attrs`` dataclass, if any.
+    :param attrs: The attributes.
+    :param attrs_required: Whether the ``attrs`` field is required.
+    """
+
+    type: str
+    category: str
+    klass: type
+    fields: tuple[T_FIELD_SPEC, ...]
+    children: tuple[str, ...]
+    content_required: bool
+    marks: tuple[str, ...]
+    attrs_class: T.Optional[type]
+    attrs: tuple[T_FIELD_SPEC, ...]
+    attrs_required: bool
+
+    @property
+    def is_container(self) -> bool:
+        return bool(self.children)
+
+
+def _field_specs(fields: T.Iterable[dataclasses.Field]) -> tuple[T_FIELD_SPEC, ...]:
+    return tuple((field.name, field.type, is_required(field)) for field in fields)
+
+
+def _build_spec(
+    type_value: str,
+    category: str,
+    klass: type,
+    class_to_type: dict[str, str],
+) -> TypeSpec:
+    fields = {field.name: field for field in dataclasses.fields(klass)}
+    children, content_required = (), False
+    if "content" in fields:
+        children = tuple(
+            class_to_type[name]
+            for name in type_names(fields["content"].type)
+            if name in class_to_type
+        )
+        content_required = is_required(fields["content"])
+    marks = ()
+    if "marks" in fields:
+        marks = tuple(
+            class_to_type[name]
+            for name in type_names(fields["marks"].type)
+            if name in class_to_type
+        )
+    attrs_class, attrs, attrs_required = None, (), False
+    if "attrs" in fields:
+        attrs_required = is_required(fields["attrs"])
+        if dataclasses.is_dataclass(fields["attrs"].type):
+            attrs_class = fields["attrs"].type
+            attrs = _field_specs(dataclasses.fields(attrs_class))
+    return TypeSpec(
+        type=type_value,
+        category=category,
+        klass=klass,
+        fields=_field_specs(
+            field for name, field in fields.items() if name not in _STRUCTURE_FIELDS
+        ),
+        children=children,
+        content_required=content_required,
+        marks=marks,
+        attrs_class=attrs_class,
+        attrs=attrs,
+        attrs_required=attrs_required,
+    )
+
+
+def build_specs() -> dict[str, TypeSpec]:
+    """
+    Build the :class:`TypeSpec` of all implemented node and mark types.
+    """
+    mappings = [
+        ("node", NODE_TYPE_TO_CLASS_MAPPING),
+        ("mark", MARK_TYPE_TO_CLASS_MAPPING),
+    ]
+    class_to_type = {
+        klass.__name__: type_value
+        for _, mapping in mappings
+        for type_value, klass in mapping.items()
+    }
+    return {
+        type_value: _build_spec(type_value, category, klass, class_to_type)
+        for category, mapping in mappings
+        for type_value, klass in mapping.items()
+    }
@@ -33,8 +33,32 @@ class UnimplementedTypeError(Exception):
     def __init__(self, type_value: str, category: str):
         self.type_value = type_value
         self.category = category
-        super().__init__(
-            f"{category.capitalize()} type '{type_value}' is not yet implemented. "
+        # The message is formatted lazily in ``__str__``, this exception is
+        # raised and caught for every skipped element while parsing.
+        super().__init__(type_value, category)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.category.capitalize()} type '{self.type_value}' is not yet implemented. "
             f"Please submit an issue at https://github.com/MacHu-GWU/atlas_doc_parser-project/issues "
             f"with this type name so it can be added in a future release."
         )
+
+
+class ValidationError(ValueError):
+    """
+    Raised when raw ADF data doesn't pass the validation.
+
+    Attributes:
+        issues: The list of :class:`~atlas_doc_parser.validator.ValidationIssue`.
+    """
+
+    def __init__(self, issues: list):
+        self.issues = issues
+        super().__init__(issues)
+
+    def __str__(self) -> str:
+        lines = [str(issue) for issue in self.issues[:10]]
+        if len(self.issues) > 10:
+            lines.append(f"... and {len(self.issues) - 10} more")
+        return f"{len(self.issues)} validation issue(s):\n" + "\n".join(lines)
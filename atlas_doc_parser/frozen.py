@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+"""
+Immutable, hashable ``list`` and ``dict`` for the containers held by nodes.
+
+The nodes and marks are frozen dataclasses, but their ``content`` and
+``marks`` are lists, and some attributes hold lists or dicts (``colwidth``,
+``parameters``, ...), so a node couldn't be hashed, put in a set or used as a
+memoization key. Every container stored in a node is converted on creation:
+
+- :class:`FrozenList` is a ``list`` subclass, :class:`FrozenDict` a ``dict``
+  subclass, they compare equal to plain lists and dicts and pass
+  ``isinstance(value, list)``, code reading the nodes is unchanged,
+- the mutating methods raise ``TypeError``,
+- the hash is computed once and cached, hashing a node costs its fields
+  only, the hashes of its children are already cached.
+
+``to_dict()`` returns plain lists and dicts, the output is unchanged, and
+``from_dict()`` accepts the same input.
+
+Example::
+
+    doc = NodeDoc.from_dict(data)
+    unique_blocks = set(doc.content)
+
+    @functools.lru_cache(maxsize=10_000)
+    def render(node):
+        return node.to_markdown()
+"""
+
+import typing as T
+
+
+def _immutable(self, *args, **kwargs):
+    raise TypeError(f"{self.__class__.__name__} is immutable")
+
+
+class FrozenList(list):
+    """
+    An immutable ``list`` with a cached hash.
+    """
+
+    __slots__ = ("_hash",)
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(tuple(self))
+            return self._hash
+
+    def __reduce__(self):
+        # pickle and deepcopy would rebuild it with ``append()``
+        return self.__class__, (list(self),)
+
+    def __copy__(self) -> "FrozenList":
+        return self
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list.__repr__(self)})"
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    __iadd__ = _immutable
+    __imul__ = _immutable
+    append = _immutable
+    extend = _immutable
+    insert = _immutable
+    pop = _immutable
+    remove = _immutable
+    clear = _immutable
+    sort = _immutable
+    reverse = _immutable
+
+
+class FrozenDict(dict):
+    """
+    An immutable ``dict`` with a cached hash.
+    """
+
+    __slots__ = ("_hash",)
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(frozenset(self.items()))
+            return self._hash
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict.__repr__(self)})"
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    __ior__ = _immutable
+    pop = _immutable
+    popitem = _immutable
+    setdefault = _immutable
+    update = _immutable
+    clear = _immutable
+
+
+def freeze(value: T.Any) -> T.Any:
+    """
+    Convert the lists and dicts in the value to :class:`FrozenList` and
+    :class:`FrozenDict`, recursively. Nodes, marks and scalars are returned
+    as is.
+    """
+    cls = value.__class__
+    if cls is list:
+        return FrozenList([freeze(v) for v in value])
+    if cls is dict:
+        return FrozenDict({k: freeze(v) for k, v in value.items()})
+    return value
+
+
+def thaw(value: T.Any) -> T.Any:
+    """
+    Convert the :class:`FrozenList` and :class:`FrozenDict` in the value back
+    to plain lists and dicts, recursively.
+    """
+    if isinstance(value, list):
+        return [thaw(v) for v in value]
+    if isinstance(value, dict):
+        return {k: thaw(v) for k, v in value.items()}
+    return value
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+
+"""
+Extract the outgoing edges of ADF documents: links, smart cards, mentions and
+media references.
+
+One traversal of the tree collects every reference listed in
+:data:`NODE_TARGETS` and :data:`MARK_TARGETS`, e.g. the ``href`` of a
+``link`` mark, the ``url`` of an ``inlineCard``, the ``id`` of a ``mention``.
+It works on node objects and on raw dicts, and yields an :class:`Edge` per
+reference, with the JMESPath of the source node.
+
+The path of a node is only built when the node has an edge, the traversal
+itself is as cheap as counting the nodes.
+
+The paths index the parsed tree. The parser drops the node and mark types
+it doesn't implement, so a raw dict is read the same way: an unimplemented
+node is skipped with its subtree, and unimplemented nodes and marks are not
+counted in the indexes. A raw dict and ``NodeDoc.from_dict()`` of it give
+the same edges, and a path can be passed to ``get_at()`` of the parsed
+node. In the source JSON, an index shifts after a dropped sibling.
+
+Example::
+
+    from atlas_doc_parser.links import extract_edges, collect_edges
+
+    for edge in extract_edges(NodeDoc.from_dict(data)):
+        print(edge.type, edge.attr, edge.target, edge.path)
+        # link href https://example.com content[0].content[1].marks[0]
+
+    # a deduplicated edge list across many documents
+    edges = collect_edges((page_id, data) for page_id, data in pages)
+"""
+
+import typing as T
+import dataclasses
+
+from .type_enum import TypeEnum
+from .marks.parse_mark import MARK_TYPE_TO_CLASS_MAPPING
+from .nodes.parse_node import NODE_TYPE_TO_CLASS_MAPPING
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from .mark_or_node import T_NODE
+    from .type_hint import T_DATA
+
+#: node type -> the attributes that reference something outside the document
+NODE_TARGETS: dict[str, tuple[str, ...]] = {
+    TypeEnum.inlineCard.value: ("url",),
+    TypeEnum.blockCard.value: ("url",),
+    TypeEnum.embedCard.value: ("url",),
+    TypeEnum.mention.value: ("id",),
+    TypeEnum.media.value: ("id", "url"),
+    TypeEnum.mediaInline.value: ("id",),
+}
+
+#: mark type -> the attributes that reference something outside the document
+MARK_TARGETS: dict[str, tuple[str, ...]] = {
+    TypeEnum.link.value: ("href",),
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class Edge:
+    """
+    One outgoing reference of a document.
+
+    :param type: ADF type of the node or mark holding the reference,
+        e.g. ``"link"``, ``"inlineCard"``, ``"mention"``.
+    :param attr: The attribute holding the reference, e.g. ``"href"``.
+    :param target: The referenced URL, account id or media id.
+    :param path: JMESPath style path of the node or mark from the root of
+        the parsed tree, e.g. ``"content[0].content[1].marks[0]"``, see the
+        module docstring.
+    :param doc_id: The id of the source document, set by
+        :func:`collect_edges`.
+    """
+
+    type: str
+    attr: str
+    target: str
+    path: str
+    doc_id: T.Optional[str] = None
+
+    def to_dict(self) -> dict[str, T.Any]:
+        return dataclasses.asdict(self)
+
+
+def _to_path(indexes: list[int]) -> str:
+    if not indexes:
+        return "@"
+    return ".".join([f"content[{i}]" for i in indexes])
+
+
+def _mark_path(indexes: list[int], i: int) -> str:
+    if not indexes:
+        return f"marks[{i}]"
+    return f"{_to_path(indexes)}.marks[{i}]"
+
+
+def _raw_targets(dct: dict, names: tuple[str, ...]) -> T.Iterator[tuple[str, str]]:
+    attrs = dct.get("attrs")
+    if isinstance(attrs, dict):
+        for name in names:
+            value = attrs.get(name)
+            if isinstance(value, str) and value:
+                yield name, value
+
+
+def _node_targets(obj: T.Any, names: tuple[str, ...]) -> T.Iterator[tuple[str, str]]:
+    attrs = getattr(obj, "attrs", None)
+    for name in names:
+        value = getattr(attrs, name, None)
+        # unset values are OPT
+        if isinstance(value, str) and value:
+            yield name, value
+
+
+_END = object()
+
+
+def _extract_raw(root: dict, doc_id: T.Optional[str]) -> T.Iterator[Edge]:
+    node_targets, mark_targets = NODE_TARGETS, MARK_TARGETS
+    # the parser drops the unimplemented types, skip them the same way
+    node_classes, mark_classes = NODE_TYPE_TO_CLASS_MAPPING, MARK_TYPE_TO_CLASS_MAPPING
+    # depth first, iters[k] iterates the siblings at depth k + 1 and
+    # indexes[k] is the index of the current one
+    iters, indexes = [], []
+    node = root
+    while True:
+        type_ = node.get("type")
+        names = node_targets.get(type_)
+        if names is not None:
+            path = _to_path(indexes)
+            for attr, target in _raw_targets(node, names):
+                yield Edge(type_, attr, target, path, doc_id)
+        marks = node.get("marks")
+        if marks:
+            i = -1
+            for mark in marks:
+                mark_type = mark.get("type")
+                if mark_type not in mark_classes:
+                    continue
+                i += 1
+                names = mark_targets.get(mark_type)
+                if names is not None:
+                    path = _mark_path(indexes, i)
+                    for attr, target in _raw_targets(mark, names):
+                        yield Edge(mark_type, attr, target, path, doc_id)
+        content = node.get("content")
+        if content:
+            iters.append(
+                iter([child for child in content if child.get("type") in node_classes])
+            )
+            indexes.append(-1)
+        # move to the next node in document order
+        while iters:
+            node = next(iters[-1], _END)
+            if node is not _END:
+                indexes[-1] += 1
+                break
+            iters.pop()
+            indexes.pop()
+        else:
+            return
+
+
+def _extract_node(root: T.Any, doc_id: T.Optional[str]) -> T.Iterator[Edge]:
+    node_targets, mark_targets = NODE_TARGETS, MARK_TARGETS
+    iters, indexes = [], []
+    node = root
+    while True:
+        type_ = node.type
+        names = node_targets.get(type_)
+        if names is not None:
+            path = _to_path(indexes)
+            for attr, target in _node_targets(node, names):
+                yield Edge(type_, attr, target, path, doc_id)
+        # marks and content are OPT when unset
+        marks = getattr(node, "marks", None)
+        if marks and isinstance(marks, list):
+            for i, mark in enumerate(marks):
+                mark_type = mark.type
+                names = mark_targets.get(mark_type)
+                if names is not None:
+                    path = _mark_path(indexes, i)
+                    for attr, target in _node_targets(mark, names):
+                        yield Edge(mark_type, attr, target, path, doc_id)
+        content = getattr(node, "content", None)
+        if content and isinstance(content, list):
+            iters.append(iter(content))
+            indexes.append(-1)
+        while iters:
+            node = next(iters[-1], _END)
+            if node is not _END:
+                indexes[-1] += 1
+                break
+            iters.pop()
+            indexes.pop()
+        else:
+            return
+
+
+def extract_edges(
+    root: T.Union["T_NODE", "T_DATA"],
+    doc_id: T.Optional[str] = None,
+) -> T.Iterator[Edge]:
+    """
+    Yield the outgoing edges of a document, in document order, in one
+    traversal.
+
+    :param root: A node object, or a raw node dict.
+    :param doc_id: Stored in :attr:`Edge.doc_id`.
+    """
+    if isinstance(root, dict):
+        return _extract_raw(root, doc_id)
+    return _extract_node(root, doc_id)
+
+
+def collect_edges(
+    docs: T.Iterable[tuple[str, T.Union["T_NODE", "T_DATA"]]],
+    dedupe: bool = True,
+) -> list[Edge]:
+    """
+    Extract the edges of many documents.
+
+    :param docs: ``(doc_id, root)`` pairs, ``root`` is a node object or a raw
+        node dict. It can be a generator, the documents are visited once.
+    :param dedupe: If True, keep only the first edge of each
+        ``(doc_id, type, attr, target)``, e.g. a page linking the same URL
+        three times gives one edge.
+    """
+    edges = []
+    seen = set()
+    for doc_id, root in docs:
+        for edge in extract_edges(root, doc_id=doc_id):
+            if dedupe:
+                key = (doc_id, edge.type, edge.attr, edge.target)
+                if key in seen:
+                    continue
+                seen.add(key)
+            edges.append(edge)
+    return edges
@@ -13,6 +13,7 @@ Format (ADF) JSON into Python objects:
 
 import typing as T
 import copy
+import threading
 import dataclasses
 
 from func_args.api import BaseFrozenModel, REQ, OPT, remove_optional
@@ -20,13 +21,16 @@ from func_args.api import BaseFrozenModel, REQ, OPT, remove_optional
 from .type_hint import T_DATA
 from .type_enum import TypeEnum, check_type_match
 from .exc import UnimplementedTypeError
-from .logger import logger
-
-from . import settings
+from .text_helpers import content_to_text
+from .telemetry import report_unimplemented_type
+from .node_path import T_PATH, get_at, replace_at, update_at
+from .interning import intern_object
+from .frozen import freeze, thaw
 
 
 T_FIELDS = dict[str, dataclasses.Field]
 _CLASS_FIELD: dict[T.Any, T_FIELDS] = {}  # class fields cache
+_CLASS_FIELD_LOCK = threading.Lock()  # serialize cache writes
 
 
 @dataclasses.dataclass(frozen=True)
@@ -39,24 +43,40 @@ class Base(BaseFrozenModel):
     - ``to_dict()``: Serialize to dictionary
     """
 
+    def __post_init__(self):
+        super().__post_init__()
+        # lists and dicts become FrozenList / FrozenDict, so the object is
+        # hashable, see :mod:`~atlas_doc_parser.frozen`
+        dct = self.__dict__
+        for name, value in list(dct.items()):
+            cls = value.__class__
+            if cls is list or cls is dict:
+                dct[name] = freeze(value)
+
     @classmethod
     def get_fields(cls) -> T_FIELDS:
         """
         Get the dict view of the ``dataclasses.Field`` in this class.
         It leverages the cache to avoid the overhead of ``dataclasses.fields``
         function call.
+
+        The cache is safe to use from many threads, including on the
+        free-threaded (no-GIL) build: reads don't take a lock, and a complete
+        field dict is published with a single insert under a lock, so a reader
+        never sees a partially built entry.
         """
         try:
             return _CLASS_FIELD[cls]
         except KeyError:
-            _CLASS_FIELD[cls] = {field.name: field for field in dataclasses.fields(cls)}
-            return _CLASS_FIELD[cls]
+            fields = {field.name: field for field in dataclasses.fields(cls)}
+            with _CLASS_FIELD_LOCK:
+                return _CLASS_FIELD.setdefault(cls, fields)
 
     def to_dict(self) -> T_DATA:
         """
         Convert the dataclass to a complete dictionary with all fields.
         """
-        return remove_optional(**dataclasses.asdict(self))
+        return thaw(remove_optional(**dataclasses.asdict(self)))
 
     def to_kwargs(self) -> T_DATA:
         """
@@ -85,7 +105,8 @@ class Base(BaseFrozenModel):
                 kwargs[field_name] = dct[field_name]
             except KeyError:
                 pass
-        return cls(**kwargs)
+        # a no-op unless inside ``interning()``
+        return intern_object(cls(**kwargs))
 
     def is_opt(self, value: T.Any) -> bool:
         return value is OPT
@@ -199,6 +220,9 @@ class BaseMark(BaseMarkOrNode):
 T_MARK = T.TypeVar("T_MARK", bound=BaseMark)
 
 
+_SERIALIZED_FIELDS = {"attrs", "content", "marks"}
+
+
 # =============================================================================
 # BaseNode Class
 # =============================================================================
@@ -216,7 +240,7 @@ class BaseNode(BaseMarkOrNode):
     - ``content``: Child nodes (for container nodes)
     - ``marks``: Text formatting (for inline nodes)
 
-    Subclasses should override ``to_markdown()`` to provide format conversion.
+    ``to_markdown()`` renders with :data:`~atlas_doc_parser.renderer.DEFAULT_RENDERER`.
     """
 
     @classmethod
@@ -232,8 +256,9 @@ class BaseNode(BaseMarkOrNode):
         - ``content``: Using ``parse_node()`` for each child
         - ``marks``: Using ``parse_mark()`` for each mark
 
-        Unimplemented node/mark types are gracefully skipped with an optional
-        warning (controlled by ``settings.WARN_UNIMPLEMENTED_TYPE``).
+        Unimplemented node/mark types are gracefully skipped and reported to
+        :mod:`~atlas_doc_parser.telemetry`, which logs one warning per type
+        (controlled by :func:`~atlas_doc_parser.settings.is_warn_unimplemented_type`).
         Other parsing errors are propagated normally.
         """
         from .marks.parse_mark import parse_mark
@@ -259,8 +284,7 @@ class BaseNode(BaseMarkOrNode):
                         new_content.append(content)
                     except UnimplementedTypeError as e:
                         # Skip unimplemented node types gracefully
-                        if settings.WARN_UNIMPLEMENTED_TYPE:
-                            logger.warning(str(e))
+                        report_unimplemented_type(e.type_value, e.category)
                         # Skip this node and continue
                     # Other exceptions propagate normally
                 dct["content"] = new_content
@@ -275,8 +299,7 @@ class BaseNode(BaseMarkOrNode):
                         new_marks.append(mark)
                     except UnimplementedTypeError as e:
                         # Skip unimplemented mark types gracefully
-                        if settings.WARN_UNIMPLEMENTED_TYPE:
-                            logger.warning(str(e))
+                        report_unimplemented_type(e.type_value, e.category)
                         # Skip this mark and continue
                     # Other exceptions propagate normally
                 dct["marks"] = new_marks
@@ -301,42 +324,95 @@ class BaseNode(BaseMarkOrNode):
         if "marks" in data and data["marks"] is not OPT:
             data["marks"] = [m.to_dict() for m in self.marks]
 
+        # Other containers are FrozenList / FrozenDict
+        for key, value in data.items():
+            if key not in _SERIALIZED_FIELDS and isinstance(value, (list, dict)):
+                data[key] = thaw(value)
+
         return remove_optional(**data)
 
     def to_markdown(self, ignore_error: bool = False) -> str:
         """
         Convert this node to Markdown format.
 
-        The default implementation raises ``NotImplementedError``. This is
-        intentional for several reasons:
+        The Markdown rules of all node types are the handlers of
+        :mod:`~atlas_doc_parser.renderer`, this method renders with
+        :data:`~atlas_doc_parser.renderer.DEFAULT_RENDERER`. To change the
+        output of some node types, create a
+        :class:`~atlas_doc_parser.renderer.MarkdownRenderer` with other
+        handlers instead of overriding this method.
+
+        The error handling is explicit. By default a node that fails to
+        convert raises, to discover the bugs and the partially implemented
+        node types early. In production, ``ignore_error=True`` drops the child
+        nodes that fail to convert and keeps the rest, see
+        :func:`~atlas_doc_parser.render_report.to_markdown_with_report` to
+        know what was dropped.
+
+        :param ignore_error: If True, the child nodes that fail to convert are
+            silently skipped. If False (default), errors propagate immediately.
+        :return: The Markdown representation of this node.
+        """
+        from .renderer import DEFAULT_RENDERER
 
-        1. **Fail fast during development.** When implementing new node types,
-           we want to immediately discover which nodes haven't implemented
-           ``to_markdown()`` rather than silently producing empty output or
-           skipping content. This helps catch missing implementations early.
+        return DEFAULT_RENDERER.render(self, ignore_error)
 
-        2. **The ignore_error parameter provides an escape hatch.** In production,
-           if our code has bugs or a node type is partially implemented, users
-           can pass ``ignore_error=True`` to gracefully skip nodes that fail
-           to convert. This flag should be propagated recursively to all nested
-           ``to_markdown()`` calls via helper functions like ``content_to_markdown()``.
+    def extract_text(
+        self,
+        block_sep: str = "\n",
+        cell_sep: str = "\t",
+    ) -> str:
+        """
+        Extract the plain text of this node, without any Markdown syntax.
 
-        3. **Error handling is explicit.** The library user decides whether to
-           fail fast (for debugging and development) or degrade gracefully
-           (for production use cases where partial output is acceptable).
+        This is the fast path for embedding and search pipelines. No mark is
+        applied and no error handling is needed, because it only reads the
+        textual content. Inline child nodes are concatenated, block child nodes
+        are joined by ``block_sep``.
 
-        Subclasses must override this method to provide actual conversion logic.
+        The default implementation extracts the text of ``content`` (if any).
+        Leaf nodes that carry text in their attributes (e.g. mention, emoji,
+        status, cards) override this method.
 
-        :param ignore_error: If True, errors in nested conversions are silently
-            skipped. If False (default), errors propagate immediately. This flag
-            should be passed down to any nested ``to_markdown()`` calls.
-        :return: The Markdown representation of this node.
-        :raises NotImplementedError: Always raised by the base class to ensure
-            subclasses implement this method.
+        :param block_sep: String to join block level content. Default is newline.
+        :param cell_sep: String to join the cells of a table row. Default is tab.
+        :return: The plain text of this node.
         """
-        raise NotImplementedError(
-            f"{self.__class__.__name__} has not implemented ``to_markdown()``"
+        return content_to_text(
+            getattr(self, "content", OPT),
+            block_sep=block_sep,
+            cell_sep=cell_sep,
         )
 
+    def get_at(self, path: T_PATH) -> "BaseMarkOrNode":
+        """
+        Get the descendant node or mark at the path, e.g.
+        ``"content[3].content[0]"``, see :mod:`~atlas_doc_parser.node_path`.
+        """
+        return get_at(self, path)
+
+    def replace_at(
+        self: "T_NODE",
+        path: T_PATH,
+        new: "BaseMarkOrNode",
+    ) -> "T_NODE":
+        """
+        Return a copy of this tree where the node or mark at the path is
+        ``new``. Only the ancestors of the changed node are copied, the
+        untouched subtrees are shared, see :mod:`~atlas_doc_parser.node_path`.
+        """
+        return replace_at(self, path, new)
+
+    def update(
+        self: "T_NODE",
+        path: T_PATH,
+        func: T.Callable[["BaseMarkOrNode"], "BaseMarkOrNode"],
+    ) -> "T_NODE":
+        """
+        Return a copy of this tree where the node or mark at the path is
+        replaced by ``func(old)``, see :meth:`replace_at`.
+        """
+        return update_at(self, path, func)
+
 
 T_NODE = T.TypeVar("T_NODE", bound=BaseNode)
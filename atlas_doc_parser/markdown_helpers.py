@@ -4,8 +4,10 @@
 Markdown Conversion Helper Functions for ADF
 
 This module provides utility functions to convert Atlassian Document Format (ADF)
-nodes and marks into Markdown text. These helpers are used by the mixin classes
-to implement the ``to_markdown()`` method for each ADF element.
+nodes and marks into Markdown text. The node conversions are rendered by
+:data:`~atlas_doc_parser.renderer.DEFAULT_RENDERER`, the same as
+``to_markdown()``, the rules of each ADF element are in
+:mod:`~atlas_doc_parser.renderer`.
 
 Key concepts:
 
@@ -19,8 +21,6 @@ import typing as T
 
 from func_args.api import OPT
 
-from .type_enum import TypeEnum
-
 if T.TYPE_CHECKING:  # pragma: no cover
     from .mark_or_node import T_MARK, T_NODE
 
@@ -63,9 +63,9 @@ def content_to_markdown(
     """
     Recursively convert a node's content (child nodes) to Markdown text.
 
-    This is the core recursive function for ``to_markdown()`` conversion.
-    It iterates through all child nodes in the ``content`` list, calls
-    ``to_markdown()`` on each, and concatenates the results.
+    Each child node in the ``content`` list is rendered by
+    :meth:`~atlas_doc_parser.renderer.MarkdownRenderer.render_children`,
+    and the results are concatenated.
 
     This function is used for **inline content** where child nodes should be
     joined without separators. For example, a paragraph containing multiple
@@ -82,23 +82,11 @@ def content_to_markdown(
 
     Example::
 
-        # In NodeParagraph.to_markdown():
-        md = content_to_markdown(self.content, ignore_error=ignore_error)
+        md = content_to_markdown(paragraph.content, ignore_error=ignore_error)
     """
-    if content is OPT:
-        return ""
-    else:
-        lst = list()
-        for node in content:
-            try:
-                md = node.to_markdown()
-                lst.append(md)
-            except Exception as e:  # pragma: no cover
-                if ignore_error:
-                    pass
-                else:
-                    raise e
-        return concat.join(lst)
+    from .renderer import DEFAULT_RENDERER
+
+    return concat.join(DEFAULT_RENDERER.render_children(content, ignore_error))
 
 
 def doc_content_to_markdown(
@@ -109,8 +97,8 @@ def doc_content_to_markdown(
     """
     Convert document-level (whole Confluence page) content to Markdown text.
 
-    This function is specifically for the ``NodeDoc`` root node - the entire
-    page level. It differs from :func:`content_to_markdown` in that it handles
+    This is how the ``NodeDoc`` root node - the entire page level - is
+    rendered. It differs from :func:`content_to_markdown` in that it handles
     **block-level content** with additional processing:
 
     1. Joins blocks with newlines (not empty string)
@@ -129,40 +117,33 @@ def doc_content_to_markdown(
 
     Example::
 
-        # In NodeDoc.to_markdown():
-        return doc_content_to_markdown(self.content, ignore_error=ignore_error)
+        md = doc_content_to_markdown(doc.content, ignore_error=ignore_error)
     """
     if content is OPT:
         return ""
-    else:
-        lst = list()
-        for node in content:
-            # print("----- Work on a new node -----")  # for debug only
-            try:
-                # Add extra newlines around block elements that need separation
-                if node.is_type_of(
-                    [
-                        TypeEnum.bulletList,
-                        TypeEnum.orderedList,
-                        TypeEnum.codeBlock,
-                    ]
-                ):
-                    md = "\n" + node.to_markdown() + "\n"
-                else:
-                    md = node.to_markdown()
-                # print(f"{node = }")  # for debug only
-                # print(f"{md = }")  # for debug only
-                lst.append(md)
-            except Exception as e:  # pragma: no cover
-                if ignore_error:
-                    pass
-                else:
-                    raise e
-
+    lst = doc_blocks_to_markdown_list(content, ignore_error=ignore_error)
     md = strip_double_empty_line(concat.join(lst))
     return md
 
 
+def doc_blocks_to_markdown_list(
+    content: list["T_NODE"],
+    ignore_error: bool = False,
+) -> list[str]:
+    """
+    Convert each block of a document-level content to Markdown, the blocks
+    that fail with ``ignore_error=True`` are left out.
+
+    This is the part of :func:`doc_content_to_markdown` that works block by
+    block, the blocks can be converted in separate groups and the lists
+    concatenated, joining and :func:`strip_double_empty_line` are applied
+    once to the whole list.
+    """
+    from .renderer import DEFAULT_RENDERER
+
+    return DEFAULT_RENDERER.render_block_list(content, ignore_error)
+
+
 def add_style_to_markdown(
     md: str,
     node: "T_NODE",
@@ -174,8 +155,9 @@ def add_style_to_markdown(
     text formatting like bold, italic, links, text color, etc. A node can have
     multiple marks that should be applied in sequence.
 
-    Each mark's ``to_markdown(text)`` method wraps the text with appropriate
-    Markdown syntax (e.g., ``**text**`` for bold, ``*text*`` for italic).
+    Each mark wraps the text with appropriate Markdown syntax (e.g.,
+    ``**text**`` for bold, ``*text*`` for italic), see
+    :meth:`~atlas_doc_parser.renderer.MarkdownRenderer.apply_marks`.
 
     :param md: The base Markdown text to apply formatting to.
     :param node: The ADF node containing marks to apply. If ``node.marks`` is
@@ -185,19 +167,11 @@ def add_style_to_markdown(
 
     Example::
 
-        # In NodeText.to_markdown():
-        md = self.text
-        md = add_style_to_markdown(md, self)
-        return md
+        md = add_style_to_markdown(text_node.text, text_node)
     """
-    try:
-        if isinstance(node.marks, list):
-            for mark in node.marks:
-                md = mark.to_markdown(md)
-    # some node doesn't have marks attribute (don't support styles)
-    except AttributeError:
-        pass
-    return md
+    from .renderer import DEFAULT_RENDERER
+
+    return DEFAULT_RENDERER.apply_marks(md, node)
 
 
 ATLASSIAN_LANG_TO_MARKDOWN_LANG_MAPPING = {}
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+"""
+Read and edit a node tree by path, without a ``to_dict()`` / ``from_dict()``
+round trip.
+
+The nodes are frozen, an edit returns a new root. Only the nodes on the path
+from the root to the changed node are copied (path copying), every other
+subtree is shared with the old tree, so an edit costs O(depth), plus the
+shallow copy of one ``content`` list per level, whatever the document size.
+The old tree is unchanged and stays valid.
+
+A path is a JMESPath style string, the same as the paths of
+:class:`~atlas_doc_parser.links.Edge` and
+:class:`~atlas_doc_parser.render_report.RenderError`, e.g.
+``"content[3].content[0]"`` or ``"content[0].content[1].marks[0]"``, ``"@"``
+is the root. A sequence of ints is a shortcut for ``content`` indexes,
+``(3, 0)`` is ``"content[3].content[0]"``.
+
+Example::
+
+    doc = NodeDoc.from_dict(data)
+    para = doc.get_at("content[3]")
+    new_doc = doc.replace_at("content[3].content[0]", NodeText(text="hello"))
+    new_doc = doc.update((3,), lambda node: dataclasses.replace(node, marks=[]))
+    assert new_doc.content[4] is doc.content[4]  # shared
+"""
+
+import typing as T
+import re
+import functools
+
+from .exc import ParamError
+from .frozen import freeze
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from .mark_or_node import BaseMarkOrNode
+
+T_PATH = T.Union[str, T.Sequence[int]]
+T_STEP = tuple[str, int]
+
+_RE_STEP = re.compile(r"(content|marks)\[(\d+)\]")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_str(path: str) -> tuple[T_STEP, ...]:
+    if path in ("", "@"):
+        return ()
+    steps = []
+    for part in path.split("."):
+        match = _RE_STEP.fullmatch(part)
+        if match is None:
+            raise ParamError(f"invalid node path {path!r} at {part!r}")
+        steps.append((match.group(1), int(match.group(2))))
+    return tuple(steps)
+
+
+def parse_path(path: T_PATH) -> tuple[T_STEP, ...]:
+    """
+    Parse a path to ``(field, index)`` steps, e.g.
+    ``"content[3].marks[0]"`` -> ``(("content", 3), ("marks", 0))``.
+
+    :raises ParamError: If the path is malformed.
+    """
+    if isinstance(path, str):
+        return _parse_str(path)
+    return tuple(("content", index) for index in path)
+
+
+def _children(node: T.Any, field: str, path: T_PATH) -> list[T.Any]:
+    # an unset content or marks is OPT
+    children = getattr(node, field, None)
+    if not isinstance(children, list):
+        raise ParamError(f"{node.type!r} node has no {field!r} at {path!r}")
+    return children
+
+
+def _resolve(root: T.Any, steps: tuple[T_STEP, ...], path: T_PATH) -> list[T.Any]:
+    """
+    Return the nodes from the root to the target, the root included.
+    """
+    nodes = [root]
+    node = root
+    for field, index in steps:
+        children = _children(node, field, path)
+        try:
+            node = children[index]
+        except IndexError:
+            raise ParamError(f"{field}[{index}] is out of range at {path!r}")
+        nodes.append(node)
+    return nodes
+
+
+def _with_field(node: T.Any, field: str, value: T.Any) -> T.Any:
+    """
+    Copy a frozen node with one field changed, without ``__init__`` and
+    ``__post_init__``, the other fields are shared.
+    """
+    obj = object.__new__(node.__class__)
+    obj.__dict__.update(node.__dict__)
+    obj.__dict__[field] = freeze(value)
+    return obj
+
+
+def get_at(root: "BaseMarkOrNode", path: T_PATH) -> "BaseMarkOrNode":
+    """
+    Get the node or mark at the path.
+
+    :raises ParamError: If the path is malformed or doesn't exist.
+    """
+    return _resolve(root, parse_path(path), path)[-1]
+
+
+def update_at(
+    root: "BaseMarkOrNode",
+    path: T_PATH,
+    func: T.Callable[["BaseMarkOrNode"], "BaseMarkOrNode"],
+) -> "BaseMarkOrNode":
+    """
+    Return a new root, where the node or mark at the path is replaced by
+    ``func(old)``. Only the ancestors of the changed node are copied.
+
+    :raises ParamError: If the path is malformed or doesn't exist.
+    """
+    steps = parse_path(path)
+    nodes = _resolve(root, steps, path)
+    new = func(nodes[-1])
+    # rebuild the ancestors, bottom up
+    for (field, index), parent in zip(reversed(steps), reversed(nodes[:-1])):
+        children = list(getattr(parent, field))
+        children[index] = new
+        new = _with_field(parent, field, children)
+    return new
+
+
+def replace_at(
+    root: "BaseMarkOrNode",
+    path: T_PATH,
+    new: "BaseMarkOrNode",
+) -> "BaseMarkOrNode":
+    """
+    Return a new root, where the node or mark at the path is ``new``, see
+    :func:`update_at`.
+    """
+    return update_at(root, path, lambda _: new)
@@ -92,11 +92,12 @@ class NodeBlockCard(BaseNode):
     type: str = TypeEnum.blockCard.value
     attrs: NodeBlockCardAttrs = REQ
 
-    def to_markdown(
+    def extract_text(
         self,
-        ignore_error: bool = False,
+        block_sep: str = "\n",
+        cell_sep: str = "\t",
     ) -> str:
         if isinstance(self.attrs.url, str):
-            return f"\n[{self.attrs.url}]({self.attrs.url})\n"
+            return self.attrs.url
         else:
-            raise NotImplementedError
+            return ""
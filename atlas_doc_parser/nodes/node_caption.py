@@ -54,9 +54,3 @@ class NodeCaption(BaseNode):
             "NodeText",
         ]
     ] = OPT
-
-    def to_markdown(
-        self,
-        ignore_error: bool = False,
-    ) -> str:
-        return ""
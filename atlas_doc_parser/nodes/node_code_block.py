@@ -7,10 +7,6 @@ from func_args.api import OPT
 
 from ..type_enum import TypeEnum
 from ..mark_or_node import Base, BaseNode
-from ..markdown_helpers import (
-    content_to_markdown,
-    ATLASSIAN_LANG_TO_MARKDOWN_LANG_MAPPING,
-)
 
 if T.TYPE_CHECKING:  # pragma: no cover
     from .node_text import NodeText
@@ -50,22 +46,3 @@ class NodeCodeBlock(BaseNode):
     type: str = TypeEnum.codeBlock.value
     attrs: NodeCodeBlockAttrs = OPT
     content: list["NodeText"] = OPT
-
-    def to_markdown(
-        self: "NodeCodeBlock",
-        ignore_error: bool = False,
-    ) -> str:
-        code = content_to_markdown(
-            content=self.content,
-            ignore_error=ignore_error,
-        )
-        lang = ""
-        if self.attrs is not OPT:
-            if isinstance(self.attrs.language, str):
-                lang = ATLASSIAN_LANG_TO_MARKDOWN_LANG_MAPPING.get(
-                    self.attrs.language,
-                    self.attrs.language,
-                )
-        if lang == "none":
-            lang = ""
-        return f"```{lang}\n{code}\n```"
@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 
 import dataclasses
-from datetime import datetime, timezone
 
 from func_args.api import REQ, OPT
 
@@ -40,9 +39,9 @@ class NodeDate(BaseNode):
     type: str = TypeEnum.date.value
     attrs: NodeDateAttrs = REQ
 
-    def to_markdown(
-        self: "NodeDate",
-        ignore_error: bool = False,
+    def extract_text(
+        self,
+        block_sep: str = "\n",
+        cell_sep: str = "\t",
     ) -> str:
-        sec = int(self.attrs.timestamp) / 1000
-        return str(datetime.fromtimestamp(sec, tz=timezone.utc).date())
+        return self.to_markdown()
@@ -35,29 +35,3 @@ class NodeDecisionList(BaseNode):
     type: str = TypeEnum.decisionList.value
     attrs: NodeDecisionListAttrs = REQ
     content: list["NodeDecisionItem"] = REQ
-
-    def to_markdown(
-        self,
-        ignore_error: bool = False,
-    ) -> str:
-        """
-        Convert the decision list to Markdown format.
-
-        Each decision item is rendered as a blockquote with ``>`` prefix
-        on every line, separated by blank lines between items.
-        """
-        decision_blocks = []
-
-        for item in self.content:
-            if item.is_type_of(TypeEnum.decisionItem):
-                try:
-                    md = item.to_markdown(ignore_error=ignore_error)
-                    decision_blocks.append(md)
-                except Exception as e:
-                    if ignore_error:
-                        pass
-                    else:
-                        raise e
-
-        # Join with blank lines between each decision
-        return "\n\n".join(decision_blocks)
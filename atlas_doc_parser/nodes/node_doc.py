@@ -12,11 +12,19 @@ import dataclasses
 
 from func_args.api import REQ
 
+from ..type_hint import T_DATA
 from ..type_enum import TypeEnum
 from ..mark_or_node import BaseNode
-from ..markdown_helpers import doc_content_to_markdown
+from ..telemetry import doc_scope
+from ..outline import OutlineItem, Section, build_outline, build_sections
+from ..parallel import (
+    PARALLEL_MIN_BLOCKS,
+    parse_blocks_parallel,
+    render_blocks_parallel,
+)
 
 if T.TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Executor
     from .node_block_card import NodeBlockCard
     from .node_code_block import NodeCodeBlock
     from .node_media_single import NodeMediaSingle
@@ -78,14 +86,80 @@ class NodeDoc(BaseNode):
         ]
     ] = REQ
 
+    @classmethod
+    def from_dict(
+        cls,
+        dct: T_DATA,
+        executor: T.Optional["Executor"] = None,
+        n_groups: T.Optional[int] = None,
+        min_blocks: int = PARALLEL_MIN_BLOCKS,
+    ) -> "NodeDoc":
+        """
+        Deserialize a whole document, unimplemented types skipped in it are
+        counted as one document by :mod:`~atlas_doc_parser.telemetry`.
+
+        :param executor: If given and the document has at least
+            ``min_blocks`` top level blocks, the blocks are parsed in
+            parallel, see :mod:`~atlas_doc_parser.parallel`.
+        :param n_groups: Number of block groups, by default the number of CPUs.
+        :param min_blocks: Smaller documents are parsed sequentially.
+        """
+        with doc_scope():
+            content = dct.get("content")
+            if (
+                executor is None
+                or not isinstance(content, list)
+                or len(content) < min_blocks
+            ):
+                return super().from_dict(dct)
+            doc = super().from_dict({**dct, "content": []})
+            return dataclasses.replace(
+                doc,
+                content=parse_blocks_parallel(content, executor, n_groups),
+            )
+
     def to_markdown(
         self,
         ignore_error: bool = False,
+        executor: T.Optional["Executor"] = None,
+        n_groups: T.Optional[int] = None,
+        min_blocks: int = PARALLEL_MIN_BLOCKS,
     ) -> str:
         """
         Convert the document to Markdown format.
 
         :param ignore_error: If True, silently skip nodes that fail to convert.
+        :param executor: If given and the document has at least
+            ``min_blocks`` top level blocks, the blocks are rendered in
+            parallel, the output is the same, see
+            :mod:`~atlas_doc_parser.parallel`.
+        :param n_groups: Number of block groups, by default the number of CPUs.
+        :param min_blocks: Smaller documents are rendered sequentially.
         :return: The complete document as Markdown text.
         """
-        return doc_content_to_markdown(self.content, ignore_error=ignore_error)
+        if executor is not None and len(self.content) >= min_blocks:
+            return render_blocks_parallel(
+                self.content,
+                executor,
+                n_groups=n_groups,
+                ignore_error=ignore_error,
+            )
+        return super().to_markdown(ignore_error=ignore_error)
+
+    def outline(self) -> list[OutlineItem]:
+        """
+        List the top level headings, with their level, text and index in
+        ``content``, nothing else is rendered.
+        """
+        return build_outline(self)
+
+    def sections(self) -> Section:
+        """
+        Build the section tree, see :func:`~atlas_doc_parser.outline.build_sections`.
+        The section bodies are rendered on request by
+        :meth:`~atlas_doc_parser.outline.Section.to_markdown`.
+
+        :return: The root section, its body is the content before the first
+            heading.
+        """
+        return build_sections(self)
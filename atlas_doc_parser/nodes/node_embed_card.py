@@ -56,8 +56,9 @@ class NodeEmbedCard(BaseNode):
     type: str = TypeEnum.embedCard.value
     attrs: NodeEmbedCardAttrs = REQ
 
-    def to_markdown(
+    def extract_text(
         self,
-        ignore_error: bool = False,
+        block_sep: str = "\n",
+        cell_sep: str = "\t",
     ) -> str:
-        return f"\n[{self.attrs.url}]({self.attrs.url})\n"
+        return self.attrs.url
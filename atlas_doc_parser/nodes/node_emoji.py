@@ -47,14 +47,14 @@ class NodeEmoji(BaseNode):
     type: str = TypeEnum.emoji.value
     attrs: NodeEmojiAttrs = REQ
 
-    def to_markdown(
+    def extract_text(
         self,
-        ignore_error: bool = False,
+        block_sep: str = "\n",
+        cell_sep: str = "\t",
     ) -> str:
-        # Return the text representation if available, otherwise the shortName
         if isinstance(self.attrs.text, str):
             return self.attrs.text
         elif isinstance(self.attrs.shortName, str):
             return self.attrs.shortName
         else:
-            raise NotImplementedError
+            return ""
@@ -7,7 +7,6 @@ from func_args.api import REQ, OPT
 
 from ..type_enum import TypeEnum
 from ..mark_or_node import Base, BaseNode
-from ..markdown_helpers import doc_content_to_markdown, add_style_to_markdown
 
 if T.TYPE_CHECKING:  # pragma: no cover
     from .node_paragraph import NodeParagraph
@@ -79,17 +78,3 @@ class NodeExpand(BaseNode):
             "NodeNestedExpand",
         ]
     ] = REQ
-
-    def to_markdown(
-        self,
-        ignore_error: bool = False,
-    ) -> str:
-        """
-        .. note::
-
-            When converting an expand node to Markdown, any nested expand nodes
-            are treated as regular expand nodes without preserving their hierarchical structure.
-        """
-        md = doc_content_to_markdown(content=self.content, ignore_error=ignore_error)
-        md = add_style_to_markdown(md, self)
-        return md
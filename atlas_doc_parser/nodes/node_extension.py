@@ -58,15 +58,3 @@ class NodeExtension(BaseNode):
     type: str = TypeEnum.extension.value
     attrs: NodeExtensionAttrs = REQ
     marks: list = OPT
-
-    def to_markdown(
-        self,
-        ignore_error: bool = False,
-    ) -> str:
-        # Extensions don't have a standard markdown representation
-        # Return a placeholder with extension info
-        ext_key = self.attrs.extensionKey
-        ext_type = self.attrs.extensionType
-        if isinstance(self.attrs.text, str) and self.attrs.text:
-            return f"[Extension: {ext_key}] {self.attrs.text}"
-        return f"[Extension: {ext_type}/{ext_key}]"
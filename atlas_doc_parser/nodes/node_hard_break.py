@@ -36,8 +36,10 @@ class NodeHardBreak(BaseNode):
     type: str = TypeEnum.hardBreak.value
     attrs: NodeHardBreakAttrs = OPT
 
-    def to_markdown(
+    def extract_text(
         self,
-        ignore_error: bool = False,
+        block_sep: str = "\n",
+        cell_sep: str = "\t",
     ) -> str:
-        return "  \n"
+        # a line break inside a table cell must not break the row
+        return block_sep
@@ -7,7 +7,6 @@ from func_args.api import REQ, OPT
 
 from ..type_enum import TypeEnum
 from ..mark_or_node import Base, BaseNode, BaseMark
-from ..markdown_helpers import content_to_markdown
 
 if T.TYPE_CHECKING:  # pragma: no cover
     from .node_text import NodeText
@@ -73,17 +72,3 @@ class NodeHeading(BaseNode):
             "MarkIndentation",
         ]
     ] = OPT
-
-    def to_markdown(
-        self,
-        ignore_error: bool = False,
-    ) -> str:
-        md = (
-            "\n\n"
-            + "{} {}".format(
-                "#" * self.attrs.level,
-                content_to_markdown(content=self.content, ignore_error=ignore_error),
-            )
-            + "\n\n"
-        )
-        return md
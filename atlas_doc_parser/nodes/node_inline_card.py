@@ -45,11 +45,12 @@ class NodeInlineCard(BaseNode):
     type: str = TypeEnum.inlineCard.value
     attrs: NodeInlineCardAttrs = REQ
 
-    def to_markdown(
+    def extract_text(
         self,
-        ignore_error: bool = False,
+        block_sep: str = "\n",
+        cell_sep: str = "\t",
     ) -> str:
         if isinstance(self.attrs.url, str):
-            return f"[{self.attrs.url}]({self.attrs.url})"
+            return self.attrs.url
         else:
-            raise NotImplementedError
+            return ""
@@ -7,7 +7,6 @@ from func_args.api import REQ, OPT
 
 from ..type_enum import TypeEnum
 from ..mark_or_node import Base, BaseNode
-from ..markdown_helpers import content_to_markdown
 
 if T.TYPE_CHECKING:  # pragma: no cover
     from .node_paragraph import NodeParagraph
@@ -53,9 +52,3 @@ class NodeListItem(BaseNode):
             "NodeExtension",
         ]
     ] = REQ
-
-    def to_markdown(
-        self,
-        ignore_error: bool = False,
-    ) -> str:
-        return content_to_markdown(content=self.content, ignore_error=ignore_error)
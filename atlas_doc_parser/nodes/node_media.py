@@ -7,7 +7,6 @@ from func_args.api import REQ, OPT
 
 from ..type_enum import TypeEnum
 from ..mark_or_node import Base, BaseNode
-from ..markdown_helpers import add_style_to_markdown
 
 if T.TYPE_CHECKING:  # pragma: no cover
     from ..marks.mark_link import MarkLink
@@ -87,22 +86,3 @@ class NodeMedia(BaseNode):
             "MarkBorder",
         ],
     ] = OPT
-
-    def to_markdown(
-        self,
-        ignore_error: bool = False,
-    ) -> str:
-        # For external media, return as markdown image/link
-        if self.attrs.is_external_type() and isinstance(self.attrs.url, str):
-            alt = self.attrs.alt if isinstance(self.attrs.alt, str) else "media"
-            md = f"![{alt}]({self.attrs.url})"
-            return add_style_to_markdown(md, self)
-        # For internal media, return placeholder with id
-        elif self.attrs.is_file_type():
-            alt = self.attrs.alt if isinstance(self.attrs.alt, str) else "media"
-            md = f"![{alt}](media:{self.attrs.id})"
-            return add_style_to_markdown(md, self)
-        elif self.attrs.is_link_type():
-            return "[media]"  # TODO: implement link type markdown
-        else:
-            raise TypeError("Invalid media node attributes")
@@ -61,9 +61,3 @@ class NodeMediaInline(BaseNode):
             "MarkBorder",
         ],
     ] = OPT
-
-    def to_markdown(
-        self,
-        ignore_error: bool = False,
-    ) -> str:
-        return ""
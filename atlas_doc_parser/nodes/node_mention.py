@@ -47,12 +47,12 @@ class NodeMention(BaseNode):
     type: str = TypeEnum.mention.value
     attrs: NodeMentionAttrs = REQ
 
-    def to_markdown(
+    def extract_text(
         self,
-        ignore_error: bool = False,
+        block_sep: str = "\n",
+        cell_sep: str = "\t",
     ) -> str:
-        # Return the text representation if available, otherwise format with @id
         if isinstance(self.attrs.text, str):
             return self.attrs.text
         else:
-            return "@Unknown"
+            return ""
@@ -7,7 +7,6 @@ from func_args.api import REQ, OPT
 
 from ..type_enum import TypeEnum
 from ..mark_or_node import Base, BaseNode
-from ..markdown_helpers import doc_content_to_markdown
 
 if T.TYPE_CHECKING:  # pragma: no cover
     from .node_paragraph import NodeParagraph
@@ -76,15 +75,3 @@ class NodeNestedExpand(BaseNode):
             "NodeExtension",
         ]
     ] = REQ
-
-    def to_markdown(
-        self,
-        ignore_error: bool = False,
-    ) -> str:
-        """
-        .. note::
-
-            We don't preserve expand title in markdown.
-        """
-        md = doc_content_to_markdown(content=self.content, ignore_error=ignore_error)
-        return md
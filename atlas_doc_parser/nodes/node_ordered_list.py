@@ -48,87 +48,9 @@ class NodeOrderedList(BaseNode):
         ignore_error: bool = False,
     ) -> str:
         """
-        Convert the ordered list to Markdown format.
-
-        **ADF Structure** (nested list is a **child** of listItem)::
-
-            orderedList
-            ├── listItem (item 1)
-            │   ├── paragraph → text nodes    ← text wrapped in paragraph
-            │   └── orderedList (nested)      ← nested list is CHILD of listItem
-            │       └── listItem (item 1.1)
-            │           ├── paragraph
-            │           └── orderedList (nested)
-            ├── listItem (item 2)
-            │   ├── paragraph
-            │   └── orderedList (nested)
-            ...
-
-        **Implementation**: Uses two nested loops because:
-
-        - Outer loop: iterates over ``listItem`` nodes in ``orderedList.content``
-        - Inner loop: iterates over ``listItem.content`` which contains both
-          ``paragraph`` (text) and nested ``orderedList`` nodes
-
-        .. note::
-
-            This structure differs from :meth:`~atlas_doc_parser.nodes.node_task_list.NodeTaskList.to_markdown`
-            where nested ``taskList`` nodes are **siblings** of ``taskItem`` nodes,
-            not children. See :class:`~atlas_doc_parser.nodes.node_task_list.NodeTaskList` for comparison.
-
-        .. seealso::
-
-            - :meth:`~atlas_doc_parser.nodes.node_bullet_list.NodeBulletList.to_markdown` - same structure, uses bullets
-            - :meth:`~atlas_doc_parser.nodes.node_task_list.NodeTaskList.to_markdown` - different structure, single loop
+        Convert the ordered list to Markdown format, ``level`` is the nesting level
+        of the list. The rule is :func:`~atlas_doc_parser.renderer._render_ordered_list`.
         """
-        lines = []
-        indent = "    " * level  # 4 spaces per level
-
-        # Start numbering from attrs.order (or 1 for inner levels)
-        if level == 0 and isinstance(self.attrs.order, int):
-            current_num = self.attrs.order
-        else:
-            current_num = 1
-
-        for item in self.content:
-            if item.is_type_of(TypeEnum.listItem):
-                # Process the list item content
-                content_lines = []
-                for node in item.content:
-                    if node.is_type_of(TypeEnum.orderedList):
-                        # Nested list - increase level
-                        try:
-                            md = node.to_markdown(level=level + 1)
-                            content_lines.append(md)
-                        except Exception as e:  # pragma: no cover
-                            if ignore_error:
-                                pass
-                            else:
-                                raise e
-                    else:
-                        # Regular content (like paragraph)
-                        try:
-                            md = node.to_markdown().rstrip()
-                            content_lines.append(md)
-                        except Exception as e:  # pragma: no cover
-                            if ignore_error:
-                                pass
-                            else:
-                                raise e
-
-                # Join the content lines
-                item_content = "\n".join(content_lines)
-
-                # Format the first line with number
-                first_content = item_content.split("\n")[0]
-                first_line = f"{indent}{current_num}. {first_content}"
-                lines.append(first_line)
-
-                # Add remaining lines
-                remaining_lines = item_content.split("\n")[1:]
-                if remaining_lines:
-                    lines.extend(remaining_lines)
-
-                current_num += 1
+        from ..renderer import DEFAULT_RENDERER
 
-        return "\n".join(lines)
+        return DEFAULT_RENDERER.render(self, ignore_error, level)
@@ -1,14 +1,12 @@
 # -*- coding: utf-8 -*-
 
 import typing as T
-import textwrap
 import dataclasses
 
 from func_args.api import REQ, OPT
 
 from ..type_enum import TypeEnum
 from ..mark_or_node import Base, BaseNode
-from ..markdown_helpers import strip_double_empty_line, doc_content_to_markdown
 
 if T.TYPE_CHECKING:  # pragma: no cover
     from .node_paragraph import NodeParagraph
@@ -95,27 +93,3 @@ class NodePanel(BaseNode):
             "NodeExtension",
         ]
     ] = REQ
-
-    def to_markdown(
-        self,
-        ignore_error: bool = False,
-    ) -> str:
-        return (
-            textwrap.indent(
-                strip_double_empty_line(
-                    "\n".join(
-                        [
-                            f"**{self.attrs.panelType.upper()}**",
-                            "",
-                            doc_content_to_markdown(
-                                content=self.content,
-                                ignore_error=ignore_error,
-                            ),
-                        ]
-                    )
-                ),
-                prefix="> ",
-                predicate=lambda line: True,
-            )
-            + "\n"
-        )
\ No newline at end of file
@@ -7,7 +7,6 @@ from func_args.api import OPT
 
 from ..type_enum import TypeEnum
 from ..mark_or_node import Base, BaseNode, BaseMark
-from ..markdown_helpers import content_to_markdown, add_style_to_markdown
 
 if T.TYPE_CHECKING:  # pragma: no cover
     from .node_text import NodeText
@@ -68,14 +67,3 @@ class NodeParagraph(BaseNode):
             "MarkIndentation",
         ]
     ] = OPT
-
-    def to_markdown(
-        self,
-        ignore_error: bool = False,
-    ) -> str:
-        md = content_to_markdown(
-            content=self.content,
-            ignore_error=ignore_error,
-        )
-        md = add_style_to_markdown(md, self)
-        return md + "\n"
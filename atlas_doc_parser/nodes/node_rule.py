@@ -34,9 +34,3 @@ class NodeRule(BaseNode):
 
     type: str = TypeEnum.rule.value
     attrs: NodeRuleAttrs = OPT
-
-    def to_markdown(
-        self,
-        ignore_error: bool = False,
-    ) -> str:
-        return "\n\n---\n\n"
@@ -44,8 +44,9 @@ class NodeStatus(BaseNode):
     type: str = TypeEnum.status.value
     attrs: NodeStatusAttrs = REQ
 
-    def to_markdown(
+    def extract_text(
         self,
-        ignore_error: bool = False,
+        block_sep: str = "\n",
+        cell_sep: str = "\t",
     ) -> str:
-        return f"`{self.attrs.text}`"
+        return self.attrs.text
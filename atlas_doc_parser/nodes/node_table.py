@@ -1,12 +1,18 @@
 # -*- coding: utf-8 -*-
 
 import typing as T
+import csv
 import dataclasses
 
 from func_args.api import REQ, OPT
 
 from ..type_enum import TypeEnum
 from ..mark_or_node import Base, BaseNode
+from ..table_grid import (
+    node_cell_spans,
+    iter_row_texts,
+    make_column_names,
+)
 
 if T.TYPE_CHECKING:  # pragma: no cover
     from .node_table_row import NodeTableRow
@@ -43,6 +49,10 @@ class NodeTableAttrs(Base):
     width: float = OPT
 
 
+def _cell_text(cell: T.Any) -> str:
+    return cell.extract_text().strip()
+
+
 @dataclasses.dataclass(frozen=True)
 class NodeTable(BaseNode):
     """
@@ -69,20 +79,106 @@ class NodeTable(BaseNode):
     content: list["NodeTableRow"] = REQ
     marks: list["MarkFragment"] = OPT
 
-    def to_markdown(
+    def has_header_row(self) -> bool:
+        """
+        Whether the first row is a header row, i.e. it has ``tableHeader``
+        cells.
+        """
+        return bool(self.content) and any(
+            cell.is_type_of(TypeEnum.tableHeader) for cell in self.content[0].content
+        )
+
+    def extract_text(
         self,
-        ignore_error: bool = False,
+        block_sep: str = "\n",
+        cell_sep: str = "\t",
     ) -> str:
-        lines = list()
-        for row in self.content:
-            try:
-                md = row.to_markdown()
-                lines.append(md)
-                if row.content[0].is_type_of(TypeEnum.tableHeader):
-                    lines.append("| " + " | ".join(["---"] * len(row.content)) + " |")
-            except Exception as e:  # pragma: no cover
-                if ignore_error:
-                    pass
-                else:
-                    raise e
-        return "\n".join(lines)
+        return block_sep.join(
+            [
+                row.extract_text(block_sep=block_sep, cell_sep=cell_sep)
+                for row in self.content
+            ]
+        )
+
+    def iter_rows(
+        self,
+        fill_spans: bool = True,
+    ) -> T.Iterator[list[str]]:
+        """
+        Yield the plain text of the cells of each row, header row included,
+        lazily, one row at a time.
+
+        Spans are expanded, so a cell with ``colspan=2`` gives two values.
+        Rows are padded to the width of the rows above, not to the width of
+        a wider row below, that row isn't read yet.
+
+        :param fill_spans: If True, the slots covered by a span repeat the
+            text of the spanning cell, else they are empty strings.
+        """
+        return iter_row_texts(
+            (row.content for row in self.content),
+            node_cell_spans,
+            _cell_text,
+            fill_spans=fill_spans,
+        )
+
+    def iter_records(
+        self,
+        columns: T.Optional[list[str]] = None,
+        fill_spans: bool = True,
+    ) -> T.Iterator[dict[str, str]]:
+        """
+        Yield the data rows as dicts keyed by the header text, lazily.
+
+        Example::
+
+            >>> list(table.iter_records())
+            [{"Host": "web-1", "Owner": "Alice"}, {"Host": "web-2", "Owner": "Bob"}]
+
+        :param columns: The column names. By default they are the texts of
+            the header row, see :func:`~atlas_doc_parser.table_grid.make_column_names`.
+            The header row is never yielded as a record.
+        :param fill_spans: See :meth:`iter_rows`.
+        """
+        rows = self.iter_rows(fill_spans=fill_spans)
+        if self.has_header_row():
+            header = next(rows)
+            if columns is None:
+                columns = make_column_names(header)
+        if columns is None:
+            columns = []
+        n_columns = len(columns)
+        for values in rows:
+            record = dict(zip(columns, values))
+            # short rows get empty values, long rows get extra columns
+            for name in columns[len(values) :]:
+                record[name] = ""
+            for i in range(n_columns, len(values)):
+                record[f"column_{i + 1}"] = values[i]
+            yield record
+
+    def to_csv(
+        self,
+        f: T.TextIO,
+        header: bool = True,
+        fill_spans: bool = True,
+        **fmtparams,
+    ) -> int:
+        """
+        Write the table as CSV to a file object, one row at a time.
+
+        :param f: A text file object, open it with ``newline=""``.
+        :param header: Whether to write the header row, if any.
+        :param fill_spans: See :meth:`iter_rows`.
+        :param fmtparams: Arguments of ``csv.writer``.
+        :return: Number of lines written.
+        """
+        writer = csv.writer(f, **fmtparams)
+        rows = self.iter_rows(fill_spans=fill_spans)
+        if not header and self.has_header_row():
+            next(rows)
+        n_lines = 0
+        for values in rows:
+            writer.writerow(values)
+            n_lines += 1
+        return n_lines
@@ -7,7 +7,7 @@ from func_args.api import REQ, OPT
 
 from ..type_enum import TypeEnum
 from ..mark_or_node import Base, BaseNode
-from ..markdown_helpers import content_to_markdown
+from ..text_helpers import content_to_text
 
 if T.TYPE_CHECKING:  # pragma: no cover
     from .node_paragraph import NodeParagraph
@@ -82,23 +82,14 @@ class NodeTableCell(BaseNode):
         ]
     ] = REQ
 
-    def to_markdown(
+    def extract_text(
         self,
-        ignore_error: bool = False,
+        block_sep: str = "\n",
+        cell_sep: str = "\t",
     ) -> str:
-        md = content_to_markdown(content=self.content, ignore_error=ignore_error)
-        md = md.replace("|", "\\|")
-
-        # Convert leading spaces to &nbsp; for HTML table rendering
-        # (spaces after <br> are collapsed in HTML, so we need &nbsp;)
-        lines = md.split("\n")
-        processed_lines = []
-        for line in lines:
-            stripped = line.lstrip(" ")
-            leading_spaces = len(line) - len(stripped)
-            if leading_spaces > 0:
-                # Replace leading spaces with &nbsp;
-                line = "&nbsp;" * leading_spaces + stripped
-            processed_lines.append(line)
-
-        return "<br>".join(processed_lines)
+        # Keep one table row on one line, blocks in a cell are joined by space
+        return content_to_text(
+            content=self.content,
+            block_sep=" ",
+            cell_sep=cell_sep,
+        )
@@ -47,12 +47,14 @@ class NodeTableRow(BaseNode):
         ]
     ] = REQ
 
-    def to_markdown(
+    def extract_text(
         self,
-        ignore_error: bool = False,
+        block_sep: str = "\n",
+        cell_sep: str = "\t",
     ) -> str:
-        cells = []
-        for cell in self.content:
-            md = cell.to_markdown(ignore_error=ignore_error)
-            cells.append(md)
-        return "| " + " | ".join(cells) + " |"
+        return cell_sep.join(
+            [
+                cell.extract_text(block_sep=block_sep, cell_sep=cell_sep)
+                for cell in self.content
+            ]
+        )
@@ -7,7 +7,6 @@ from func_args.api import REQ, OPT
 
 from ..type_enum import TypeEnum
 from ..mark_or_node import BaseNode
-from ..markdown_helpers import add_style_to_markdown
 
 if T.TYPE_CHECKING:  # pragma: no cover
     from ..marks.mark_link import MarkLink
@@ -49,10 +48,9 @@ class NodeText(BaseNode):
         ]
     ] = OPT
 
-    def to_markdown(
+    def extract_text(
         self,
-        ignore_error: bool = False,
-    ):
-        md = self.text
-        md = add_style_to_markdown(md=md, node=self)
-        return md
+        block_sep: str = "\n",
+        cell_sep: str = "\t",
+    ) -> str:
+        return self.text
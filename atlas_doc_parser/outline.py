@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+
+"""
+Heading outline and section tree of a document, without rendering it.
+
+The headings of an ADF document are top level ``heading`` nodes, the
+document is flat, a "section" is the run of blocks from a heading to the
+next heading of the same or a higher level. :func:`build_sections` finds the
+hierarchy in one pass over the top level content, reading only the text of
+the headings. The body of a section is rendered on request only, so an
+outline of a document full of tables and code blocks costs nothing more than
+its headings.
+
+Example::
+
+    doc = NodeDoc.from_dict(data)
+    for item in doc.outline():
+        print("  " * (item.level - 1) + item.title)
+
+    root = doc.sections()
+    for section in root.walk():
+        chunk = section.to_markdown(include_subsections=False)
+"""
+
+import typing as T
+import dataclasses
+
+from func_args.api import OPT
+
+from .type_enum import TypeEnum
+from .markdown_helpers import doc_content_to_markdown
+from .text_helpers import content_to_text
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from .mark_or_node import T_NODE
+    from .nodes.node_doc import NodeDoc
+    from .nodes.node_heading import NodeHeading
+
+
+def _heading_title(heading: "NodeHeading") -> str:
+    return content_to_text(heading.content).strip()
+
+
+def _heading_local_id(heading: "NodeHeading") -> T.Optional[str]:
+    local_id = heading.attrs.localId
+    return None if local_id is OPT else local_id
+
+
+@dataclasses.dataclass(frozen=True)
+class OutlineItem:
+    """
+    One heading of the document outline.
+
+    :param level: Heading level, 1 to 6.
+    :param title: Plain text of the heading.
+    :param index: Index of the heading in ``doc.content``.
+    :param local_id: ``localId`` of the heading, if any.
+    """
+
+    level: int
+    title: str
+    index: int
+    local_id: T.Optional[str] = None
+
+    def to_dict(self) -> dict[str, T.Any]:
+        return dataclasses.asdict(self)
+
+
+@dataclasses.dataclass
+class Section:
+    """
+    A heading and the blocks under it.
+
+    The root section has no heading (``level=0``), its body is the content
+    before the first heading, all the top level sections are its children.
+
+    :param doc: The document.
+    :param heading: The heading node, ``None`` for the root section.
+    :param level: Heading level, ``0`` for the root section.
+    :param title: Plain text of the heading.
+    :param index: Index of the heading in ``doc.content``, ``-1`` for the
+        root section.
+    :param body_end: The body of the section, without the subsections, is
+        ``doc.content[index + 1:body_end]``.
+    :param end: The section with its subsections is
+        ``doc.content[index + 1:end]``.
+    :param children: The subsections.
+    """
+
+    doc: "NodeDoc" = dataclasses.field(repr=False)
+    heading: T.Optional["NodeHeading"] = dataclasses.field(repr=False)
+    level: int
+    title: str
+    index: int
+    body_end: int
+    end: int
+    children: list["Section"] = dataclasses.field(default_factory=list)
+
+    def walk(self) -> T.Iterator["Section"]:
+        """
+        Yield this section and all its subsections, in document order.
+        """
+        stack = [self]
+        while stack:
+            section = stack.pop()
+            yield section
+            stack.extend(reversed(section.children))
+
+    def nodes(
+        self,
+        include_subsections: bool = True,
+    ) -> list["T_NODE"]:
+        """
+        The block nodes under the heading, the heading itself excluded.
+
+        :param include_subsections: If False, stop at the first subsection.
+        """
+        end = self.end if include_subsections else self.body_end
+        return self.doc.content[self.index + 1 : end]
+
+    def to_markdown(
+        self,
+        include_heading: bool = True,
+        include_subsections: bool = True,
+        ignore_error: bool = False,
+    ) -> str:
+        """
+        Render the section, only the nodes of this section are converted.
+
+        :param include_heading: Whether to render the heading line.
+        :param include_subsections: Whether to render the subsections.
+        :param ignore_error: If True, silently skip nodes that fail to convert.
+        """
+        nodes = self.nodes(include_subsections=include_subsections)
+        if include_heading and self.heading is not None:
+            nodes = [self.heading, *nodes]
+        return doc_content_to_markdown(nodes, ignore_error=ignore_error)
+
+    def extract_text(
+        self,
+        include_heading: bool = True,
+        include_subsections: bool = True,
+        block_sep: str = "\n",
+        cell_sep: str = "\t",
+    ) -> str:
+        """
+        Extract the plain text of the section, see
+        :meth:`~atlas_doc_parser.mark_or_node.BaseNode.extract_text`.
+        """
+        nodes = self.nodes(include_subsections=include_subsections)
+        if include_heading and self.heading is not None:
+            nodes = [self.heading, *nodes]
+        return content_to_text(nodes, block_sep=block_sep, cell_sep=cell_sep)
+
+
+def _iter_headings(doc: "NodeDoc") -> T.Iterator[tuple[int, "NodeHeading"]]:
+    heading_type = TypeEnum.heading.value
+    for index, node in enumerate(doc.content):
+        if node.type == heading_type:
+            yield index, node
+
+
+def build_outline(doc: "NodeDoc") -> list[OutlineItem]:
+    """
+    List the top level headings of the document, in document order.
+    """
+    return [
+        OutlineItem(
+            level=heading.attrs.level,
+            title=_heading_title(heading),
+            index=index,
+            local_id=_heading_local_id(heading),
+        )
+        for index, heading in _iter_headings(doc)
+    ]
+
+
+def build_sections(doc: "NodeDoc") -> Section:
+    """
+    Build the section tree of the document, in one pass over the top level
+    content.
+
+    A heading closes the open sections of the same or a deeper level, and is
+    nested under the nearest open section of a higher level, a skipped level
+    (``h1`` then ``h3``) is nested directly.
+
+    :return: The root section.
+    """
+    n = len(doc.content)
+    root = Section(
+        doc=doc,
+        heading=None,
+        level=0,
+        title="",
+        index=-1,
+        body_end=n,
+        end=n,
+    )
+    stack = [root]
+    # the section whose body is still open, it ends at the next heading
+    last = root
+    for index, heading in _iter_headings(doc):
+        last.body_end = index
+        level = heading.attrs.level
+        while stack[-1].level >= level:
+            stack.pop().end = index
+        section = Section(
+            doc=doc,
+            heading=heading,
+            level=level,
+            title=_heading_title(heading),
+            index=index,
+            body_end=n,
+            end=n,
+        )
+        stack[-1].children.append(section)
+        stack.append(section)
+        last = section
+    return root
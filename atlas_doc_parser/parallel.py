@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+"""
+Parse and render the top level blocks of one giant document in parallel.
+
+A document with thousands of top level blocks takes seconds to convert on
+one core. The blocks of a document are independent, so ``content`` is split
+into contiguous groups of about the same number of nodes, each group is
+processed by an executor, and the results are put back in order. The output
+is the same as the sequential version: the blank lines around the blocks are
+normalized once, on the stitched result, like
+:func:`~atlas_doc_parser.markdown_helpers.doc_content_to_markdown` does.
+
+Below ``min_blocks`` top level blocks the document is processed sequentially,
+splitting a small document costs more than it saves.
+
+Example::
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor() as executor:
+        doc = NodeDoc.from_dict(data, executor=executor)
+        md = doc.to_markdown(executor=executor)
+
+Use a ``ProcessPoolExecutor`` to use more than one CPU core, the worker
+functions are module level functions, so they are picklable. Rendering is
+much cheaper than parsing, with a process pool sending the node objects to
+the workers costs more than rendering them, parallel rendering pays off with
+a ``ThreadPoolExecutor`` on the free-threaded build (``python3.13t``) only.
+
+With a process pool, the unimplemented types skipped in the workers are
+counted by the :mod:`~atlas_doc_parser.telemetry` of the worker processes,
+and the nodes dropped by ``ignore_error=True`` are not reported to
+:func:`~atlas_doc_parser.render_report.to_markdown_with_report`. A
+``ThreadPoolExecutor`` runs each group in a copy of the caller's context, so
+the settings, the telemetry and the render report work as usual.
+"""
+
+import typing as T
+import os
+import itertools
+import contextvars
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+from .exc import UnimplementedTypeError
+from .telemetry import report_unimplemented_type
+from .markdown_helpers import strip_double_empty_line, doc_blocks_to_markdown_list
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from .mark_or_node import T_NODE
+    from .type_hint import T_DATA
+
+PARALLEL_MIN_BLOCKS = 256
+"""
+Documents with fewer top level blocks are processed sequentially.
+"""
+
+T_ITEM = T.TypeVar("T_ITEM")
+
+
+def _count_nodes(block: T.Any) -> int:
+    """
+    Number of nodes in the block, for a node object or a raw node dict.
+    """
+    n = 0
+    stack = [block]
+    while stack:
+        node = stack.pop()
+        n += 1
+        if isinstance(node, dict):
+            content = node.get("content")
+        else:
+            content = getattr(node, "content", None)
+        # content is OPT when unset
+        if content and isinstance(content, list):
+            stack.extend(content)
+    return n
+
+
+def partition(
+    items: T.Sequence[T_ITEM],
+    n_groups: int,
+    weight: T.Callable[[T_ITEM], int] = _count_nodes,
+) -> list[list[T_ITEM]]:
+    """
+    Split the items into at most ``n_groups`` contiguous, non empty groups of
+    about the same total weight.
+
+    :param items: The items, in order.
+    :param n_groups: The number of groups.
+    :param weight: Return the weight of an item, by default the number of
+        nodes of a block.
+    """
+    if not items:
+        return []
+    n_groups = max(1, min(n_groups, len(items)))
+    weights = [weight(item) for item in items]
+    total = sum(weights)
+    groups, group = [], []
+    acc = 0
+    for item, w in zip(items, weights):
+        group.append(item)
+        acc += w
+        # close the group once the running total reaches its share
+        if acc * n_groups >= total * (len(groups) + 1):
+            groups.append(group)
+            group = []
+    if group:
+        groups.append(group)
+    return groups
+
+
+def _map(
+    executor: Executor,
+    func: T.Callable[..., T.Any],
+    groups: list[list[T.Any]],
+    *args,
+) -> list[T.Any]:
+    if isinstance(executor, ThreadPoolExecutor):
+        futures = [
+            executor.submit(contextvars.copy_context().run, func, group, *args)
+            for group in groups
+        ]
+    else:
+        futures = [executor.submit(func, group, *args) for group in groups]
+    return [future.result() for future in futures]
+
+
+def parse_blocks(blocks: list["T_DATA"]) -> list["T_NODE"]:
+    """
+    Parse raw block dicts to node objects, the unimplemented types are
+    skipped like in :meth:`~atlas_doc_parser.mark_or_node.BaseNode.from_dict`.
+
+    This is the function that runs in the executor.
+    """
+    from .nodes.parse_node import parse_node
+
+    nodes = []
+    for dct in blocks:
+        try:
+            nodes.append(parse_node(dct))
+        except UnimplementedTypeError as e:
+            report_unimplemented_type(e.type_value, e.category)
+    return nodes
+
+
+def parse_blocks_parallel(
+    blocks: list["T_DATA"],
+    executor: Executor,
+    n_groups: T.Optional[int] = None,
+) -> list["T_NODE"]:
+    """
+    Parse raw block dicts to node objects in parallel, in input order.
+
+    :param blocks: The raw top level blocks of a document.
+    :param executor: The executor to run :func:`parse_blocks`.
+    :param n_groups: Number of groups, by default the number of CPUs.
+    """
+    groups = partition(blocks, n_groups or os.cpu_count() or 1)
+    return list(itertools.chain.from_iterable(_map(executor, parse_blocks, groups)))
+
+
+def render_blocks_parallel(
+    content: list["T_NODE"],
+    executor: Executor,
+    n_groups: T.Optional[int] = None,
+    ignore_error: bool = False,
+    concat: str = "\n",
+) -> str:
+    """
+    Render document-level content in parallel, the output is the same as
+    :func:`~atlas_doc_parser.markdown_helpers.doc_content_to_markdown`.
+
+    :param content: The top level blocks of a document.
+    :param executor: The executor to run
+        :func:`~atlas_doc_parser.markdown_helpers.doc_blocks_to_markdown_list`.
+    :param n_groups: Number of groups, by default the number of CPUs.
+    :param ignore_error: If True, silently skip nodes that fail to convert.
+    :param concat: String to join blocks.
+    """
+    groups = partition(content, n_groups or os.cpu_count() or 1)
+    results = _map(executor, doc_blocks_to_markdown_list, groups, ignore_error)
+    return strip_double_empty_line(concat.join(itertools.chain.from_iterable(results)))
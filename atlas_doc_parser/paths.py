@@ -44,6 +44,8 @@ class PathEnum:
     dir_unit_test = dir_project_root / "tests"
     dir_int_test = dir_project_root / "tests_int"
     dir_load_test = dir_project_root / "tests_load"
+    dir_benchmarks = dir_project_root / "benchmarks"
+    path_benchmark_baseline = dir_benchmarks / "baseline.json"
 
     # Documentation
     dir_docs_source = dir_project_root / "docs" / "source"
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+
+"""
+Render the beginning of a document to Markdown, within a character budget.
+
+Search result snippets only need the first few hundred characters of a page.
+:func:`render_preview` renders with a :class:`PreviewRenderer`, which stops
+the traversal as soon as the budget is spent: the remaining blocks, list
+items, table rows and inline nodes are never visited, so the cost is
+proportional to the output, not to the document size.
+
+The budget counts the characters of the content (text, mentions, cards,
+...), the Markdown syntax around it is not counted. The last text node is
+cut at a word boundary and ends with ``ellipsis``. Because the Markdown is
+built bottom up, the open constructs are closed as usual: marks are applied
+to the cut text, a code block gets its closing fence, a table keeps its
+header separator and ends with the row where the budget runs out, its
+remaining cells are empty.
+
+Example::
+
+    from atlas_doc_parser.preview import render_preview
+
+    snippet = render_preview(NodeDoc.from_dict(data), max_chars=500)
+    # or with an estimated token budget
+    snippet = render_preview(NodeDoc.from_dict(data), max_tokens=128)
+"""
+
+import typing as T
+
+from .render_report import record_render_error
+from .renderer import (
+    MarkdownRenderer,
+    T_NODE_HANDLER,
+    T_MARK_HANDLER,
+)
+from .nodes.parse_node import NODE_TYPE_TO_CLASS_MAPPING
+from .table_grid import iter_grid_rows, node_cell_spans
+from .type_enum import TypeEnum
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from .mark_or_node import T_NODE
+
+CHARS_PER_TOKEN = 4
+"""
+Average number of characters per token, used to convert ``max_tokens`` to
+a character budget.
+"""
+
+
+def truncate_text(text: str, max_chars: int) -> str:
+    """
+    Cut the text to at most ``max_chars`` characters, at a word boundary if
+    the text has a space before the limit.
+    """
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars]
+    if not text[max_chars].isspace():
+        i = cut.rfind(" ")
+        if i > 0:
+            cut = cut[:i]
+    return cut.rstrip()
+
+
+class PreviewRenderer(MarkdownRenderer):
+    """
+    A :class:`~atlas_doc_parser.renderer.MarkdownRenderer` that stops when
+    ``max_chars`` characters of content are rendered. It keeps the budget
+    state, create one per document.
+
+    :param max_chars: The character budget.
+    :param ellipsis: Appended to the cut text.
+    :param node_handlers: See :class:`~atlas_doc_parser.renderer.MarkdownRenderer`.
+    :param mark_handlers: See :class:`~atlas_doc_parser.renderer.MarkdownRenderer`.
+
+    After rendering, :attr:`truncated` tells whether something was left out.
+    """
+
+    def __init__(
+        self,
+        max_chars: int,
+        ellipsis: str = "...",
+        node_handlers: T.Optional[dict[str, T_NODE_HANDLER]] = None,
+        mark_handlers: T.Optional[dict[str, T_MARK_HANDLER]] = None,
+    ):
+        super().__init__(node_handlers=node_handlers, mark_handlers=mark_handlers)
+        self.max_chars = max_chars
+        self.remaining = max_chars
+        self.ellipsis = ellipsis
+        self.truncated = False
+        for type_, handler in list(self.node_handlers.items()):
+            if type_ in PREVIEW_NODE_HANDLERS and type_ not in (node_handlers or {}):
+                self.node_handlers[type_] = PREVIEW_NODE_HANDLERS[type_]
+            elif type_ in _LEAF_TYPES:
+                # the output of these can't be cut, it is counted as a whole
+                self.node_handlers[type_] = _charged(handler)
+
+    def with_handlers(
+        self,
+        node_handlers: T.Optional[dict[str, T_NODE_HANDLER]] = None,
+        mark_handlers: T.Optional[dict[str, T_MARK_HANDLER]] = None,
+    ) -> "PreviewRenderer":
+        """
+        Create a new renderer with the full budget and more handlers replaced.
+        """
+        return self.__class__(
+            max_chars=self.max_chars,
+            ellipsis=self.ellipsis,
+            node_handlers={**self._node_handler_overrides, **(node_handlers or {})},
+            mark_handlers={**self._mark_handler_overrides, **(mark_handlers or {})},
+        )
+
+    def iter_children(self, content: list["T_NODE"]) -> T.Iterator["T_NODE"]:
+        for node in content:
+            if self.remaining <= 0:
+                self.truncated = True
+                return
+            yield node
+
+    def charge(self, n_chars: int):
+        """
+        Spend ``n_chars`` characters of the budget.
+        """
+        self.remaining -= n_chars
+
+
+def _charged(handler: T_NODE_HANDLER) -> T_NODE_HANDLER:
+    def charged(r: PreviewRenderer, node, ignore_error: bool, level: int) -> str:
+        md = handler(r, node, ignore_error, level)
+        r.charge(len(md))
+        return md
+
+    return charged
+
+
+def _preview_text(r: PreviewRenderer, node, ignore_error: bool, level: int) -> str:
+    text = node.text
+    if len(text) > r.remaining:
+        text = truncate_text(text, max(r.remaining, 0)) + r.ellipsis
+        r.truncated = True
+    r.charge(len(node.text))
+    return r.apply_marks(text, node)
+
+
+def _preview_table(r: PreviewRenderer, node, ignore_error: bool, level: int) -> str:
+    # normalize the rows lazily, the rows after the budget are never read
+    rows = []
+
+    def iter_cells():
+        for row in r.iter_children(node.content):
+            rows.append(row)
+            yield row.content
+
+    header = node.has_header_row()
+    lines = []
+    grid_rows = iter_grid_rows(iter_cells(), node_cell_spans)
+    for i, (slots, origins, _) in enumerate(grid_rows):
+        # the cells are charged like any content, the cell where the budget
+        # runs out is cut and the next cells of the row are empty, so the
+        # row is still complete
+        try:
+            cells = [
+                "" if cell is None or not origin else r.render(cell)
+                for cell, origin in zip(slots, origins)
+            ]
+            lines.append("| " + " | ".join(cells) + " |")
+            if i == 0 and header:
+                lines.append("| " + " | ".join(["---"] * len(slots)) + " |")
+        except Exception as e:  # pragma: no cover
+            if ignore_error:
+                record_render_error(rows[i], e)
+            else:
+                raise e
+    return "\n".join(lines)
+
+
+PREVIEW_NODE_HANDLERS: dict[str, T_NODE_HANDLER] = {
+    TypeEnum.text.value: _preview_text,
+    TypeEnum.table.value: _preview_table,
+}
+"""
+Node type to handler mapping of :class:`PreviewRenderer`, over the handlers
+of :class:`~atlas_doc_parser.renderer.MarkdownRenderer`.
+"""
+
+_LEAF_TYPES = {
+    type_
+    for type_, klass in NODE_TYPE_TO_CLASS_MAPPING.items()
+    if "content" not in klass.get_fields()
+}
+
+
+def render_preview(
+    node: "T_NODE",
+    max_chars: int = 500,
+    max_tokens: T.Optional[int] = None,
+    ellipsis: str = "...",
+    ignore_error: bool = False,
+    node_handlers: T.Optional[dict[str, T_NODE_HANDLER]] = None,
+    mark_handlers: T.Optional[dict[str, T_MARK_HANDLER]] = None,
+) -> str:
+    """
+    Render the beginning of a node to Markdown, stop when the budget is
+    spent.
+
+    :param node: Any node object, usually a ``NodeDoc``.
+    :param max_chars: The character budget of the content.
+    :param max_tokens: An estimated token budget, if given it replaces
+        ``max_chars`` with ``max_tokens * CHARS_PER_TOKEN``.
+    :param ellipsis: Appended to the cut text.
+    :param ignore_error: Same as the ``ignore_error`` of ``to_markdown()``.
+    :param node_handlers: See :class:`~atlas_doc_parser.renderer.MarkdownRenderer`.
+    :param mark_handlers: See :class:`~atlas_doc_parser.renderer.MarkdownRenderer`.
+    """
+    if max_tokens is not None:
+        max_chars = max_tokens * CHARS_PER_TOKEN
+    if max_chars <= 0:
+        return ""
+    renderer = PreviewRenderer(
+        max_chars=max_chars,
+        ellipsis=ellipsis,
+        node_handlers=node_handlers,
+        mark_handlers=mark_handlers,
+    )
+    return renderer.render(node, ignore_error=ignore_error)
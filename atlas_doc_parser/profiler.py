@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+
+"""
+Per node type timing of ``from_dict()`` and ``to_markdown()``.
+
+:class:`Profiler` answers the question "which node types dominate the
+conversion time". While it is active it records, for every node class and
+for both ``from_dict`` and ``to_markdown``:
+
+- ``calls``: number of calls.
+- ``cum_time``: cumulative time in seconds, including the children.
+- ``self_time``: time in seconds, excluding the children.
+- ``output_bytes``: UTF-8 size of the returned Markdown (``to_markdown`` only).
+
+The instrumentation is installed on ``start()`` and removed on ``stop()``,
+the originals are restored, so a disabled profiler adds nothing to the hot
+path. ``from_dict`` is timed by wrapping the method of the node classes,
+``to_markdown`` by wrapping the handlers of
+:data:`~atlas_doc_parser.renderer.DEFAULT_RENDERER`, where the Markdown rules
+are. The output of other renderers is not recorded.
+
+Example::
+
+    from atlas_doc_parser.profiler import Profiler
+
+    with Profiler() as profiler:
+        NodeDoc.from_dict(data).to_markdown()
+    print(profiler.to_dict()["NodeTable"]["to_markdown"]["self_time"])
+"""
+
+import typing as T
+import time
+import functools
+import threading
+import dataclasses
+
+from .nodes.parse_node import NODE_TYPE_TO_CLASS_MAPPING
+from .renderer import DEFAULT_RENDERER
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from .mark_or_node import BaseNode
+
+FROM_DICT = "from_dict"
+TO_MARKDOWN = "to_markdown"
+
+_active_lock = threading.Lock()
+_active: T.Optional["Profiler"] = None
+
+
+@dataclasses.dataclass
+class MethodStats:
+    """
+    Counters of one method of one node class.
+    """
+
+    calls: int = 0
+    cum_time: float = 0.0
+    self_time: float = 0.0
+    output_bytes: int = 0
+
+    def to_dict(self) -> dict[str, T.Any]:
+        return dataclasses.asdict(self)
+
+
+class _Frame:
+    __slots__ = ("key", "start", "child_time")
+
+    def __init__(self, key: tuple[str, str], start: float):
+        self.key = key
+        self.start = start
+        self.child_time = 0.0
+
+
+class Profiler:
+    """
+    Record per node class timing of ``from_dict`` and ``to_markdown``.
+
+    Only one profiler can be active at a time, because it patches the node
+    classes process wide. Calls from all threads are recorded.
+
+    :param classes: The node classes to instrument, default is all
+        implemented node classes.
+    """
+
+    def __init__(
+        self,
+        classes: T.Optional[T.Iterable[T.Type["BaseNode"]]] = None,
+    ):
+        if classes is None:
+            classes = NODE_TYPE_TO_CLASS_MAPPING.values()
+        self.classes = list(classes)
+        self.stats: dict[tuple[str, str], MethodStats] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._patches: list[tuple[type, str, T.Any]] = []
+        self._handler_patches: list[tuple[str, T.Any]] = []
+
+    # --------------------------------------------------------------------------
+    # Recording
+    # --------------------------------------------------------------------------
+    def _get_stack(self) -> list[_Frame]:
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def _call(self, key: tuple[str, str], func: T.Callable, *args, **kwargs):
+        stack = self._get_stack()
+        frame = _Frame(key, time.perf_counter())
+        stack.append(frame)
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - frame.start
+            stack.pop()
+            if stack:
+                stack[-1].child_time += elapsed
+            # recursive calls of the same method are only counted once in
+            # the cumulative time, like cProfile does
+            outermost = all(f.key != key for f in stack)
+            with self._lock:
+                try:
+                    stats = self.stats[key]
+                except KeyError:
+                    stats = self.stats[key] = MethodStats()
+                stats.calls += 1
+                stats.self_time += elapsed - frame.child_time
+                if outermost:
+                    stats.cum_time += elapsed
+        if key[1] == TO_MARKDOWN and isinstance(result, str):
+            n_bytes = len(result.encode("utf-8"))
+            with self._lock:
+                stats.output_bytes += n_bytes
+        return result
+
+    def _wrap_from_dict(self, klass: type):
+        func = klass.from_dict.__func__
+        key = (klass.__name__, FROM_DICT)
+
+        @functools.wraps(func)
+        def from_dict(cls, *args, **kwargs):
+            if cls is not klass:  # called via super() from a subclass
+                return func(cls, *args, **kwargs)
+            return self._call(key, func, cls, *args, **kwargs)
+
+        return classmethod(from_dict)
+
+    def _wrap_handler(self, klass: type, func: T.Callable):
+        key = (klass.__name__, TO_MARKDOWN)
+
+        @functools.wraps(func)
+        def handler(r, node, ignore_error, level):
+            return self._call(key, func, r, node, ignore_error, level)
+
+        return handler
+
+    # --------------------------------------------------------------------------
+    # Enable / disable
+    # --------------------------------------------------------------------------
+    def start(self) -> "Profiler":
+        """
+        Install the instrumentation.
+
+        :raises RuntimeError: If another profiler is active.
+        """
+        global _active
+        with _active_lock:
+            if _active is not None:
+                raise RuntimeError("another Profiler is already active")
+            _active = self
+        node_handlers = DEFAULT_RENDERER.node_handlers
+        for klass in self.classes:
+            # remember whether the class defines the method itself
+            self._patches.append((klass, FROM_DICT, klass.__dict__.get(FROM_DICT)))
+            setattr(klass, FROM_DICT, self._wrap_from_dict(klass))
+            type_ = klass.get_fields()["type"].default
+            original = node_handlers[type_]
+            self._handler_patches.append((type_, original))
+            node_handlers[type_] = self._wrap_handler(klass, original)
+        return self
+
+    def stop(self):
+        """
+        Remove the instrumentation and restore the original methods.
+        """
+        global _active
+        node_handlers = DEFAULT_RENDERER.node_handlers
+        for type_, original in reversed(self._handler_patches):
+            node_handlers[type_] = original
+        self._handler_patches.clear()
+        for klass, name, original in reversed(self._patches):
+            if original is None:
+                delattr(klass, name)
+            else:
+                setattr(klass, name, original)
+        self._patches.clear()
+        with _active_lock:
+            if _active is self:
+                _active = None
+
+    def __enter__(self) -> "Profiler":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    # --------------------------------------------------------------------------
+    # Export
+    # --------------------------------------------------------------------------
+    def to_dict(self) -> dict[str, dict[str, dict[str, T.Any]]]:
+        """
+        Export the stats as ``{class_name: {method: {counter: value}}}``.
+        """
+        data = {}
+        with self._lock:
+            for (class_name, method), stats in sorted(self.stats.items()):
+                data.setdefault(class_name, {})[method] = stats.to_dict()
+        return data
+
+    def reset(self):
+        """
+        Clear the recorded stats.
+        """
+        with self._lock:
+            self.stats.clear()
@@ -0,0 +1,650 @@
+# -*- coding: utf-8 -*-
+
+"""
+Render raw ADF JSON data (the ``json.loads`` output) without building the
+dataclass tree.
+
+For pure ADF to Markdown conversion the node objects created by
+``NodeDoc.from_dict(data)`` are discarded right after ``to_markdown()``.
+:func:`raw_to_markdown` walks the raw dicts instead and produces exactly the
+same output as ``NodeDoc.from_dict(data).to_markdown()``.
+
+Each node type is rendered by a function registered in
+:data:`RAW_NODE_RENDERERS`. Node types without a raw renderer (for example
+``decisionList`` or ``extension``) fall back to
+``parse_node(dct).to_markdown()`` for that subtree only.
+
+Example::
+
+    import json
+    from atlas_doc_parser.raw_render import raw_to_markdown
+
+    md = raw_to_markdown(json.loads(content))
+
+:func:`raw_extract_text` is the raw counterpart of ``extract_text()``, it
+extracts the plain text without any Markdown syntax.
+"""
+
+import typing as T
+import textwrap
+from datetime import datetime, timezone
+
+from .type_hint import T_DATA
+from .type_enum import TypeEnum
+from .exc import UnimplementedTypeError
+from .telemetry import report_unimplemented_type, doc_scope
+from .markdown_helpers import (
+    strip_double_empty_line,
+    ATLASSIAN_LANG_TO_MARKDOWN_LANG_MAPPING,
+)
+from .text_helpers import INLINE_NODE_TYPES
+from .marks.parse_mark import MARK_TYPE_TO_CLASS_MAPPING
+from .nodes.parse_node import NODE_TYPE_TO_CLASS_MAPPING, parse_node
+from .render_report import record_render_error, record_render_failure
+from .table_grid import TableGrid, raw_cell_spans, escape_table_cell
+
+T_RAW_NODE_RENDERER = T.Callable[[T_DATA, bool, int], str]
+T_RAW_MARK_RENDERER = T.Callable[[str, T_DATA], str]
+
+
+def iter_content(dct: T_DATA) -> T.Iterator[T_DATA]:
+    """
+    Iterate the child node dicts of a raw node, skipping unimplemented node
+    types the same way :meth:`~atlas_doc_parser.mark_or_node.BaseNode.from_dict`
+    does.
+    """
+    content = dct.get("content")
+    if not isinstance(content, list):
+        return
+    for child in content:
+        if child["type"] in NODE_TYPE_TO_CLASS_MAPPING:
+            yield child
+        else:
+            report_unimplemented_type(child["type"], "node")
+
+
+def _fallback(dct: T_DATA, ignore_error: bool = False, level: int = 0) -> str:
+    return parse_node(dct).to_markdown(ignore_error=ignore_error)
+
+
+def render_node(dct: T_DATA, ignore_error: bool = False, level: int = 0) -> str:
+    """
+    Render a raw node dict to Markdown.
+
+    :param dct: The raw ADF node dict.
+    :param ignore_error: Same as the ``ignore_error`` of ``to_markdown()``.
+    :param level: The nesting level, only used by list nodes.
+    """
+    renderer = RAW_NODE_RENDERERS.get(dct.get("type"), _fallback)
+    try:
+        return renderer(dct, ignore_error, level)
+    except Exception as e:
+        record_render_failure(dct, e)
+        raise
+
+
+def raw_to_markdown(dct: T_DATA, ignore_error: bool = False) -> str:
+    """
+    Convert a raw ADF document (or any raw node) to Markdown.
+
+    The result is identical to ``parse_node(dct).to_markdown(ignore_error)``.
+    """
+    if dct["type"] not in NODE_TYPE_TO_CLASS_MAPPING:
+        raise UnimplementedTypeError(dct["type"], "node")
+    with doc_scope():
+        return render_node(dct, ignore_error)
+
+
+# ------------------------------------------------------------------------------
+# Marks
+# ------------------------------------------------------------------------------
+def _render_strong(text: str, dct: T_DATA) -> str:
+    if text.strip():
+        return f"**{text}**"
+    else:
+        return text
+
+
+def _render_em(text: str, dct: T_DATA) -> str:
+    if text.strip():
+        return f"*{text}*"
+    else:
+        return text
+
+
+def _render_strike(text: str, dct: T_DATA) -> str:
+    if text.strip():
+        return f"~~{text}~~"
+    else:
+        return text
+
+
+def _render_code(text: str, dct: T_DATA) -> str:
+    if "\n" in text:
+        raise ValueError(
+            "Code mark cannot contain newlines in markdown representation."
+        )
+    if text.strip():
+        return f"`` {text} ``"
+    else:
+        return text
+
+
+def _render_link(text: str, dct: T_DATA) -> str:
+    attrs = dct["attrs"]
+    title = attrs.get("title")
+    if not isinstance(title, str):
+        title = text
+    return f"[{title}]({attrs['href']})"
+
+
+def _render_indentation(text: str, dct: T_DATA) -> str:
+    return dct["attrs"]["level"] * "\t"
+
+
+RAW_MARK_RENDERERS: dict[str, T_RAW_MARK_RENDERER] = {
+    TypeEnum.strong.value: _render_strong,
+    TypeEnum.em.value: _render_em,
+    TypeEnum.strike.value: _render_strike,
+    TypeEnum.code.value: _render_code,
+    TypeEnum.link.value: _render_link,
+    TypeEnum.indentation.value: _render_indentation,
+}
+"""
+Mark type to raw renderer mapping. Implemented mark types that are missing
+here keep the text unchanged, like :meth:`BaseMark.to_markdown`.
+"""
+
+
+def apply_marks(md: str, dct: T_DATA) -> str:
+    """
+    Raw equivalent of :func:`~atlas_doc_parser.markdown_helpers.add_style_to_markdown`.
+    """
+    marks = dct.get("marks")
+    if not isinstance(marks, list):
+        return md
+    for mark in marks:
+        type_ = mark["type"]
+        try:
+            renderer = RAW_MARK_RENDERERS[type_]
+        except KeyError:
+            if type_ not in MARK_TYPE_TO_CLASS_MAPPING:
+                report_unimplemented_type(type_, "mark")
+            continue
+        md = renderer(md, mark)
+    return md
+
+
+# ------------------------------------------------------------------------------
+# Nodes
+# ------------------------------------------------------------------------------
+def content_to_markdown(dct: T_DATA, ignore_error: bool = False) -> str:
+    """
+    Raw equivalent of :func:`~atlas_doc_parser.markdown_helpers.content_to_markdown`.
+    """
+    lst = []
+    for child in iter_content(dct):
+        try:
+            lst.append(render_node(child))
+        except Exception as e:  # pragma: no cover
+            if ignore_error:
+                record_render_error(child, e)
+            else:
+                raise e
+    return "".join(lst)
+
+
+_PADDED_TYPES = {
+    TypeEnum.bulletList.value,
+    TypeEnum.orderedList.value,
+    TypeEnum.codeBlock.value,
+}
+
+
+def doc_content_to_markdown(dct: T_DATA, ignore_error: bool = False) -> str:
+    """
+    Raw equivalent of :func:`~atlas_doc_parser.markdown_helpers.doc_content_to_markdown`.
+    """
+    lst = []
+    for child in iter_content(dct):
+        try:
+            if child["type"] in _PADDED_TYPES:
+                md = "\n" + render_node(child) + "\n"
+            else:
+                md = render_node(child)
+            lst.append(md)
+        except Exception as e:  # pragma: no cover
+            if ignore_error:
+                record_render_error(child, e)
+            else:
+                raise e
+    return strip_double_empty_line("\n".join(lst))
+
+
+def _render_doc(dct: T_DATA, ignore_error: bool, level: int) -> str:
+    return doc_content_to_markdown(dct, ignore_error)
+
+
+def _render_text(dct: T_DATA, ignore_error: bool, level: int) -> str:
+    return apply_marks(dct["text"], dct)
+
+
+def _render_paragraph(dct: T_DATA, ignore_error: bool, level: int) -> str:
+    return apply_marks(content_to_markdown(dct, ignore_error), dct) + "\n"
+
+
+def _render_heading(dct: T_DATA, ignore_error: bool, level: int) -> str:
+    return (
+        "\n\n"
+        + "{} {}".format(
+            "#" * dct["attrs"]["level"],
+            content_to_markdown(dct, ignore_error),
+        )
+        + "\n\n"
+    )
+
+
+def _render_content(dct: T_DATA, ignore_error: bool, level: int) -> str:
+    return content_to_markdown(dct, ignore_error)
+
+
+def _render_empty(dct: T_DATA, ignore_error: bool, level: int) -> str:
+    return ""
+
+
+def _render_hard_break(dct: T_DATA, ignore_error: bool, level: int) -> str:
+    return "  \n"
+
+
+def _render_rule(dct: T_DATA, ignore_error: bool, level: int) -> str:
+    return "\n\n---\n\n"
+
+
+def _render_mention(dct: T_DATA, ignore_error: bool, level: int) -> str:
+    text = dct["attrs"].get("text")
+    if isinstance(text, str):
+        return text
+    else:
+        return "@Unknown"
+
+
+def _render_emoji(dct: T_DATA, ignore_error: bool, level: int) -> str:
+    attrs = dct["attrs"]
+    if isinstance(attrs.get("text"), str):
+        return attrs["text"]
+    elif isinstance(attrs.get("shortName"), str):
+        return attrs["shortName"]
+    else:
+        raise NotImplementedError
+
+
+def _render_status(dct: T_DATA, ignore_error: bool, level: int) -> str:
+    return f"`{dct['attrs']['text']}`"
+
+
+def _render_date(dct: T_DATA, ignore_error: bool, level: int) -> str:
+    sec = int(dct["attrs"]["timestamp"]) / 1000
+    return str(datetime.fromtimestamp(sec, tz=timezone.utc).date())
+
+
+def _render_inline_card(dct: T_DATA, ignore_error: bool, level: int) -> str:
+    url = dct["attrs"].get("url")
+    if isinstance(url, str):
+        return f"[{url}]({url})"
+    else:
+        raise NotImplementedError
+
+
+def _render_block_card(dct: T_DATA, ignore_error: bool, level: int) -> str:
+    url = dct["attrs"].get("url")
+    if isinstance(url, str):
+        return f"\n[{url}]({url})\n"
+    else:
+        raise NotImplementedError
+
+
+def _render_embed_card(dct: T_DATA, ignore_error: bool, level: int) -> str:
+    url = dct["attrs"]["url"]
+    return f"\n[{url}]({url})\n"
+
+
+def _render_media(dct: T_DATA, ignore_error: bool, level: int) -> str:
+    attrs = dct["attrs"]
+    media_type = attrs["type"]
+    alt = attrs.get("alt")
+    if not isinstance(alt, str):
+        alt = "media"
+    if media_type == "external" and isinstance(attrs.get("url"), str):
+        return apply_marks(f"![{alt}]({attrs['url']})", dct)
+    elif media_type == "file" and "id" in attrs:
+        return apply_marks(f"![{alt}](media:{attrs['id']})", dct)
+    elif media_type == "link":
+        return "[media]"
+    # let the node class handle the unusual cases, including the error
+    return _fallback(dct, ignore_error, level)
+
+
+def _render_code_block(dct: T_DATA, ignore_error: bool, level: int) -> str:
+    code = content_to_markdown(dct, ignore_error)
+    lang = ""
+    attrs = dct.get("attrs")
+    if attrs is not None:
+        language = attrs.get("language")
+        if isinstance(language, str):
+            lang = ATLASSIAN_LANG_TO_MARKDOWN_LANG_MAPPING.get(language, language)
+    if lang == "none":
+        lang = ""
+    return f"```{lang}\n{code}\n```"
+
+
+def _render_blockquote(dct: T_DATA, ignore_error: bool, level: int) -> str:
+    return (
+        textwrap.indent(
+            strip_double_empty_line(doc_content_to_markdown(dct, ignore_error)),
+            prefix="> ",
+            predicate=lambda line: True,
+        )
+        + "\n"
+    )
+
+
+def _render_panel(dct: T_DATA, ignore_error: bool, level: int) -> str:
+    return (
+        textwrap.indent(
+            strip_double_empty_line(
+                "\n".join(
+                    [
+                        f"**{dct['attrs']['panelType'].upper()}**",
+                        "",
+                        doc_content_to_markdown(dct, ignore_error),
+                    ]
+                )
+            ),
+            prefix="> ",
+            predicate=lambda line: True,
+        )
+        + "\n"
+    )
+
+
+def _render_expand(dct: T_DATA, ignore_error: bool, level: int) -> str:
+    return apply_marks(doc_content_to_markdown(dct, ignore_error), dct)
+
+
+def _render_nested_expand(dct: T_DATA, ignore_error: bool, level: int) -> str:
+    return doc_content_to_markdown(dct, ignore_error)
+
+
+def _render_list(
+    dct: T_DATA,
+    ignore_error: bool,
+    level: int,
+    ordered: bool,
+) -> str:
+    lines = []
+    indent = "    " * level
+    list_type = dct["type"]
+    if ordered:
+        if level == 0:
+            if "attrs" not in dct:
+                # same failure as ``self.attrs.order`` on an ``OPT`` attrs
+                raise AttributeError("orderedList has no attrs")
+            order = dct["attrs"].get("order")
+            current_num = order if isinstance(order, int) else 1
+        else:
+            current_num = 1
+    for item in iter_content(dct):
+        if item["type"] != TypeEnum.listItem.value:
+            continue
+        content_lines = []
+        for node in iter_content(item):
+            try:
+                if node["type"] == list_type:
+                    content_lines.append(render_node(node, level=level + 1))
+                else:
+                    content_lines.append(render_node(node).rstrip())
+            except Exception as e:  # pragma: no cover
+                if ignore_error:
+                    record_render_error(node, e)
+                else:
+                    raise e
+        item_lines = "\n".join(content_lines).split("\n")
+        if ordered:
+            lines.append(f"{indent}{current_num}. {item_lines[0]}")
+            current_num += 1
+        else:
+            lines.append(f"{indent}- {item_lines[0]}")
+        lines.extend(item_lines[1:])
+    return "\n".join(lines)
+
+
+def _render_bullet_list(dct: T_DATA, ignore_error: bool, level: int) -> str:
+    return _render_list(dct, ignore_error, level, ordered=False)
+
+
+def _render_ordered_list(dct: T_DATA, ignore_error: bool, level: int) -> str:
+    return _render_list(dct, ignore_error, level, ordered=True)
+
+
+def _render_task_list(dct: T_DATA, ignore_error: bool, level: int) -> str:
+    lines = []
+    indent = "    " * level
+    for item in iter_content(dct):
+        if item["type"] == TypeEnum.taskItem.value:
+            content_parts = []
+            for node in iter_content(item):
+                try:
+                    content_parts.append(render_node(node))
+                except Exception as e:  # pragma: no cover
+                    if ignore_error:
+                        record_render_error(node, e)
+                    else:
+                        raise e
+            item_content = "".join(content_parts).rstrip()
+            checkbox = "[x]" if item["attrs"]["state"] == "DONE" else "[ ]"
+            lines.append(f"{indent}- {checkbox} {item_content}")
+        elif item["type"] == TypeEnum.taskList.value:
+            try:
+                lines.append(render_node(item, ignore_error, level + 1))
+            except Exception as e:  # pragma: no cover
+                if ignore_error:
+                    record_render_error(item, e)
+                else:
+                    raise e
+    return "\n".join(lines)
+
+
+def _render_table(dct: T_DATA, ignore_error: bool, level: int) -> str:
+    rows = list(iter_content(dct))
+    cells = [list(iter_content(row)) for row in rows]
+    grid = TableGrid.from_rows(cells, raw_cell_spans)
+    header = bool(cells) and any(
+        cell["type"] == TypeEnum.tableHeader.value for cell in cells[0]
+    )
+    return grid.to_markdown(
+        render_cell=render_node,
+        header=header,
+        rows=rows,
+        ignore_error=ignore_error,
+    )
+
+
+def _render_table_row(dct: T_DATA, ignore_error: bool, level: int) -> str:
+    cells = [render_node(cell, ignore_error) for cell in iter_content(dct)]
+    return "| " + " | ".join(cells) + " |"
+
+
+def _render_table_cell(dct: T_DATA, ignore_error: bool, level: int) -> str:
+    return escape_table_cell(content_to_markdown(dct, ignore_error))
+
+
+RAW_NODE_RENDERERS: dict[str, T_RAW_NODE_RENDERER] = {
+    TypeEnum.doc.value: _render_doc,
+    TypeEnum.text.value: _render_text,
+    TypeEnum.paragraph.value: _render_paragraph,
+    TypeEnum.heading.value: _render_heading,
+    TypeEnum.listItem.value: _render_content,
+    TypeEnum.taskItem.value: _render_content,
+    TypeEnum.mediaSingle.value: _render_content,
+    TypeEnum.mediaGroup.value: _render_empty,
+    TypeEnum.mediaInline.value: _render_empty,
+    TypeEnum.caption.value: _render_empty,
+    TypeEnum.hardBreak.value: _render_hard_break,
+    TypeEnum.rule.value: _render_rule,
+    TypeEnum.mention.value: _render_mention,
+    TypeEnum.emoji.value: _render_emoji,
+    TypeEnum.status.value: _render_status,
+    TypeEnum.date.value: _render_date,
+    TypeEnum.inlineCard.value: _render_inline_card,
+    TypeEnum.blockCard.value: _render_block_card,
+    TypeEnum.embedCard.value: _render_embed_card,
+    TypeEnum.media.value: _render_media,
+    TypeEnum.codeBlock.value: _render_code_block,
+    TypeEnum.blockquote.value: _render_blockquote,
+    TypeEnum.panel.value: _render_panel,
+    TypeEnum.expand.value: _render_expand,
+    TypeEnum.nestedExpand.value: _render_nested_expand,
+    TypeEnum.bulletList.value: _render_bullet_list,
+    TypeEnum.orderedList.value: _render_ordered_list,
+    TypeEnum.taskList.value: _render_task_list,
+    TypeEnum.table.value: _render_table,
+    TypeEnum.tableRow.value: _render_table_row,
+    TypeEnum.tableCell.value: _render_table_cell,
+    TypeEnum.tableHeader.value: _render_table_cell,
+}
+"""
+Node type to raw renderer mapping. Node types missing here are rendered by
+their node class, see :func:`render_node`.
+"""
+
+
+# ------------------------------------------------------------------------------
+# Plain text
+# ------------------------------------------------------------------------------
+T_RAW_TEXT_EXTRACTOR = T.Callable[[T_DATA, str, str], str]
+
+
+def content_to_text(dct: T_DATA, block_sep: str = "\n", cell_sep: str = "\t") -> str:
+    blocks = list()
+    inline = list()
+    for child in iter_content(dct):
+        text = extract_text(child, block_sep, cell_sep)
+        if child["type"] in INLINE_NODE_TYPES:
+            inline.append(text)
+        else:
+            if inline:
+                blocks.append("".join(inline))
+                inline = list()
+            blocks.append(text)
+    if not blocks:
+        return "".join(inline)
+    if inline:
+        blocks.append("".join(inline))
+    return block_sep.join([block for block in blocks if block])
+
+
+def extract_text(dct: T_DATA, block_sep: str = "\n", cell_sep: str = "\t") -> str:
+    """
+    Extract the plain text of a raw node dict, see
+    :meth:`~atlas_doc_parser.mark_or_node.BaseNode.extract_text`.
+    """
+    try:
+        extractor = RAW_TEXT_EXTRACTORS[dct["type"]]
+    except KeyError:
+        return content_to_text(dct, block_sep, cell_sep)
+    return extractor(dct, block_sep, cell_sep)
+
+
+def raw_extract_text(
+    dct: T_DATA,
+    block_sep: str = "\n",
+    cell_sep: str = "\t",
+) -> str:
+    """
+    Extract the plain text of a raw ADF document (or any raw node).
+
+    The result is identical to ``parse_node(dct).extract_text(block_sep, cell_sep)``.
+    """
+    if dct["type"] not in NODE_TYPE_TO_CLASS_MAPPING:
+        raise UnimplementedTypeError(dct["type"], "node")
+    with doc_scope():
+        return extract_text(dct, block_sep, cell_sep)
+
+
+def _text_of_text(dct: T_DATA, block_sep: str, cell_sep: str) -> str:
+    return dct["text"]
+
+
+def _text_of_mention(dct: T_DATA, block_sep: str, cell_sep: str) -> str:
+    text = dct["attrs"].get("text")
+    if isinstance(text, str):
+        return text
+    else:
+        return ""
+
+
+def _text_of_emoji(dct: T_DATA, block_sep: str, cell_sep: str) -> str:
+    attrs = dct["attrs"]
+    if isinstance(attrs.get("text"), str):
+        return attrs["text"]
+    elif isinstance(attrs.get("shortName"), str):
+        return attrs["shortName"]
+    else:
+        return ""
+
+
+def _text_of_status(dct: T_DATA, block_sep: str, cell_sep: str) -> str:
+    return dct["attrs"]["text"]
+
+
+def _text_of_date(dct: T_DATA, block_sep: str, cell_sep: str) -> str:
+    return _render_date(dct, False, 0)
+
+
+def _text_of_card(dct: T_DATA, block_sep: str, cell_sep: str) -> str:
+    url = dct["attrs"].get("url")
+    if isinstance(url, str):
+        return url
+    else:
+        return ""
+
+
+def _text_of_hard_break(dct: T_DATA, block_sep: str, cell_sep: str) -> str:
+    return block_sep
+
+
+def _text_of_table(dct: T_DATA, block_sep: str, cell_sep: str) -> str:
+    return block_sep.join(
+        [extract_text(row, block_sep, cell_sep) for row in iter_content(dct)]
+    )
+
+
+def _text_of_table_row(dct: T_DATA, block_sep: str, cell_sep: str) -> str:
+    return cell_sep.join(
+        [extract_text(cell, block_sep, cell_sep) for cell in iter_content(dct)]
+    )
+
+
+def _text_of_table_cell(dct: T_DATA, block_sep: str, cell_sep: str) -> str:
+    return content_to_text(dct, " ", cell_sep)
+
+
+RAW_TEXT_EXTRACTORS: dict[str, T_RAW_TEXT_EXTRACTOR] = {
+    TypeEnum.text.value: _text_of_text,
+    TypeEnum.mention.value: _text_of_mention,
+    TypeEnum.emoji.value: _text_of_emoji,
+    TypeEnum.status.value: _text_of_status,
+    TypeEnum.date.value: _text_of_date,
+    TypeEnum.inlineCard.value: _text_of_card,
+    TypeEnum.blockCard.value: _text_of_card,
+    TypeEnum.embedCard.value: _text_of_card,
+    TypeEnum.hardBreak.value: _text_of_hard_break,
+    TypeEnum.table.value: _text_of_table,
+    TypeEnum.tableRow.value: _text_of_table_row,
+    TypeEnum.tableCell.value: _text_of_table_cell,
+    TypeEnum.tableHeader.value: _text_of_table_cell,
+}
+"""
+Node type to raw text extractor mapping. Node types missing here extract the
+text of their ``content``, see :func:`extract_text`.
+"""
@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+
+"""
+Structured report of the nodes dropped by ``to_markdown(ignore_error=True)``.
+
+With ``ignore_error=True`` the renderers silently drop every child node that
+fails to convert. :func:`to_markdown_with_report` renders in the same mode and
+also returns a :class:`RenderReport` that lists the dropped nodes, so the
+content loss can be measured.
+
+The renderers call :func:`record_render_error` from their ``except`` branch
+only. Node objects are rendered by
+:data:`~atlas_doc_parser.renderer.DEFAULT_RENDERER` with every handler wrapped
+to keep the stack of the nodes being rendered, the path of the node that
+raised is taken from this stack, so a node object shared by several parents
+(see :mod:`~atlas_doc_parser.interning`) is reported at the right place. Raw
+dicts are rendered by :func:`~atlas_doc_parser.raw_render.raw_to_markdown`,
+its ``render_node`` calls :func:`record_render_failure` for every node the
+exception goes through, a successful render doesn't pay anything.
+
+Example::
+
+    from atlas_doc_parser.render_report import to_markdown_with_report
+
+    md, report = to_markdown_with_report(NodeDoc.from_dict(data))
+    # or directly on the raw dict
+    md, report = to_markdown_with_report(data)
+    for error in report.errors:
+        print(error.path, error.type, error.error)
+        # content[3].content[0] orderedList AttributeError
+"""
+
+import typing as T
+import contextvars
+import dataclasses
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from .mark_or_node import T_NODE
+    from .type_hint import T_DATA
+
+T_ERRORS = list[tuple[T.Any, BaseException]]
+
+_errors: contextvars.ContextVar[T.Optional[T_ERRORS]] = contextvars.ContextVar(
+    "render_errors", default=None
+)
+# exception id -> (exception, failed raw node dicts, innermost first)
+_failures: contextvars.ContextVar[
+    T.Optional[dict[int, tuple[BaseException, list[T.Any]]]]
+] = contextvars.ContextVar("render_failures", default=None)
+
+# these nodes are not rendered by a handler, their parent renders their
+# children directly
+_INLINED_TYPES = {"listItem", "taskItem", "tableRow"}
+
+
+def record_render_error(node: T.Any, error: BaseException):
+    """
+    Record a node that is dropped because ``to_markdown()`` failed on it.
+
+    It is a no-op unless called inside :func:`to_markdown_with_report`.
+
+    :param node: The dropped node object or raw node dict.
+    :param error: The exception that caused the drop.
+    """
+    errors = _errors.get()
+    if errors is not None:
+        errors.append((node, error))
+
+
+def record_render_failure(node: T.Any, error: BaseException):
+    """
+    Record a node that raised while being rendered, it is called for the
+    node that raised and again for every ancestor the exception goes through.
+
+    It is a no-op unless called inside :func:`to_markdown_with_report`.
+
+    :param node: The raw node dict being rendered.
+    :param error: The exception.
+    """
+    failures = _failures.get()
+    if failures is not None:
+        failures.setdefault(id(error), (error, []))[1].append(node)
+
+
+@dataclasses.dataclass(frozen=True)
+class RenderError:
+    """
+    One dropped node.
+
+    :param path: JMESPath style path of the dropped node from the root,
+        e.g. ``"content[3].content[0]"``. ``None`` if it can't be located.
+    :param type: ADF type of the dropped node.
+    :param error: Class name of the exception.
+    :param origin_path: Path of the innermost node where the exception was
+        raised, it is the dropped node itself or one of its descendants.
+    :param origin_type: ADF type of the innermost node.
+    """
+
+    path: T.Optional[str]
+    type: str
+    error: str
+    origin_path: T.Optional[str]
+    origin_type: T.Optional[str]
+
+    def to_dict(self) -> dict[str, T.Any]:
+        return dataclasses.asdict(self)
+
+
+@dataclasses.dataclass(frozen=True)
+class RenderReport:
+    """
+    Result of :func:`to_markdown_with_report`.
+
+    :param errors: The dropped nodes, in render order.
+    :param lost_nodes: Total number of nodes in the dropped subtrees.
+    """
+
+    errors: list[RenderError] = dataclasses.field(default_factory=list)
+    lost_nodes: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def to_dict(self) -> dict[str, T.Any]:
+        return {
+            "errors": [error.to_dict() for error in self.errors],
+            "lost_nodes": self.lost_nodes,
+        }
+
+
+def _get_type(node: T.Any) -> str:
+    if isinstance(node, dict):
+        return node.get("type")
+    return node.type
+
+
+def _get_content(node: T.Any) -> T.Sequence[T.Any]:
+    if isinstance(node, dict):
+        content = node.get("content")
+    else:
+        content = getattr(node, "content", None)
+    if isinstance(content, (list, tuple)):
+        return content
+    return ()
+
+
+def _iter_children(node: T.Any) -> T.Iterator[tuple[int, T.Any]]:
+    return enumerate(_get_content(node))
+
+
+def _locate(
+    parent: T.Any,
+    child: T.Any,
+    nth: int = 0,
+) -> T.Optional[list[int]]:
+    """
+    Find the content indexes of the ``nth`` occurrence of ``child`` (by
+    identity) under ``parent``, it is a direct child or a child of an
+    inlined node (see ``_INLINED_TYPES``).
+    """
+    for i, node in _iter_children(parent):
+        if node is child:
+            if nth == 0:
+                return [i]
+            nth -= 1
+        elif _get_type(node) in _INLINED_TYPES:
+            for j, sub_node in _iter_children(node):
+                if sub_node is child:
+                    if nth == 0:
+                        return [i, j]
+                    nth -= 1
+    return None
+
+
+def _index(root: T.Any) -> dict[int, list[int]]:
+    """
+    Map ``id(node)`` to the content indexes of its first occurrence in the tree.
+    """
+    index = {id(root): []}
+    stack = [([], root)]
+    while stack:
+        indexes, node = stack.pop()
+        for i, child in _iter_children(node):
+            child_indexes = indexes + [i]
+            index.setdefault(id(child), child_indexes)
+            stack.append((child_indexes, child))
+    return index
+
+
+def _to_path(indexes: T.Optional[list[int]]) -> T.Optional[str]:
+    if indexes is None:
+        return None
+    if not indexes:
+        return "@"
+    return ".".join(f"content[{i}]" for i in indexes)
+
+
+def _count_nodes(node: T.Any) -> int:
+    return 1 + sum(_count_nodes(child) for _, child in _iter_children(node))
+
+
+class _Tracker:
+    """
+    Wrap the node handlers of a renderer to keep the stack of the nodes being
+    rendered and compute the content indexes of the node that raises.
+    """
+
+    def __init__(self):
+        # [node, the children rendered so far in render order]
+        self.frames: list[tuple[T.Any, list[T.Any]]] = list()
+        # exception id -> (exception, content indexes of the innermost node)
+        self.origins: dict[int, tuple[BaseException, list[int]]] = dict()
+
+    def wrap(self, handler: T.Callable) -> T.Callable:
+        frames = self.frames
+
+        def tracked(r, node, ignore_error, level):
+            if frames:
+                frames[-1][1].append(node)
+            frames.append((node, []))
+            try:
+                return handler(r, node, ignore_error, level)
+            except Exception as e:
+                if id(e) not in self.origins:
+                    self.origins[id(e)] = (e, self._indexes())
+                raise
+            finally:
+                frames.pop()
+
+        return tracked
+
+    def _indexes(self) -> list[int]:
+        """
+        The children are rendered once each in document order, the n-th
+        render of a node object in a parent is its n-th occurrence there.
+        """
+        indexes = list()
+        for (parent, rendered), (child, _) in zip(self.frames, self.frames[1:]):
+            nth = sum(1 for node in rendered if node is child) - 1
+            child_indexes = _locate(parent, child, nth)
+            if child_indexes is None:  # pragma: no cover
+                break
+            indexes.extend(child_indexes)
+        return indexes
+
+
+def _walk(root: T.Any, indexes: list[int]) -> list[T.Any]:
+    """
+    The nodes on the path, from the root down.
+    """
+    nodes = [root]
+    for i in indexes:
+        nodes.append(_get_content(nodes[-1])[i])
+    return nodes
+
+
+def _chain_indexes(
+    dropped: T.Any,
+    failed: list[T.Any],
+) -> list[int]:
+    """
+    Content indexes from the dropped node down to the innermost failed raw
+    node dict.
+    """
+    indexes = list()
+    parent = dropped
+    for node in reversed(failed):
+        if node is parent:
+            continue
+        child_indexes = _locate(parent, node)
+        if child_indexes is None:
+            break
+        indexes.extend(child_indexes)
+        parent = node
+    return indexes
+
+
+def to_markdown_with_report(
+    node: T.Union["T_NODE", "T_DATA"],
+) -> tuple[str, RenderReport]:
+    """
+    Render with ``ignore_error=True`` and report the dropped nodes.
+
+    :param node: A node object, or a raw node dict (rendered by
+        :func:`~atlas_doc_parser.raw_render.raw_to_markdown`). A raw node
+        dict used at several places of the raw data is reported at its first
+        place.
+    :return: The Markdown and the :class:`RenderReport`.
+    """
+    errors = list()
+    failures = dict()
+    tracker = _Tracker()
+    errors_token = _errors.set(errors)
+    failures_token = _failures.set(failures)
+    try:
+        if isinstance(node, dict):
+            from .raw_render import raw_to_markdown
+
+            md = raw_to_markdown(node, ignore_error=True)
+        else:
+            from .renderer import MarkdownRenderer, DEFAULT_RENDERER
+
+            renderer = MarkdownRenderer(
+                node_handlers={
+                    type_: tracker.wrap(handler)
+                    for type_, handler in DEFAULT_RENDERER.node_handlers.items()
+                }
+            )
+            md = renderer.render(node, ignore_error=True)
+    finally:
+        _errors.reset(errors_token)
+        _failures.reset(failures_token)
+
+    if not errors:
+        return md, RenderReport()
+
+    index = _index(node) if isinstance(node, dict) else None
+    render_errors = list()
+    lost_nodes = 0
+    for dropped, error in errors:
+        indexes, origin_indexes = None, None
+        if index is not None:
+            indexes = index.get(id(dropped))
+            if indexes is not None and id(error) in failures:
+                origin_indexes = indexes + _chain_indexes(
+                    dropped, failures[id(error)][1]
+                )
+        elif id(error) in tracker.origins:
+            origin_indexes = tracker.origins[id(error)][1]
+            # the dropped node is on the path of the innermost node, a node
+            # can't be its own ancestor so the match is unique
+            for i, path_node in enumerate(_walk(node, origin_indexes)):
+                if path_node is dropped:
+                    indexes = origin_indexes[:i]
+                    break
+        if origin_indexes is None:
+            origin_type = None
+        else:
+            origin_type = _get_type(_walk(node, origin_indexes)[-1])
+        render_errors.append(
+            RenderError(
+                path=_to_path(indexes),
+                type=_get_type(dropped),
+                error=type(error).__name__,
+                origin_path=_to_path(origin_indexes),
+                origin_type=origin_type,
+            )
+        )
+        lost_nodes += _count_nodes(dropped)
+    return md, RenderReport(errors=render_errors, lost_nodes=lost_nodes)
@@ -0,0 +1,593 @@
+# -*- coding: utf-8 -*-
+
+"""
+Render node objects to Markdown through a dispatch table.
+
+The Markdown rules of the node types are the handlers of this module.
+A :class:`MarkdownRenderer` holds a type to handler table, computed once in
+the constructor, and walks the tree by looking up the handler of each node.
+``node.to_markdown()`` renders with :data:`DEFAULT_RENDERER`, so the built-in
+output is one renderer among others. Any handler can be replaced per
+renderer::
+
+    from atlas_doc_parser.renderer import MarkdownRenderer, render_nothing
+
+    def render_extension(renderer, node, ignore_error, level):
+        return f"<!-- macro: {node.attrs.extensionKey} -->"
+
+    renderer = MarkdownRenderer(
+        node_handlers={
+            "media": render_nothing,
+            "extension": render_extension,
+        },
+    )
+    md = renderer.render(NodeDoc.from_dict(data))
+
+    # or derive it from the default renderer
+    renderer = DEFAULT_RENDERER.with_handlers(node_handlers={"media": render_nothing})
+
+Every implemented node type has a handler in :data:`NODE_HANDLERS`, the
+children are always rendered through the renderer, so a replaced handler
+applies at any depth. The marks are styled by their mark class unless a
+handler is given.
+
+A node handler is called as ``handler(renderer, node, ignore_error, level)``,
+``level`` is the nesting level of lists. A mark handler is called as
+``handler(text, mark)`` and returns the styled text.
+"""
+
+import typing as T
+import textwrap
+from datetime import datetime, timezone
+
+from func_args.api import OPT
+
+from .type_enum import TypeEnum
+from .markdown_helpers import (
+    strip_double_empty_line,
+    ATLASSIAN_LANG_TO_MARKDOWN_LANG_MAPPING,
+)
+from .marks.parse_mark import MARK_TYPE_TO_CLASS_MAPPING
+from .render_report import record_render_error
+from .table_grid import TableGrid, node_cell_spans, escape_table_cell
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from .mark_or_node import T_NODE, BaseMark
+
+T_NODE_HANDLER = T.Callable[["MarkdownRenderer", "T_NODE", bool, int], str]
+T_MARK_HANDLER = T.Callable[[str, "BaseMark"], str]
+
+
+class MarkdownRenderer:
+    """
+    Render node objects to Markdown with a type to handler table.
+
+    :param node_handlers: Node type to handler, merged over
+        :data:`NODE_HANDLERS`. Use :func:`render_nothing` to drop a type.
+    :param mark_handlers: Mark type to handler, merged over
+        :data:`MARK_HANDLERS`.
+    """
+
+    def __init__(
+        self,
+        node_handlers: T.Optional[dict[str, T_NODE_HANDLER]] = None,
+        mark_handlers: T.Optional[dict[str, T_MARK_HANDLER]] = None,
+    ):
+        self._node_handler_overrides = dict(node_handlers or {})
+        self._mark_handler_overrides = dict(mark_handlers or {})
+        # every implemented type has an entry, the lookup never misses
+        self.node_handlers: dict[str, T_NODE_HANDLER] = dict(NODE_HANDLERS)
+        self.node_handlers.update(self._node_handler_overrides)
+        self.mark_handlers: dict[str, T_MARK_HANDLER] = {
+            type_: _style_by_class for type_ in MARK_TYPE_TO_CLASS_MAPPING
+        }
+        self.mark_handlers.update(MARK_HANDLERS)
+        self.mark_handlers.update(self._mark_handler_overrides)
+
+    def with_handlers(
+        self,
+        node_handlers: T.Optional[dict[str, T_NODE_HANDLER]] = None,
+        mark_handlers: T.Optional[dict[str, T_MARK_HANDLER]] = None,
+    ) -> "MarkdownRenderer":
+        """
+        Create a new renderer with more handlers replaced, this one is not
+        changed.
+        """
+        return self.__class__(
+            node_handlers={**self._node_handler_overrides, **(node_handlers or {})},
+            mark_handlers={**self._mark_handler_overrides, **(mark_handlers or {})},
+        )
+
+    def render(
+        self,
+        node: "T_NODE",
+        ignore_error: bool = False,
+        level: int = 0,
+    ) -> str:
+        """
+        Render a node to Markdown.
+
+        :param node: Any node object, usually a ``NodeDoc``.
+        :param ignore_error: Same as the ``ignore_error`` of ``to_markdown()``.
+        :param level: The nesting level, only used by list nodes.
+        """
+        return self.node_handlers[node.type](self, node, ignore_error, level)
+
+    def iter_children(self, content: list["T_NODE"]) -> T.Iterable["T_NODE"]:
+        """
+        The child nodes to render, in order. Subclasses override it to stop
+        early, see :class:`~atlas_doc_parser.preview.PreviewRenderer`.
+        """
+        return content
+
+    def apply_marks(self, md: str, node: "T_NODE") -> str:
+        """
+        Apply the marks of the node to the Markdown, in order. A node
+        without marks is returned unchanged.
+        """
+        marks = getattr(node, "marks", None)
+        if isinstance(marks, list):
+            mark_handlers = self.mark_handlers
+            for mark in marks:
+                md = mark_handlers[mark.type](md, mark)
+        return md
+
+    def render_children(
+        self,
+        content: T.Union[list["T_NODE"], T.Literal[OPT]],
+        ignore_error: bool = False,
+    ) -> list[str]:
+        """
+        Render each child node, the children that fail with
+        ``ignore_error=True`` are left out.
+        """
+        if content is OPT:
+            return []
+        node_handlers = self.node_handlers
+        lst = []
+        for node in self.iter_children(content):
+            try:
+                lst.append(node_handlers[node.type](self, node, False, 0))
+            except Exception as e:  # pragma: no cover
+                if ignore_error:
+                    record_render_error(node, e)
+                else:
+                    raise e
+        return lst
+
+    def render_content(
+        self,
+        content: T.Union[list["T_NODE"], T.Literal[OPT]],
+        ignore_error: bool = False,
+    ) -> str:
+        """
+        Concatenate the Markdown of the inline child nodes.
+        """
+        return "".join(self.render_children(content, ignore_error))
+
+    def render_block_list(
+        self,
+        content: T.Union[list["T_NODE"], T.Literal[OPT]],
+        ignore_error: bool = False,
+    ) -> list[str]:
+        """
+        Render each block child node, the blocks that fail with
+        ``ignore_error=True`` are left out. Lists and code blocks get a blank
+        line before and after, some Markdown renderers need it to see them
+        as separate blocks.
+
+        The blocks can be rendered in separate groups and the lists
+        concatenated, see :mod:`~atlas_doc_parser.parallel`.
+        """
+        if content is OPT:
+            return []
+        node_handlers = self.node_handlers
+        lst = []
+        for node in self.iter_children(content):
+            try:
+                type_ = node.type
+                md = node_handlers[type_](self, node, False, 0)
+                if type_ in _PADDED_TYPES:
+                    md = "\n" + md + "\n"
+                lst.append(md)
+            except Exception as e:  # pragma: no cover
+                if ignore_error:
+                    record_render_error(node, e)
+                else:
+                    raise e
+        return lst
+
+    def render_blocks(
+        self,
+        content: T.Union[list["T_NODE"], T.Literal[OPT]],
+        ignore_error: bool = False,
+    ) -> str:
+        """
+        Join the Markdown of the block child nodes by newlines, with at most
+        one empty line in a row.
+        """
+        return strip_double_empty_line(
+            "\n".join(self.render_block_list(content, ignore_error))
+        )
+
+
+# ------------------------------------------------------------------------------
+# Marks
+# ------------------------------------------------------------------------------
+def _style_by_class(text: str, mark: "BaseMark") -> str:
+    return mark.to_markdown(text)
+
+
+MARK_HANDLERS: dict[str, T_MARK_HANDLER] = {}
+"""
+Mark type to default handler mapping. The mark types that are missing here
+are styled by their mark class, with ``mark.to_markdown(text)``.
+"""
+
+
+# ------------------------------------------------------------------------------
+# Nodes
+# ------------------------------------------------------------------------------
+_PADDED_TYPES = {
+    TypeEnum.bulletList.value,
+    TypeEnum.orderedList.value,
+    TypeEnum.codeBlock.value,
+}
+
+
+def render_nothing(
+    renderer: MarkdownRenderer,
+    node: "T_NODE",
+    ignore_error: bool,
+    level: int,
+) -> str:
+    """
+    Drop the node.
+    """
+    return ""
+
+
+def _render_blocks(r, node, ignore_error: bool, level: int) -> str:
+    return r.render_blocks(node.content, ignore_error)
+
+
+def _render_content(r, node, ignore_error: bool, level: int) -> str:
+    return r.render_content(node.content, ignore_error)
+
+
+def _render_text(r, node, ignore_error: bool, level: int) -> str:
+    return r.apply_marks(node.text, node)
+
+
+def _render_paragraph(r, node, ignore_error: bool, level: int) -> str:
+    return r.apply_marks(r.render_content(node.content, ignore_error), node) + "\n"
+
+
+def _render_heading(r, node, ignore_error: bool, level: int) -> str:
+    return (
+        "\n\n"
+        + "{} {}".format(
+            "#" * node.attrs.level,
+            r.render_content(node.content, ignore_error),
+        )
+        + "\n\n"
+    )
+
+
+def _render_hard_break(r, node, ignore_error: bool, level: int) -> str:
+    return "  \n"
+
+
+def _render_rule(r, node, ignore_error: bool, level: int) -> str:
+    return "\n\n---\n\n"
+
+
+def _render_mention(r, node, ignore_error: bool, level: int) -> str:
+    text = node.attrs.text
+    if isinstance(text, str):
+        return text
+    else:
+        return "@Unknown"
+
+
+def _render_status(r, node, ignore_error: bool, level: int) -> str:
+    return f"`{node.attrs.text}`"
+
+
+def _render_date(r, node, ignore_error: bool, level: int) -> str:
+    sec = int(node.attrs.timestamp) / 1000
+    return str(datetime.fromtimestamp(sec, tz=timezone.utc).date())
+
+
+def _render_emoji(r, node, ignore_error: bool, level: int) -> str:
+    # the text representation if available, otherwise the short name
+    attrs = node.attrs
+    if isinstance(attrs.text, str):
+        return attrs.text
+    elif isinstance(attrs.shortName, str):
+        return attrs.shortName
+    else:
+        raise NotImplementedError
+
+
+def _render_inline_card(r, node, ignore_error: bool, level: int) -> str:
+    url = node.attrs.url
+    if isinstance(url, str):
+        return f"[{url}]({url})"
+    else:
+        raise NotImplementedError
+
+
+def _render_block_card(r, node, ignore_error: bool, level: int) -> str:
+    url = node.attrs.url
+    if isinstance(url, str):
+        return f"\n[{url}]({url})\n"
+    else:
+        raise NotImplementedError
+
+
+def _render_embed_card(r, node, ignore_error: bool, level: int) -> str:
+    url = node.attrs.url
+    return f"\n[{url}]({url})\n"
+
+
+def _render_extension(r, node, ignore_error: bool, level: int) -> str:
+    # extensions have no standard Markdown, a placeholder with the key
+    attrs = node.attrs
+    if isinstance(attrs.text, str) and attrs.text:
+        return f"[Extension: {attrs.extensionKey}] {attrs.text}"
+    return f"[Extension: {attrs.extensionType}/{attrs.extensionKey}]"
+
+
+def _render_media(r, node, ignore_error: bool, level: int) -> str:
+    attrs = node.attrs
+    alt = attrs.alt if isinstance(attrs.alt, str) else "media"
+    if attrs.is_external_type() and isinstance(attrs.url, str):
+        return r.apply_marks(f"![{alt}]({attrs.url})", node)
+    elif attrs.is_file_type():
+        return r.apply_marks(f"![{alt}](media:{attrs.id})", node)
+    elif attrs.is_link_type():
+        return "[media]"
+    else:
+        raise TypeError("Invalid media node attributes")
+
+
+def _render_code_block(r, node, ignore_error: bool, level: int) -> str:
+    code = r.render_content(node.content, ignore_error)
+    lang = ""
+    if node.attrs is not OPT:
+        language = node.attrs.language
+        if isinstance(language, str):
+            lang = ATLASSIAN_LANG_TO_MARKDOWN_LANG_MAPPING.get(language, language)
+    if lang == "none":
+        lang = ""
+    return f"```{lang}\n{code}\n```"
+
+
+def _quote(md: str) -> str:
+    return textwrap.indent(md, prefix="> ", predicate=lambda line: True) + "\n"
+
+
+def _render_blockquote(r, node, ignore_error: bool, level: int) -> str:
+    return _quote(strip_double_empty_line(r.render_blocks(node.content, ignore_error)))
+
+
+def _render_panel(r, node, ignore_error: bool, level: int) -> str:
+    return _quote(
+        strip_double_empty_line(
+            "\n".join(
+                [
+                    f"**{node.attrs.panelType.upper()}**",
+                    "",
+                    r.render_blocks(node.content, ignore_error),
+                ]
+            )
+        )
+    )
+
+
+def _render_expand(r, node, ignore_error: bool, level: int) -> str:
+    # the title is not kept, a nested expand is rendered like its content
+    return r.apply_marks(r.render_blocks(node.content, ignore_error), node)
+
+
+def _render_decision_list(r, node, ignore_error: bool, level: int) -> str:
+    blocks = []
+    for item in r.iter_children(node.content):
+        if item.type == TypeEnum.decisionItem.value:
+            try:
+                blocks.append(r.render(item, ignore_error))
+            except Exception as e:  # pragma: no cover
+                if ignore_error:
+                    record_render_error(item, e)
+                else:
+                    raise e
+    return "\n\n".join(blocks)
+
+
+def _render_decision_item(r, node, ignore_error: bool, level: int) -> str:
+    # every line is quoted with ``>``, the empty lines right after the first
+    # line (the decision title) are skipped and consecutive empty lines are
+    # collapsed
+    lines = []
+    line_count = 0
+    prev_was_empty = False
+    for line in r.render_content(node.content, ignore_error).rstrip().split("\n"):
+        line = line.rstrip()
+        if not line:
+            if line_count <= 1 or prev_was_empty:
+                continue
+            lines.append(">")
+            prev_was_empty = True
+        else:
+            lines.append(f"> {line}")
+            line_count += 1
+            prev_was_empty = False
+    return "\n".join(lines)
+
+
+def _render_list(r, node, ignore_error: bool, level: int, ordered: bool) -> str:
+    """
+    Render a ``bulletList`` or an ``orderedList``. A nested list is a child
+    of a ``listItem``, next to the paragraphs of the item::
+
+        bulletList
+        ├── listItem
+        │   ├── paragraph
+        │   └── bulletList (nested, level + 1)
+        │       └── listItem
+        └── listItem
+
+    The first line of an item gets the bullet or the number, the other lines
+    follow as is, a nested list is indented by 4 spaces per level.
+    """
+    lines = []
+    indent = "    " * level
+    list_type = node.type
+    if ordered:
+        # numbering starts from attrs.order at the top level only
+        order = node.attrs.order if level == 0 else None
+        current_num = order if isinstance(order, int) else 1
+    node_handlers = r.node_handlers
+    list_item = TypeEnum.listItem.value
+    for item in r.iter_children(node.content):
+        if item.type != list_item:
+            continue
+        content_lines = []
+        for child in r.iter_children(item.content):
+            try:
+                if child.type == list_type:
+                    md = node_handlers[list_type](r, child, False, level + 1)
+                else:
+                    md = node_handlers[child.type](r, child, False, 0).rstrip()
+                content_lines.append(md)
+            except Exception as e:  # pragma: no cover
+                if ignore_error:
+                    record_render_error(child, e)
+                else:
+                    raise e
+        item_lines = "\n".join(content_lines).split("\n")
+        if ordered:
+            lines.append(f"{indent}{current_num}. {item_lines[0]}")
+            current_num += 1
+        else:
+            lines.append(f"{indent}- {item_lines[0]}")
+        lines.extend(item_lines[1:])
+    return "\n".join(lines)
+
+
+def _render_bullet_list(r, node, ignore_error: bool, level: int) -> str:
+    return _render_list(r, node, ignore_error, level, ordered=False)
+
+
+def _render_ordered_list(r, node, ignore_error: bool, level: int) -> str:
+    return _render_list(r, node, ignore_error, level, ordered=True)
+
+
+def _render_task_list(r, node, ignore_error: bool, level: int) -> str:
+    """
+    Render a ``taskList``. Unlike the other lists, a nested ``taskList`` is a
+    sibling of the ``taskItem`` nodes, and the inline nodes are directly in
+    the ``taskItem``::
+
+        taskList
+        ├── taskItem → text nodes
+        ├── taskList (nested, level + 1)
+        │   └── taskItem
+        └── taskItem
+    """
+    lines = []
+    indent = "    " * level
+    node_handlers = r.node_handlers
+    for item in r.iter_children(node.content):
+        if item.type == TypeEnum.taskItem.value:
+            content_parts = []
+            for child in r.iter_children(item.content):
+                try:
+                    content_parts.append(node_handlers[child.type](r, child, False, 0))
+                except Exception as e:  # pragma: no cover
+                    if ignore_error:
+                        record_render_error(child, e)
+                    else:
+                        raise e
+            item_content = "".join(content_parts).rstrip()
+            checkbox = "[x]" if item.attrs.state == "DONE" else "[ ]"
+            lines.append(f"{indent}- {checkbox} {item_content}")
+        elif item.type == TypeEnum.taskList.value:
+            try:
+                lines.append(node_handlers[item.type](r, item, ignore_error, level + 1))
+            except Exception as e:  # pragma: no cover
+                if ignore_error:
+                    record_render_error(item, e)
+                else:
+                    raise e
+    return "\n".join(lines)
+
+
+def _render_table(r, node, ignore_error: bool, level: int) -> str:
+    grid = TableGrid.from_rows(
+        [row.content for row in node.content],
+        node_cell_spans,
+    )
+    return grid.to_markdown(
+        render_cell=r.render,
+        header=node.has_header_row(),
+        rows=node.content,
+        ignore_error=ignore_error,
+    )
+
+
+def _render_table_row(r, node, ignore_error: bool, level: int) -> str:
+    cells = [r.render(cell, ignore_error) for cell in r.iter_children(node.content)]
+    return "| " + " | ".join(cells) + " |"
+
+
+def _render_table_cell(r, node, ignore_error: bool, level: int) -> str:
+    return escape_table_cell(r.render_content(node.content, ignore_error))
+
+
+NODE_HANDLERS: dict[str, T_NODE_HANDLER] = {
+    TypeEnum.doc.value: _render_blocks,
+    TypeEnum.text.value: _render_text,
+    TypeEnum.paragraph.value: _render_paragraph,
+    TypeEnum.heading.value: _render_heading,
+    TypeEnum.listItem.value: _render_content,
+    TypeEnum.taskItem.value: _render_content,
+    TypeEnum.mediaSingle.value: _render_content,
+    TypeEnum.mediaGroup.value: render_nothing,
+    TypeEnum.mediaInline.value: render_nothing,
+    TypeEnum.caption.value: render_nothing,
+    TypeEnum.hardBreak.value: _render_hard_break,
+    TypeEnum.rule.value: _render_rule,
+    TypeEnum.mention.value: _render_mention,
+    TypeEnum.status.value: _render_status,
+    TypeEnum.date.value: _render_date,
+    TypeEnum.emoji.value: _render_emoji,
+    TypeEnum.inlineCard.value: _render_inline_card,
+    TypeEnum.blockCard.value: _render_block_card,
+    TypeEnum.embedCard.value: _render_embed_card,
+    TypeEnum.extension.value: _render_extension,
+    TypeEnum.media.value: _render_media,
+    TypeEnum.codeBlock.value: _render_code_block,
+    TypeEnum.blockquote.value: _render_blockquote,
+    TypeEnum.panel.value: _render_panel,
+    TypeEnum.expand.value: _render_expand,
+    TypeEnum.decisionList.value: _render_decision_list,
+    TypeEnum.decisionItem.value: _render_decision_item,
+    TypeEnum.nestedExpand.value: _render_blocks,
+    TypeEnum.bulletList.value: _render_bullet_list,
+    TypeEnum.orderedList.value: _render_ordered_list,
+    TypeEnum.taskList.value: _render_task_list,
+    TypeEnum.table.value: _render_table,
+    TypeEnum.tableRow.value: _render_table_row,
+    TypeEnum.tableCell.value: _render_table_cell,
+    TypeEnum.tableHeader.value: _render_table_cell,
+}
+"""
+Node type to default handler mapping, every implemented node type has one.
+"""
+
+DEFAULT_RENDERER = MarkdownRenderer()
+"""
+The built-in Markdown output, used by ``node.to_markdown()``.
+"""
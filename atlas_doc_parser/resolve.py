@@ -0,0 +1,440 @@
+# -*- coding: utf-8 -*-
+
+"""
+Resolve the mentions, media and smart links of documents in bulk before
+rendering.
+
+A ``mention`` only holds an account id (and maybe a stale display name), a
+file ``media`` a media id, a smart link card a bare URL. Looking them up one
+by one while rendering costs one API call per reference. Resolution is done
+in three steps instead:
+
+1. :func:`collect_references` gathers the distinct account ids, media ids and
+   card URLs of a document or a batch of documents, in one traversal each
+   (see :func:`~atlas_doc_parser.links.extract_edges`),
+2. :func:`resolve_references` calls each bulk method of the user's
+   :class:`BaseResolver` at most once, with the ids missing from the
+   optional :class:`ResolverCache`,
+3. a :class:`ResolvingRenderer` renders with the resolved values: the
+   display name of a mention, the download URL of a media, the title of a
+   card. An unresolved reference is rendered as usual. The containers of
+   the default renderer all render their children through the renderer,
+   so a reference is resolved however deep it is nested.
+
+:func:`render_resolved` does the three steps for a batch::
+
+    from atlas_doc_parser.resolve import BaseResolver, ResolverCache, render_resolved
+
+    class JiraResolver(BaseResolver):
+        def resolve_users(self, ids):
+            return {user["accountId"]: user["displayName"] for user in bulk_get_users(ids)}
+
+    cache = ResolverCache(ttl=3600, maxsize=100_000)
+    md_list = render_resolved(docs, JiraResolver(), cache=cache)
+
+:class:`InMemoryResolver` resolves from dicts and counts the calls, it is a
+stand-in for tests and examples.
+"""
+
+import typing as T
+import time
+import threading
+import dataclasses
+
+from .type_enum import TypeEnum
+from .links import extract_edges
+from .renderer import (
+    MarkdownRenderer,
+    T_NODE_HANDLER,
+    T_MARK_HANDLER,
+    NODE_HANDLERS,
+)
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from .mark_or_node import T_NODE
+
+DEFAULT_TTL = 3600
+"""
+Default time to live of a :class:`ResolverCache` entry, in seconds.
+"""
+
+DEFAULT_MAXSIZE = 100_000
+"""
+Default max number of entries of a :class:`ResolverCache`.
+"""
+
+KIND_USER = "user"
+KIND_MEDIA = "media"
+KIND_URL = "url"
+
+#: (edge type, edge attr) -> reference kind
+_EDGE_KINDS: dict[tuple[str, str], str] = {
+    (TypeEnum.mention.value, "id"): KIND_USER,
+    (TypeEnum.media.value, "id"): KIND_MEDIA,
+    (TypeEnum.mediaInline.value, "id"): KIND_MEDIA,
+    (TypeEnum.inlineCard.value, "url"): KIND_URL,
+    (TypeEnum.blockCard.value, "url"): KIND_URL,
+    (TypeEnum.embedCard.value, "url"): KIND_URL,
+}
+
+
+class BaseResolver:
+    """
+    Bulk lookups of the references of a document, subclass it and override
+    the methods you need. Each method receives the distinct keys of a whole
+    batch and returns the resolved ones, a missing key is left unresolved.
+    The default methods resolve nothing.
+    """
+
+    def resolve_users(self, ids: list[str]) -> dict[str, str]:
+        """
+        Account id to display name, for ``mention`` nodes.
+        """
+        return {}
+
+    def resolve_media(self, ids: list[str]) -> dict[str, str]:
+        """
+        Media id to URL, for ``mediaInline`` nodes and ``media`` nodes of
+        the ``file`` type.
+        """
+        return {}
+
+    def resolve_urls(self, urls: list[str]) -> dict[str, str]:
+        """
+        URL to title, for ``inlineCard``, ``blockCard`` and ``embedCard``
+        nodes.
+        """
+        return {}
+
+
+class InMemoryResolver(BaseResolver):
+    """
+    A resolver backed by dicts, for tests. :attr:`calls` records the
+    ``(kind, keys)`` of every call.
+    """
+
+    def __init__(
+        self,
+        users: T.Optional[dict[str, str]] = None,
+        media: T.Optional[dict[str, str]] = None,
+        urls: T.Optional[dict[str, str]] = None,
+    ):
+        self.users = dict(users or {})
+        self.media = dict(media or {})
+        self.urls = dict(urls or {})
+        self.calls: list[tuple[str, list[str]]] = []
+
+    def _resolve(self, kind: str, table: dict[str, str], keys: list[str]):
+        self.calls.append((kind, list(keys)))
+        return {key: table[key] for key in keys if key in table}
+
+    def resolve_users(self, ids: list[str]) -> dict[str, str]:
+        return self._resolve(KIND_USER, self.users, ids)
+
+    def resolve_media(self, ids: list[str]) -> dict[str, str]:
+        return self._resolve(KIND_MEDIA, self.media, ids)
+
+    def resolve_urls(self, urls: list[str]) -> dict[str, str]:
+        return self._resolve(KIND_URL, self.urls, urls)
+
+
+class ResolverCache:
+    """
+    A bounded cache of resolved references with a time to live, the least
+    recently used entries are evicted first. Unresolved keys are cached too,
+    so a missing user is not looked up again before the entry expires.
+
+    :param ttl: Time to live of an entry, in seconds.
+    :param maxsize: Max number of entries, all kinds together.
+    :param clock: Returns the current time in seconds, ``time.monotonic``
+        by default.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        maxsize: int = DEFAULT_MAXSIZE,
+        clock: T.Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        # (kind, key) -> (value or None, expiration time)
+        self._entries: dict[tuple[str, str], tuple[T.Optional[str], float]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_many(
+        self,
+        kind: str,
+        keys: T.Iterable[str],
+    ) -> tuple[dict[str, T.Optional[str]], list[str]]:
+        """
+        Look up keys of one kind.
+
+        :return: The cached values (``None`` for a cached unresolved key), and
+            the keys that are missing or expired.
+        """
+        found, missing = {}, []
+        now = self.clock()
+        entries = self._entries
+        with self._lock:
+            for key in keys:
+                entry = entries.pop((kind, key), None)
+                if entry is None or entry[1] <= now:
+                    missing.append(key)
+                    self.misses += 1
+                else:
+                    # re-insert, the dict order is the recency order
+                    entries[(kind, key)] = entry
+                    found[key] = entry[0]
+                    self.hits += 1
+        return found, missing
+
+    def set_many(self, kind: str, values: dict[str, T.Optional[str]]):
+        """
+        Store the values of one kind, ``None`` for an unresolved key.
+        """
+        expires_at = self.clock() + self.ttl
+        entries = self._entries
+        with self._lock:
+            for key, value in values.items():
+                entries.pop((kind, key), None)
+                entries[(kind, key)] = (value, expires_at)
+            while len(entries) > self.maxsize:
+                del entries[next(iter(entries))]
+
+    def clear(self):
+        """
+        Remove all entries and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+@dataclasses.dataclass
+class References:
+    """
+    The distinct references of one or many documents, in document order.
+
+    :param users: Account ids of ``mention`` nodes.
+    :param media: Ids of ``media`` and ``mediaInline`` nodes.
+    :param urls: URLs of ``inlineCard``, ``blockCard`` and ``embedCard``
+        nodes.
+    """
+
+    users: list[str] = dataclasses.field(default_factory=list)
+    media: list[str] = dataclasses.field(default_factory=list)
+    urls: list[str] = dataclasses.field(default_factory=list)
+
+
+@dataclasses.dataclass
+class Resolved:
+    """
+    The resolved values, keyed by account id, media id and URL. Unresolved
+    keys are absent.
+    """
+
+    users: dict[str, str] = dataclasses.field(default_factory=dict)
+    media: dict[str, str] = dataclasses.field(default_factory=dict)
+    urls: dict[str, str] = dataclasses.field(default_factory=dict)
+
+
+def collect_references(
+    roots: T.Iterable[T.Union["T_NODE", dict]],
+) -> References:
+    """
+    Collect the distinct references of many documents, node objects or raw
+    dicts.
+    """
+    keys: dict[str, dict[str, None]] = {
+        KIND_USER: {},
+        KIND_MEDIA: {},
+        KIND_URL: {},
+    }
+    edge_kinds = _EDGE_KINDS
+    for root in roots:
+        for edge in extract_edges(root):
+            kind = edge_kinds.get((edge.type, edge.attr))
+            if kind is not None:
+                keys[kind][edge.target] = None
+    return References(
+        users=list(keys[KIND_USER]),
+        media=list(keys[KIND_MEDIA]),
+        urls=list(keys[KIND_URL]),
+    )
+
+
+def _resolve_kind(
+    kind: str,
+    keys: list[str],
+    method: T.Callable[[list[str]], dict[str, str]],
+    cache: T.Optional[ResolverCache],
+) -> dict[str, str]:
+    if cache is None:
+        found, missing = {}, keys
+    else:
+        found, missing = cache.get_many(kind, keys)
+    if missing:
+        results = method(missing)
+        values = {key: results.get(key) for key in missing}
+        if cache is not None:
+            cache.set_many(kind, values)
+        found.update(values)
+    return {key: value for key, value in found.items() if value is not None}
+
+
+def resolve_references(
+    refs: References,
+    resolver: BaseResolver,
+    cache: T.Optional[ResolverCache] = None,
+) -> Resolved:
+    """
+    Resolve the references, with at most one call per bulk method of the
+    resolver, for the keys that are not in the cache.
+    """
+    return Resolved(
+        users=_resolve_kind(KIND_USER, refs.users, resolver.resolve_users, cache),
+        media=_resolve_kind(KIND_MEDIA, refs.media, resolver.resolve_media, cache),
+        urls=_resolve_kind(KIND_URL, refs.urls, resolver.resolve_urls, cache),
+    )
+
+
+class ResolvingRenderer(MarkdownRenderer):
+    """
+    A :class:`~atlas_doc_parser.renderer.MarkdownRenderer` that renders the
+    resolved references:
+
+    - a ``mention`` as ``@`` and the display name,
+    - a ``file`` ``media`` as an image with the resolved URL,
+    - a ``mediaInline`` as a link to the resolved URL, an image if its type
+      is ``image``, it is dropped if unresolved, like in the default output,
+    - a card as a link with the resolved title.
+
+    :param resolved: See :func:`resolve_references`.
+    :param node_handlers: See :class:`~atlas_doc_parser.renderer.MarkdownRenderer`.
+    :param mark_handlers: See :class:`~atlas_doc_parser.renderer.MarkdownRenderer`.
+    """
+
+    def __init__(
+        self,
+        resolved: Resolved,
+        node_handlers: T.Optional[dict[str, T_NODE_HANDLER]] = None,
+        mark_handlers: T.Optional[dict[str, T_MARK_HANDLER]] = None,
+    ):
+        super().__init__(
+            node_handlers={**RESOLVING_NODE_HANDLERS, **(node_handlers or {})},
+            mark_handlers=mark_handlers,
+        )
+        # the resolving handlers are not overrides of with_handlers()
+        self._node_handler_overrides = dict(node_handlers or {})
+        self.resolved = resolved
+
+    def with_handlers(
+        self,
+        node_handlers: T.Optional[dict[str, T_NODE_HANDLER]] = None,
+        mark_handlers: T.Optional[dict[str, T_MARK_HANDLER]] = None,
+    ) -> "ResolvingRenderer":
+        """
+        Create a new renderer with the same resolved values and more handlers
+        replaced.
+        """
+        return self.__class__(
+            resolved=self.resolved,
+            node_handlers={**self._node_handler_overrides, **(node_handlers or {})},
+            mark_handlers={**self._mark_handler_overrides, **(mark_handlers or {})},
+        )
+
+
+def _resolve_mention(r: ResolvingRenderer, node, ignore_error: bool, level: int) -> str:
+    name = r.resolved.users.get(node.attrs.id)
+    if name is None:
+        return NODE_HANDLERS[TypeEnum.mention.value](r, node, ignore_error, level)
+    return f"@{name}"
+
+
+def _resolve_media(r: ResolvingRenderer, node, ignore_error: bool, level: int) -> str:
+    attrs = node.attrs
+    if attrs.is_file_type():
+        url = r.resolved.media.get(attrs.id)
+        if url is not None:
+            alt = attrs.alt if isinstance(attrs.alt, str) else "media"
+            return r.apply_marks(f"![{alt}]({url})", node)
+    return NODE_HANDLERS[TypeEnum.media.value](r, node, ignore_error, level)
+
+
+def _resolve_media_inline(r: ResolvingRenderer, node, ignore_error: bool, level: int) -> str:
+    attrs = node.attrs
+    url = r.resolved.media.get(attrs.id)
+    if url is None:
+        return NODE_HANDLERS[TypeEnum.mediaInline.value](r, node, ignore_error, level)
+    alt = attrs.alt if isinstance(attrs.alt, str) else "media"
+    # an inline image is shown, an inline file is a link to it
+    prefix = "!" if attrs.type == "image" else ""
+    return r.apply_marks(f"{prefix}[{alt}]({url})", node)
+
+
+def _resolve_inline_card(r: ResolvingRenderer, node, ignore_error: bool, level: int) -> str:
+    title = r.resolved.urls.get(node.attrs.url)
+    if title is None:
+        return NODE_HANDLERS[TypeEnum.inlineCard.value](r, node, ignore_error, level)
+    return f"[{title}]({node.attrs.url})"
+
+
+def _resolve_block_card(r: ResolvingRenderer, node, ignore_error: bool, level: int) -> str:
+    title = r.resolved.urls.get(node.attrs.url)
+    if title is None:
+        return NODE_HANDLERS[TypeEnum.blockCard.value](r, node, ignore_error, level)
+    return f"\n[{title}]({node.attrs.url})\n"
+
+
+RESOLVING_NODE_HANDLERS: dict[str, T_NODE_HANDLER] = {
+    TypeEnum.mention.value: _resolve_mention,
+    TypeEnum.media.value: _resolve_media,
+    TypeEnum.mediaInline.value: _resolve_media_inline,
+    TypeEnum.inlineCard.value: _resolve_inline_card,
+    TypeEnum.blockCard.value: _resolve_block_card,
+    TypeEnum.embedCard.value: _resolve_block_card,
+}
+"""
+Node type to handler mapping of :class:`ResolvingRenderer`, over the
+handlers of :class:`~atlas_doc_parser.renderer.MarkdownRenderer`.
+"""
+
+
+def render_resolved(
+    nodes: T.Iterable["T_NODE"],
+    resolver: BaseResolver,
+    cache: T.Optional[ResolverCache] = None,
+    ignore_error: bool = False,
+    node_handlers: T.Optional[dict[str, T_NODE_HANDLER]] = None,
+    mark_handlers: T.Optional[dict[str, T_MARK_HANDLER]] = None,
+) -> list[str]:
+    """
+    Render a batch of nodes to Markdown, with the references of the whole
+    batch resolved first, see the module docstring.
+
+    :param nodes: Node objects, usually ``NodeDoc`` objects.
+    :param resolver: The bulk lookups.
+    :param cache: If given, only the keys missing from it are looked up, and
+        the results are stored in it.
+    :param ignore_error: Same as the ``ignore_error`` of ``to_markdown()``.
+    :param node_handlers: See :class:`~atlas_doc_parser.renderer.MarkdownRenderer`.
+    :param mark_handlers: See :class:`~atlas_doc_parser.renderer.MarkdownRenderer`.
+
+    :return: The Markdown of each node, in input order.
+    """
+    nodes = list(nodes)
+    resolved = resolve_references(collect_references(nodes), resolver, cache)
+    renderer = ResolvingRenderer(
+        resolved,
+        node_handlers=node_handlers,
+        mark_handlers=mark_handlers,
+    )
+    return [renderer.render(node, ignore_error=ignore_error) for node in nodes]
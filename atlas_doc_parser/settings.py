@@ -15,10 +15,51 @@ Example::
 
     # Now parse without warnings
     doc = NodeDoc.from_dict(data)
+
+Module-level settings are process wide, set them once at startup. To change
+a setting for one thread or one asyncio task only (for example in a
+``ThreadPoolExecutor``), use the context manager instead, it doesn't touch
+any shared state::
+
+    with settings.warn_unimplemented_type(False):
+        doc = NodeDoc.from_dict(data)
 """
 
+import typing as T
+import contextlib
+import contextvars
+
 # Whether to log warnings when encountering unimplemented node/mark types.
 # When True (default), a warning will be logged to help users identify
-# which types need to be implemented.
+# which types need to be implemented. The warning is logged once per type,
+# all occurrences are counted by ``atlas_doc_parser.telemetry``.
 # When False, unimplemented types are silently skipped.
 WARN_UNIMPLEMENTED_TYPE: bool = True
+
+_warn_unimplemented_type: contextvars.ContextVar[T.Optional[bool]] = (
+    contextvars.ContextVar("warn_unimplemented_type", default=None)
+)
+
+
+def is_warn_unimplemented_type() -> bool:
+    """
+    Return the effective ``WARN_UNIMPLEMENTED_TYPE`` setting, the value set by
+    :func:`warn_unimplemented_type` in the current context takes precedence
+    over the module-level setting.
+    """
+    flag = _warn_unimplemented_type.get()
+    if flag is None:
+        return WARN_UNIMPLEMENTED_TYPE
+    return flag
+
+
+@contextlib.contextmanager
+def warn_unimplemented_type(flag: bool):
+    """
+    Override ``WARN_UNIMPLEMENTED_TYPE`` in the current thread / asyncio task.
+    """
+    token = _warn_unimplemented_type.set(flag)
+    try:
+        yield
+    finally:
+        _warn_unimplemented_type.reset(token)
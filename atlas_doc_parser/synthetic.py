@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+
+"""
+Seeded synthetic ADF documents for scale and soak testing.
+
+The generator is driven by the ADF JSON schema, through the content model
+of the dataclasses that were generated from it
+(:mod:`~atlas_doc_parser.content_model`): only allowed children and marks
+are generated, required attributes are always generated, ``Literal``
+attributes pick one of the allowed values.
+
+So the generated documents follow the same content model as the parser, and
+only implemented node and mark types are generated.
+
+The size and the shape are controlled by:
+
+- ``n_nodes``: the number of nodes, the generator stops adding top level
+  blocks once it is reached (the last block may overshoot a little).
+- ``max_depth``: the max nesting depth of nodes below ``doc``.
+- ``table_rows`` and ``table_cols``: the table dimensions.
+- ``mark_density``: the probability that a node gets marks.
+
+Example::
+
+    from atlas_doc_parser.synthetic import DocGenerator, write_jsonl
+
+    gen = DocGenerator(seed=1, n_nodes=500, max_depth=6)
+    data = gen.generate()
+    NodeDoc.from_dict(data).to_markdown()
+
+    # about 80 bytes per node, 100 docs of 10_000 nodes is about 80 MB
+    write_jsonl("corpus.jsonl", n_docs=100, seed=1, n_nodes=10_000)
+"""
+
+import typing as T
+import json
+import random
+import itertools
+from pathlib import Path
+
+from .type_hint import T_DATA
+from .nodes.parse_node import NODE_TYPE_TO_CLASS_MAPPING
+from .content_model import TypeSpec, build_specs
+
+T_RANGE = T.Union[int, tuple[int, int]]
+
+WORDS = (
+    "the quick brown fox jumps over lazy dog lorem ipsum dolor sit amet "
+    "consectetur adipiscing elit sed do eiusmod tempor incididunt ut labore "
+    "et dolore magna aliqua deploy service cluster request latency cache"
+).split()
+
+#: Node types that are never generated by default. ``extension`` is
+#: rendered by the host application, there is nothing realistic to generate.
+DEFAULT_EXCLUDE = frozenset({"extension"})
+
+# Attributes that are optional in the schema, but required by the
+# semantic of the node, e.g. an internal ``media`` needs ``id`` and
+# ``collection``.
+_EXTRA_ATTRS = {
+    "media": ("id", "collection", "url"),
+    "mediaInline": ("type",),
+    "inlineCard": ("url",),
+    "blockCard": ("url",),
+    "emoji": ("text",),
+    "mention": ("text",),
+    "orderedList": ("order",),
+    "codeBlock": ("language",),
+    "expand": ("title",),
+    "nestedExpand": ("title",),
+}
+
+# Relative frequency of the block and inline types, the other types have
+# weight 1. Real documents are mostly paragraphs and text.
+_WEIGHTS = {
+    "paragraph": 12,
+    "text": 40,
+    "heading": 3,
+    "bulletList": 3,
+    "orderedList": 2,
+    "listItem": 1,
+    "table": 1,
+}
+
+# Max number of children of a node, if the content model is stricter than
+# the schema type. ``mediaSingle`` has exactly one ``media``.
+_MAX_CHILDREN = {
+    "mediaSingle": 1,
+}
+
+
+def _min_depths(specs: dict[str, TypeSpec], node_types: T.Iterable[str]):
+    """
+    Number of nesting levels needed below each node type to end the subtree,
+    e.g. 0 for ``text``, 1 for ``paragraph``, 3 for ``bulletList``.
+    """
+    node_types = set(node_types)
+    depths = {t: 0 for t in node_types if not specs[t].is_container}
+    changed = True
+    while changed:
+        changed = False
+        for t in node_types:
+            candidates = [depths[c] for c in specs[t].children if c in depths]
+            if candidates:
+                depth = 1 + min(candidates)
+                if depths.get(t, depth + 1) > depth:
+                    depths[t] = depth
+                    changed = True
+    return depths
+
+
+def _to_range(value: T_RANGE) -> tuple[int, int]:
+    if isinstance(value, int):
+        return value, value
+    return value
+
+
+class DocGenerator:
+    """
+    Generate random but valid ADF documents, reproducible by ``seed``.
+
+    :param seed: The random seed, same seed and parameters give the same
+        documents.
+    :param n_nodes: The target number of nodes per document.
+    :param max_depth: Max nesting depth of nodes below ``doc``, a
+        ``bulletList`` needs 3 levels, a ``table`` needs 4.
+    :param max_children: Max number of children of a block node.
+    :param table_rows: Number of rows of a table, an int or a
+        ``(min, max)`` range.
+    :param table_cols: Number of columns of a table, an int or a
+        ``(min, max)`` range.
+    :param mark_density: Probability for a node to get marks, 0 to 1.
+    :param exclude: Node types to never generate.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        n_nodes: int = 200,
+        max_depth: int = 6,
+        max_children: int = 4,
+        table_rows: T_RANGE = (2, 6),
+        table_cols: T_RANGE = (2, 4),
+        mark_density: float = 0.3,
+        exclude: T.Iterable[str] = DEFAULT_EXCLUDE,
+    ):
+        if n_nodes < 1:
+            raise ValueError(f"n_nodes must be >= 1, got {n_nodes}")
+        self.random = random.Random(seed)
+        self.n_nodes = n_nodes
+        self.max_depth = max_depth
+        self.max_children = max_children
+        self.table_rows = _to_range(table_rows)
+        self.table_cols = _to_range(table_cols)
+        self.mark_density = mark_density
+        self.exclude = frozenset(exclude)
+        self.specs = build_specs()
+        self.node_types = [
+            t
+            for t in NODE_TYPE_TO_CLASS_MAPPING
+            if t not in self.exclude and t != "doc"
+        ]
+        self.min_depths = _min_depths(self.specs, self.node_types)
+        self._children = {
+            t: [c for c in spec.children if c in self.min_depths]
+            for t, spec in self.specs.items()
+        }
+        self._fits_cache: dict[tuple[str, int], tuple[list[str], list[int]]] = {}
+        self._remaining = 0
+
+    # --------------------------------------------------------------------------
+    # Values
+    # --------------------------------------------------------------------------
+    def words(self, n: int) -> str:
+        return " ".join(self.random.choices(WORDS, k=n))
+
+    def local_id(self) -> str:
+        return f"{self.random.getrandbits(64):016x}"
+
+    def _str_value(self, name: str) -> str:
+        r = self.random
+        if name in ("localId", "id", "uniqueId", "collection"):
+            return self.local_id()
+        if name in ("url", "href"):
+            return f"https://example.com/{r.choice(WORDS)}/{r.randint(1, 9999)}"
+        if name == "timestamp":
+            # milliseconds since epoch, 2001 to 2033
+            return str(r.randint(1_000_000_000, 2_000_000_000) * 1000)
+        if name == "color":
+            return f"#{r.getrandbits(24):06x}"
+        if name == "shortName":
+            return f":{r.choice(WORDS)}:"
+        if name == "language":
+            return r.choice(["python", "java", "sql", "bash", "json"])
+        return self.words(r.randint(1, 3))
+
+    def _attr_value(self, name: str, annotation: T.Any) -> T.Any:
+        if T.get_origin(annotation) is T.Literal:
+            return self.random.choice(T.get_args(annotation))
+        if annotation is str:
+            return self._str_value(name)
+        if annotation is bool:
+            return self.random.random() < 0.5
+        if annotation is int:
+            return self.random.randint(1, 6)
+        if annotation is float:
+            return float(self.random.randint(100, 800))
+        raise NotImplementedError  # pragma: no cover
+
+    def attrs(self, type_value: str) -> dict[str, T.Any]:
+        extra = _EXTRA_ATTRS.get(type_value, ())
+        attrs = {}
+        for name, annotation, required in self.specs[type_value].attrs:
+            if required or name in extra:
+                attrs[name] = self._attr_value(name, annotation)
+        if type_value == "media" and attrs["type"] != "external":
+            del attrs["url"]
+        return attrs
+
+    def marks(self, type_value: str) -> list[dict[str, T.Any]]:
+        allowed = self.specs[type_value].marks
+        k = 1 if type_value != "text" else self.random.randint(1, 3)
+        marks = []
+        for mark_type in self.random.sample(allowed, min(k, len(allowed))):
+            mark = {"type": mark_type}
+            if self.specs[mark_type].attrs_required:
+                mark["attrs"] = self.attrs(mark_type)
+            marks.append(mark)
+        return marks
+
+    # --------------------------------------------------------------------------
+    # Nodes
+    # --------------------------------------------------------------------------
+    def _fits(self, parent: str, budget: int) -> tuple[list[str], list[int]]:
+        """
+        The child types of ``parent`` whose subtree needs at most ``budget``
+        levels, and their cumulated weights.
+        """
+        key = (parent, budget)
+        try:
+            return self._fits_cache[key]
+        except KeyError:
+            pass
+        children = self._children[parent]
+        fits = [c for c in children if self.min_depths[c] <= budget]
+        if not fits:
+            # the depth limit is too low for the content model, overshoot
+            # as little as possible
+            low = min(self.min_depths[c] for c in children)
+            fits = [c for c in children if self.min_depths[c] == low]
+        cum_weights = list(itertools.accumulate(_WEIGHTS.get(c, 1) for c in fits))
+        self._fits_cache[key] = fits, cum_weights
+        return fits, cum_weights
+
+    def _pick_child(self, parent: str, depth: int) -> str:
+        """
+        Pick a child type of ``parent`` whose subtree fits below ``depth``.
+        """
+        fits, cum_weights = self._fits(parent, self.max_depth - depth - 1)
+        if len(fits) == 1:
+            return fits[0]
+        return self.random.choices(fits, cum_weights=cum_weights)[0]
+
+    def node(self, type_value: str, depth: int, marks: bool = True) -> T_DATA:
+        """
+        Generate one node of ``type_value`` at nesting level ``depth``.
+        """
+        self._remaining -= 1
+        spec = self.specs[type_value]
+        dct = {"type": type_value}
+        if type_value == "text":
+            dct["text"] = self.words(self.random.randint(1, 8))
+        if spec.attrs and (spec.attrs_required or type_value in _EXTRA_ATTRS):
+            dct["attrs"] = self.attrs(type_value)
+        if type_value == "table":
+            dct["content"] = self._table_rows(depth)
+        elif self._children[type_value]:
+            content = self._content(type_value, depth)
+            if content or spec.content_required:
+                dct["content"] = content
+        if marks and spec.marks and self.random.random() < self.mark_density:
+            dct["marks"] = self.marks(type_value)
+        return dct
+
+    def _content(self, type_value: str, depth: int) -> list[T_DATA]:
+        children = self._children[type_value]
+        is_inline = "text" in children
+        n = self.random.randint(
+            1, _MAX_CHILDREN.get(type_value, 6 if is_inline else self.max_children)
+        )
+        # code block text must not have marks
+        marks = type_value != "codeBlock"
+        content = [self.node(self._pick_child(type_value, depth), depth + 1, marks)]
+        for _ in range(n - 1):
+            if self._remaining <= 0:
+                break
+            content.append(
+                self.node(self._pick_child(type_value, depth), depth + 1, marks)
+            )
+        return content
+
+    def _table_rows(self, depth: int) -> list[T_DATA]:
+        n_rows = self.random.randint(*self.table_rows)
+        n_cols = self.random.randint(*self.table_cols)
+        has_header = self.random.random() < 0.5
+        rows = []
+        for i in range(n_rows):
+            self._remaining -= 1
+            cell_type = "tableHeader" if has_header and i == 0 else "tableCell"
+            rows.append(
+                {
+                    "type": "tableRow",
+                    "content": [
+                        self.node(cell_type, depth + 2) for _ in range(n_cols)
+                    ],
+                }
+            )
+        return rows
+
+    def generate(self) -> T_DATA:
+        """
+        Generate one ``doc`` node dict.
+        """
+        self._remaining = self.n_nodes - 1
+        content = []
+        while self._remaining > 0:
+            content.append(self.node(self._pick_child("doc", 0), 1))
+        if not content:
+            content.append(self.node("paragraph", 1))
+        return {"type": "doc", "version": 1, "content": content}
+
+    def __iter__(self) -> T.Iterator[T_DATA]:
+        while True:
+            yield self.generate()
+
+
+def make_doc(seed: int = 0, **kwargs) -> T_DATA:
+    """
+    Generate one document, see :class:`DocGenerator` for the parameters.
+    """
+    return DocGenerator(seed=seed, **kwargs).generate()
+
+
+def write_jsonl(
+    path: T.Union[str, Path],
+    n_docs: int,
+    seed: int = 0,
+    **kwargs,
+) -> int:
+    """
+    Write ``n_docs`` generated documents to a JSONL file, one document per
+    line, in compact JSON.
+
+    :param path: The output file path.
+    :param n_docs: Number of documents.
+    :param seed: The random seed.
+    :param kwargs: Other parameters of :class:`DocGenerator`.
+    :return: Number of bytes written.
+    """
+    gen = DocGenerator(seed=seed, **kwargs)
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    n_bytes = 0
+    with open(path, "w", encoding="utf-8", buffering=1024 * 1024) as f:
+        for _ in range(n_docs):
+            line = dumps(gen.generate()) + "\n"
+            f.write(line)
+            n_bytes += len(line.encode("utf-8"))
+    return n_bytes
@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+
+"""
+Normalize an ADF table into a rectangular grid, and render it as Markdown.
+
+An ADF table is a list of rows of cells, a cell may span several columns
+(``colspan``) and rows (``rowspan``), and the rows may have different
+lengths. Markdown tables have no spans, so the table is first normalized,
+in one pass over the cells, into a :class:`TableGrid`:
+
+- a cell with ``colspan=n`` / ``rowspan=m`` covers ``n x m`` slots, the top
+  left slot is its origin, the other slots are covered by it,
+- a ``rowspan`` reaching past the last row is clipped,
+- short rows are padded with empty slots, so all rows have ``n_cols`` slots.
+
+The Markdown is then rendered in time linear to the output: each cell is
+converted once, covered and empty slots are rendered as empty cells.
+
+The engine works on node objects and on raw dicts, the caller provides how
+to get the spans of a cell.
+"""
+
+import typing as T
+import re
+import dataclasses
+
+from .render_report import record_render_error
+
+T_CELL = T.TypeVar("T_CELL")
+
+_RE_LEADING_SPACES = re.compile(r"^ +", re.MULTILINE)
+
+
+def _leading_spaces_to_nbsp(match: re.Match) -> str:
+    return "&nbsp;" * len(match.group())
+
+
+def escape_table_cell(md: str) -> str:
+    """
+    Make the Markdown of a cell fit on one table line.
+
+    - ``|`` is escaped,
+    - leading spaces of each line become ``&nbsp;``, HTML collapses spaces
+      after ``<br>``, this keeps the indentation of nested lists,
+    - lines are joined by ``<br>``.
+    """
+    if "|" in md:
+        md = md.replace("|", "\\|")
+    # leading spaces are rare, check before running the regex
+    if md.startswith(" ") or "\n " in md:
+        md = _RE_LEADING_SPACES.sub(_leading_spaces_to_nbsp, md)
+    if "\n" in md:
+        md = md.replace("\n", "<br>")
+    return md
+
+
+_NO_SPAN = (1, 1)
+
+
+def _span(value: T.Any) -> int:
+    if isinstance(value, int) and value > 1:
+        return value
+    return 1
+
+
+def node_cell_spans(cell: T.Any) -> tuple[int, int]:
+    """
+    ``(colspan, rowspan)`` of a ``tableCell`` / ``tableHeader`` node object.
+    """
+    return attrs_cell_spans(cell.attrs)
+
+
+def attrs_cell_spans(attrs: T.Any) -> tuple[int, int]:
+    """
+    ``(colspan, rowspan)`` from the attrs object of a ``tableCell`` /
+    ``tableHeader`` node, ``OPT`` if the cell has no attrs.
+    """
+    try:
+        colspan, rowspan = attrs.colspan, attrs.rowspan
+    except AttributeError:  # attrs is OPT
+        return _NO_SPAN
+    if colspan == 1 and rowspan == 1:
+        return _NO_SPAN
+    return _span(colspan), _span(rowspan)
+
+
+def raw_cell_spans(cell: dict) -> tuple[int, int]:
+    """
+    ``(colspan, rowspan)`` of a raw ``tableCell`` / ``tableHeader`` dict.
+    """
+    attrs = cell.get("attrs")
+    if not attrs:
+        return _NO_SPAN
+    colspan, rowspan = attrs.get("colspan"), attrs.get("rowspan")
+    if colspan == 1 and rowspan == 1:
+        return _NO_SPAN
+    return _span(colspan), _span(rowspan)
+
+
+def iter_grid_rows(
+    rows: T.Iterable[T.Iterable[T_CELL]],
+    get_spans: T.Callable[[T_CELL], tuple[int, int]],
+) -> T.Iterator[tuple[list[T.Optional[T_CELL]], list[bool], bool]]:
+    """
+    Normalize the rows of cells into grid rows, lazily, one row at a time.
+
+    Only the spans reaching into the next rows are kept between two rows, so
+    the memory is bounded by the width of the table. The rows are not padded
+    to the width of the widest row, see :meth:`TableGrid.from_rows`.
+
+    :param rows: The cells of each row.
+    :param get_spans: Return ``(colspan, rowspan)`` of a cell.
+    :return: ``(slots, origins, plain)`` of each row, see :class:`TableGrid`.
+    """
+    # per column, the cell spanning down from a row above, and the number
+    # of rows it still covers
+    carry_cells: list[T.Optional[T_CELL]] = []
+    carry_rows: list[int] = []
+    n_carried = 0  # number of columns with carry_rows > 0
+    for cells in rows:
+        slots, origins = [], []
+        plain = True
+        col = 0
+        for cell in cells:
+            colspan, rowspan = get_spans(cell)
+            if colspan == 1 and rowspan == 1 and not n_carried:
+                # fast path, nothing spans into or out of this slot
+                slots.append(cell)
+                origins.append(True)
+                col += 1
+                continue
+            plain = False
+            # skip the slots covered from the rows above
+            while col < len(carry_rows) and carry_rows[col]:
+                slots.append(carry_cells[col])
+                origins.append(False)
+                carry_rows[col] -= 1
+                if not carry_rows[col]:
+                    n_carried -= 1
+                col += 1
+            end = col + colspan
+            if end > len(carry_rows):
+                carry_cells.extend([None] * (end - len(carry_rows)))
+                carry_rows.extend([0] * (end - len(carry_rows)))
+            for c in range(col, end):
+                slots.append(cell)
+                origins.append(c == col)
+                # overlapping spans (invalid table), the last cell wins
+                n_carried += (rowspan > 1) - (carry_rows[c] > 0)
+                carry_cells[c] = cell
+                carry_rows[c] = rowspan - 1
+            col = end
+        # the slots after the last cell of this row
+        if col < len(carry_rows):
+            plain = False
+        for c in range(col, len(carry_rows)):
+            if carry_rows[c]:
+                slots.append(carry_cells[c])
+                origins.append(False)
+                carry_rows[c] -= 1
+                if not carry_rows[c]:
+                    n_carried -= 1
+            else:
+                slots.append(None)
+                origins.append(True)
+        yield slots, origins, plain
+
+
+def iter_row_texts(
+    rows: T.Iterable[T.Iterable[T_CELL]],
+    get_spans: T.Callable[[T_CELL], tuple[int, int]],
+    get_text: T.Callable[[T_CELL], str],
+    fill_spans: bool = True,
+) -> T.Iterator[list[str]]:
+    """
+    Yield the plain text of the slots of each grid row, lazily.
+
+    The text of a cell is extracted once, only the previous row is kept to
+    fill the slots covered by a ``rowspan``.
+
+    :param rows: The cells of each row.
+    :param get_spans: Return ``(colspan, rowspan)`` of a cell.
+    :param get_text: Return the plain text of a cell.
+    :param fill_spans: If True, the slots covered by a span repeat the text
+        of the spanning cell, else they are empty.
+    """
+    prev_slots, prev_texts = [], []
+    for slots, origins, plain in iter_grid_rows(rows, get_spans):
+        if plain:
+            texts = [get_text(cell) for cell in slots]
+        else:
+            texts = []
+            for j, (cell, origin) in enumerate(zip(slots, origins)):
+                if cell is None or not (origin or fill_spans):
+                    texts.append("")
+                elif origin:
+                    texts.append(get_text(cell))
+                elif j < len(prev_slots) and prev_slots[j] is cell:
+                    texts.append(prev_texts[j])  # covered by a rowspan
+                else:
+                    texts.append(texts[j - 1])  # covered by a colspan
+        yield texts
+        prev_slots, prev_texts = slots, texts
+
+
+def make_column_names(texts: T.Iterable[str]) -> list[str]:
+    """
+    Make unique column names from the texts of the header row, an empty
+    name becomes ``column_{n}``, a duplicate name gets a ``_{n}`` suffix.
+    """
+    names, seen = [], set()
+    for i, text in enumerate(texts, start=1):
+        name = text or f"column_{i}"
+        if name in seen:
+            k = 2
+            while f"{name}_{k}" in seen:
+                k += 1
+            name = f"{name}_{k}"
+        seen.add(name)
+        names.append(name)
+    return names
+
+
+@dataclasses.dataclass
+class TableGrid(T.Generic[T_CELL]):
+    """
+    A table normalized into ``n_rows x n_cols`` slots.
+
+    :param slots: ``slots[i][j]`` is the cell covering the slot at row ``i``
+        and column ``j``, ``None`` if no cell covers it.
+    :param origins: ``origins[i][j]`` is True if the slot is the top left
+        slot of its cell.
+    :param n_cols: Number of columns.
+    :param plain: ``plain[i]`` is True if every slot of row ``i`` is the
+        origin of a cell, the common case, it is rendered without looking at
+        ``origins``.
+    """
+
+    slots: list[list[T.Optional[T_CELL]]]
+    origins: list[list[bool]]
+    n_cols: int
+    plain: list[bool]
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.slots)
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: T.Iterable[T.Iterable[T_CELL]],
+        get_spans: T.Callable[[T_CELL], tuple[int, int]],
+    ) -> "TableGrid[T_CELL]":
+        """
+        Normalize the rows of cells into a grid, in one pass, see
+        :func:`iter_grid_rows`.
+
+        :param rows: The cells of each row.
+        :param get_spans: Return ``(colspan, rowspan)`` of a cell.
+        """
+        all_slots, all_origins, all_plain = [], [], []
+        n_cols = 0
+        for slots, origins, plain in iter_grid_rows(rows, get_spans):
+            all_slots.append(slots)
+            all_origins.append(origins)
+            all_plain.append(plain)
+            n_cols = max(n_cols, len(slots))
+        # pad the rows created before a later row widened the table
+        for i, (slots, origins) in enumerate(zip(all_slots, all_origins)):
+            if len(slots) < n_cols:
+                pad = n_cols - len(slots)
+                slots.extend([None] * pad)
+                origins.extend([True] * pad)
+                all_plain[i] = False
+        return cls(
+            slots=all_slots,
+            origins=all_origins,
+            n_cols=n_cols,
+            plain=all_plain,
+        )
+
+    def to_markdown(
+        self,
+        render_cell: T.Callable[[T_CELL], str],
+        header: bool,
+        rows: T.Optional[T.Sequence[T.Any]] = None,
+        ignore_error: bool = False,
+    ) -> str:
+        """
+        Render the grid as a Markdown table.
+
+        :param render_cell: Return the Markdown of a cell, already escaped
+            for a table line. It is called once per cell.
+        :param header: Whether the first row is a header row.
+        :param rows: The row objects, if given, a row that fails to render
+            is reported with :func:`~atlas_doc_parser.render_report.record_render_error`
+            when ``ignore_error`` is True.
+        :param ignore_error: Skip the rows that fail to render.
+        """
+        lines = []
+        for i, slots in enumerate(self.slots):
+            try:
+                if self.plain[i]:
+                    cells = list(map(render_cell, slots))
+                else:
+                    cells = [
+                        "" if cell is None or not origin else render_cell(cell)
+                        for cell, origin in zip(slots, self.origins[i])
+                    ]
+                lines.append("| " + " | ".join(cells) + " |")
+                if i == 0 and header:
+                    lines.append("| " + " | ".join(["---"] * self.n_cols) + " |")
+            except Exception as e:  # pragma: no cover
+                if ignore_error:
+                    record_render_error(rows[i] if rows else None, e)
+                else:
+                    raise e
+        return "\n".join(lines)
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+"""
+Aggregated telemetry for unimplemented node and mark types.
+
+Unimplemented types are skipped during parsing and rendering. Instead of
+logging one warning per skipped element, every occurrence is reported to this
+module, which:
+
+- counts the occurrences per type, and the number of documents containing it,
+- logs the warning only once per type per process (if
+  :func:`~atlas_doc_parser.settings.is_warn_unimplemented_type` is on),
+- provides :func:`get_stats` and :func:`summary` to query the counters at
+  runtime, and :func:`reset` to start over.
+
+A "document" is one call of ``NodeDoc.from_dict``,
+:func:`~atlas_doc_parser.raw_render.raw_to_markdown`,
+:func:`~atlas_doc_parser.raw_render.raw_extract_text` or
+:meth:`~atlas_doc_parser.arena.ArenaDoc.from_dict`.
+
+Example::
+
+    from atlas_doc_parser import telemetry
+
+    for data in batch:
+        NodeDoc.from_dict(data).to_markdown()
+    print(telemetry.summary())
+    # node 'bodiedExtension': 12,345 occurrences in 800 docs
+    # node 'layoutSection': 2,010 occurrences in 523 docs
+"""
+
+import typing as T
+import threading
+import contextlib
+import contextvars
+import dataclasses
+
+from .exc import UnimplementedTypeError
+from .logger import logger
+
+from . import settings
+
+T_KEY = tuple[str, str]  # (category, type_value)
+
+_lock = threading.Lock()
+_occurrences: dict[T_KEY, int] = {}
+_docs: dict[T_KEY, int] = {}
+_warned: set[T_KEY] = set()
+# types seen in the document being parsed in the current thread / task
+_doc_types: contextvars.ContextVar[T.Optional[set[T_KEY]]] = contextvars.ContextVar(
+    "doc_types", default=None
+)
+
+
+def report_unimplemented_type(type_value: str, category: str):
+    """
+    Report one skipped element of an unimplemented type.
+
+    :param type_value: The ADF type string, e.g. ``"bodiedExtension"``.
+    :param category: Either ``"node"`` or ``"mark"``.
+    """
+    key = (category, type_value)
+    warn = settings.is_warn_unimplemented_type()
+    with _lock:
+        _occurrences[key] = _occurrences.get(key, 0) + 1
+        if warn:
+            if key in _warned:
+                warn = False
+            else:
+                _warned.add(key)
+    doc_types = _doc_types.get()
+    if doc_types is not None:
+        doc_types.add(key)
+    if warn:
+        logger.warning(
+            f"{UnimplementedTypeError(type_value, category)} "
+            f"Further occurrences are not logged, "
+            f"see ``atlas_doc_parser.telemetry.summary()``."
+        )
+
+
+@contextlib.contextmanager
+def doc_scope():
+    """
+    Count the unimplemented types reported inside this context as one document.
+
+    Nested scopes are merged into the outermost one.
+    """
+    if _doc_types.get() is not None:
+        yield
+        return
+    doc_types = set()
+    token = _doc_types.set(doc_types)
+    try:
+        yield
+    finally:
+        _doc_types.reset(token)
+        if doc_types:
+            with _lock:
+                for key in doc_types:
+                    _docs[key] = _docs.get(key, 0) + 1
+
+
+@dataclasses.dataclass(frozen=True)
+class UnimplementedTypeStat:
+    """
+    Counters of one unimplemented type.
+
+    :param category: Either ``"node"`` or ``"mark"``.
+    :param type: The ADF type string.
+    :param occurrences: Number of skipped elements.
+    :param docs: Number of documents containing at least one of them.
+    """
+
+    category: str
+    type: str
+    occurrences: int
+    docs: int
+
+    def to_dict(self) -> dict[str, T.Any]:
+        return dataclasses.asdict(self)
+
+
+def get_stats() -> list[UnimplementedTypeStat]:
+    """
+    Get the counters of all reported types, most frequent first.
+    """
+    with _lock:
+        items = [
+            UnimplementedTypeStat(
+                category=category,
+                type=type_value,
+                occurrences=occurrences,
+                docs=_docs.get((category, type_value), 0),
+            )
+            for (category, type_value), occurrences in _occurrences.items()
+        ]
+    items.sort(key=lambda stat: (-stat.occurrences, stat.category, stat.type))
+    return items
+
+
+def summary() -> str:
+    """
+    Human readable summary of :func:`get_stats`, one line per type.
+    """
+    return "\n".join(
+        [
+            f"{stat.category} '{stat.type}': {stat.occurrences:,} occurrences "
+            f"in {stat.docs:,} docs"
+            for stat in get_stats()
+        ]
+    )
+
+
+def reset():
+    """
+    Reset all counters, the warning of each type will be logged again.
+    """
+    with _lock:
+        _occurrences.clear()
+        _docs.clear()
+        _warned.clear()
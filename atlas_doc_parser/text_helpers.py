@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+"""
+Plain Text Extraction Helper Functions for ADF
+
+This module provides the utility functions behind ``extract_text()``. Unlike
+``to_markdown()``, plain text extraction never applies marks and never adds
+Markdown syntax, it only collects the textual content of the document, which
+is what embedding and full text search pipelines want.
+
+Key concepts:
+
+- Inline nodes (text, mention, emoji, ...) are concatenated without separator.
+- Every run of inline nodes and every block node becomes one "block", blocks
+  are joined by ``block_sep``.
+- Empty blocks are dropped, so empty paragraphs or media nodes don't produce
+  consecutive separators.
+"""
+
+import typing as T
+
+from func_args.api import OPT
+
+from .type_enum import TypeEnum
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from .mark_or_node import T_NODE
+
+
+INLINE_NODE_TYPES = {
+    TypeEnum.text.value,
+    TypeEnum.date.value,
+    TypeEnum.emoji.value,
+    TypeEnum.hardBreak.value,
+    TypeEnum.inlineCard.value,
+    TypeEnum.mention.value,
+    TypeEnum.status.value,
+    TypeEnum.placeholder.value,
+    TypeEnum.inlineExtension.value,
+    TypeEnum.mediaInline.value,
+}
+"""
+Node types that are concatenated without separator by :func:`content_to_text`.
+"""
+
+
+def content_to_text(
+    content: T.Union[list["T_NODE"], T.Literal[OPT]],
+    block_sep: str = "\n",
+    cell_sep: str = "\t",
+) -> str:
+    """
+    Recursively extract the plain text of a node's content (child nodes).
+
+    This is the core recursive function for ``extract_text()``, the counterpart
+    of :func:`~atlas_doc_parser.markdown_helpers.content_to_markdown`.
+
+    :param content: List of child nodes. If ``OPT`` (not provided),
+        returns an empty string.
+    :param block_sep: String to join block level content.
+    :param cell_sep: String to join the cells of a table row.
+    :return: Plain text from all child nodes.
+
+    Example::
+
+        # In BaseNode.extract_text():
+        text = content_to_text(self.content, block_sep, cell_sep)
+    """
+    if content is OPT:
+        return ""
+    blocks = list()
+    inline = list()
+    for node in content:
+        text = node.extract_text(block_sep, cell_sep)
+        if node.type in INLINE_NODE_TYPES:
+            inline.append(text)
+        else:
+            if inline:
+                blocks.append("".join(inline))
+                inline = list()
+            blocks.append(text)
+    if not blocks:  # pure inline content, e.g. paragraph
+        return "".join(inline)
+    if inline:
+        blocks.append("".join(inline))
+    return block_sep.join([block for block in blocks if block])
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+"""
+Transform node trees with per-type callbacks, in one bottom-up pass.
+
+The pages of a corpus often go through the same clean-up before indexing:
+drop the media, rewrite the links, replace the mentions, drop the empty
+paragraphs. A :class:`Transformer` holds a type to callback table and
+applies it in one traversal:
+
+- the children of a node are transformed first, then its marks, then the
+  node itself, so a callback sees the node with its new children (e.g. a
+  paragraph whose media were just removed),
+- a node callback returns the node (the same object if unchanged), a new
+  node, a list of nodes (spliced into the parent's ``content``) or ``None``
+  (removed),
+- a mark callback returns the mark, a new mark or ``None`` (removed).
+
+The result shares every unchanged subtree with the input: a node is copied
+only if one of its children or marks changed, an unchanged tree is returned
+as is. The input is never modified.
+
+Example::
+
+    import dataclasses
+    from atlas_doc_parser.transform import Transformer, remove
+
+    def rewrite_link(mark):
+        href = mark.attrs.href.replace("https://old.example.com", "https://new.example.com")
+        return dataclasses.replace(mark, attrs=dataclasses.replace(mark.attrs, href=href))
+
+    def drop_empty(node):
+        return node if node.content else None
+
+    transformer = Transformer(
+        node_callbacks={"media": remove, "paragraph": drop_empty},
+        mark_callbacks={"link": rewrite_link},
+    )
+    new_doc = transformer.transform(doc)
+
+    # many documents, in input order
+    for new_doc in transformer.transform_many(docs, executor=executor):
+        ...
+
+To use a ``ProcessPoolExecutor``, the callbacks must be picklable, e.g.
+module level functions.
+"""
+
+import typing as T
+from concurrent.futures import Executor
+
+from .frozen import FrozenList
+from .node_path import _with_field
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from .mark_or_node import T_NODE, BaseMark
+
+T_NODE_RESULT = T.Union["T_NODE", list["T_NODE"], None]
+T_NODE_CALLBACK = T.Callable[["T_NODE"], T_NODE_RESULT]
+T_MARK_CALLBACK = T.Callable[["BaseMark"], T.Optional["BaseMark"]]
+
+
+def remove(node: T.Any) -> None:
+    """
+    A callback that removes the node or mark.
+    """
+    return None
+
+
+class Transformer:
+    """
+    Apply per-type callbacks to node trees, see the module docstring.
+
+    :param node_callbacks: Node type to callback.
+    :param mark_callbacks: Mark type to callback, applied to the marks of
+        every node that has some.
+    """
+
+    def __init__(
+        self,
+        node_callbacks: T.Optional[dict[str, T_NODE_CALLBACK]] = None,
+        mark_callbacks: T.Optional[dict[str, T_MARK_CALLBACK]] = None,
+    ):
+        self.node_callbacks = dict(node_callbacks or {})
+        self.mark_callbacks = dict(mark_callbacks or {})
+
+    def _transform_marks(self, marks: list["BaseMark"]) -> list["BaseMark"]:
+        callbacks = self.mark_callbacks
+        new_marks = None
+        for i, mark in enumerate(marks):
+            callback = callbacks.get(mark.type)
+            result = mark if callback is None else callback(mark)
+            if new_marks is None:
+                if result is mark:
+                    continue
+                new_marks = marks[:i]
+            if result is not None:
+                new_marks.append(result)
+        return marks if new_marks is None else FrozenList(new_marks)
+
+    def _transform(self, node: "T_NODE") -> T_NODE_RESULT:
+        # read the fields from __dict__, most nodes have no content or no
+        # marks and a getattr() miss is slow. content and marks are OPT when
+        # unset
+        fields = node.__dict__
+        content = fields.get("content")
+        if content and isinstance(content, list):
+            transform = self._transform
+            new_content = None
+            for i, child in enumerate(content):
+                result = transform(child)
+                if new_content is None:
+                    if result is child:
+                        continue
+                    new_content = content[:i]
+                if result is None:
+                    continue
+                if isinstance(result, list):
+                    new_content.extend(result)
+                else:
+                    new_content.append(result)
+            if new_content is not None:
+                # the children are frozen already, _with_field() doesn't
+                # walk a FrozenList again
+                node = _with_field(node, "content", FrozenList(new_content))
+                fields = node.__dict__
+        if self.mark_callbacks:
+            marks = fields.get("marks")
+            if marks and isinstance(marks, list):
+                new_marks = self._transform_marks(marks)
+                if new_marks is not marks:
+                    node = _with_field(node, "marks", new_marks)
+        callback = self.node_callbacks.get(node.type)
+        if callback is None:
+            return node
+        return callback(node)
+
+    def transform(self, node: "T_NODE") -> T_NODE_RESULT:
+        """
+        Transform a tree, the input is not modified.
+
+        :return: The new root, the same object if nothing changed. It is a
+            list or ``None`` if the callback of the root type returns one.
+        """
+        return self._transform(node)
+
+    def transform_many(
+        self,
+        nodes: T.Iterable["T_NODE"],
+        executor: T.Optional[Executor] = None,
+    ) -> T.Iterator[T_NODE_RESULT]:
+        """
+        Transform many trees, yield the results in input order.
+
+        :param nodes: The roots, usually ``NodeDoc`` objects.
+        :param executor: If given, the trees are transformed by the executor,
+            see :meth:`concurrent.futures.Executor.map`.
+        """
+        if executor is None:
+            return map(self._transform, nodes)
+        return executor.map(self._transform, nodes)
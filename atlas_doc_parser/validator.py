@@ -0,0 +1,578 @@
+# -*- coding: utf-8 -*-
+
+"""
+Validate raw ADF data against the content model, then parse it in trusted
+mode.
+
+ADF produced by a buggy client usually parses fine and only fails later with
+an odd error deep in ``to_markdown()``, e.g. ``TypeError: Invalid media node
+attributes``. :class:`Validator` checks a raw dict up front, in a single pass,
+and reports every problem with its JSON path:
+
+- the node and mark types are allowed at their position,
+- the required fields, attributes and ``content`` are present,
+- the values have the expected JSON type, ``Literal`` values are one of the
+  allowed values (e.g. ``media.attrs.type``).
+
+The check tables are compiled once from the content model of the
+dataclasses, which were generated from the ADF JSON schema (see
+:mod:`~atlas_doc_parser.content_model`). Unimplemented types are skipped, as
+the parser does.
+
+A document that passed the validation doesn't need the defensive copies and
+the required field checks of ``from_dict()``. :func:`parse_trusted` builds
+the same node objects without them, validation plus trusted parsing is
+faster than ``NodeDoc.from_dict()`` alone.
+
+Example::
+
+    from atlas_doc_parser.validator import validate, parse_validated
+
+    for issue in validate(data):
+        print(issue.path, issue.message)
+        # content[3].content[0].attrs.type: 'video' is not one of 'file', 'link', 'external'
+
+    # raise ValidationError if invalid, else parse in trusted mode
+    doc = parse_validated(data)
+"""
+
+import typing as T
+import functools
+import dataclasses
+
+from .type_hint import T_DATA
+from .exc import UnimplementedTypeError, ValidationError
+from .content_model import T_FIELD_SPEC, TypeSpec, build_specs
+from .telemetry import report_unimplemented_type, doc_scope
+from .interning import intern_object
+from .frozen import FrozenList, freeze
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from .mark_or_node import T_NODE
+
+T_CHECK = T.Callable[[T.Any], bool]
+
+
+@dataclasses.dataclass(frozen=True)
+class ValidationIssue:
+    """
+    One problem found by :class:`Validator`.
+
+    :param path: JMESPath style path of the problem, e.g.
+        ``"content[3].attrs.level"``, ``"@"`` is the root.
+    :param type: ADF type of the node or mark, ``None`` if unknown.
+    :param message: Description of the problem.
+    """
+
+    path: str
+    type: T.Optional[str]
+    message: str
+
+    def to_dict(self) -> dict[str, T.Any]:
+        return dataclasses.asdict(self)
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.message}"
+
+
+# ------------------------------------------------------------------------------
+# Check tables
+# ------------------------------------------------------------------------------
+def _is_str(value: T.Any) -> bool:
+    return isinstance(value, str)
+
+
+def _is_int(value: T.Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_number(value: T.Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_bool(value: T.Any) -> bool:
+    return isinstance(value, bool)
+
+
+def _is_dict(value: T.Any) -> bool:
+    return isinstance(value, dict)
+
+
+def _is_list(value: T.Any) -> bool:
+    return isinstance(value, list)
+
+
+_SIMPLE_CHECKS: dict[T.Any, tuple[T_CHECK, str]] = {
+    str: (_is_str, "string"),
+    int: (_is_int, "integer"),
+    float: (_is_number, "number"),
+    bool: (_is_bool, "boolean"),
+    dict: (_is_dict, "object"),
+    list: (_is_list, "array"),
+}
+
+
+def compile_check(annotation: T.Any) -> T.Optional[tuple[T_CHECK, str]]:
+    """
+    Compile the annotation of a field to ``(check, expected)``, ``None``
+    means any value is accepted.
+    """
+    try:
+        return _SIMPLE_CHECKS[annotation]
+    except (KeyError, TypeError):
+        pass
+    origin = T.get_origin(annotation)
+    if origin is T.Literal:
+        choices = T.get_args(annotation)
+        return (
+            lambda value: isinstance(value, str) and value in choices,
+            "one of " + ", ".join(repr(choice) for choice in choices),
+        )
+    if origin is list:
+        args = T.get_args(annotation)
+        item = compile_check(args[0]) if args else None
+        if item is None:
+            return _SIMPLE_CHECKS[list]
+        item_check, item_expected = item
+        return (
+            lambda value: isinstance(value, list) and all(map(item_check, value)),
+            f"array of {item_expected}",
+        )
+    if origin is dict or dataclasses.is_dataclass(annotation):
+        return _SIMPLE_CHECKS[dict]
+    return None
+
+
+T_FIELD_CHECK = tuple[str, bool, T.Optional[T_CHECK], str]
+
+# The schema has variants of some nodes, e.g. ``text`` with the ``code``
+# mark only allows ``link`` and ``annotation`` besides it, and the code
+# generator merged them into one dataclass keeping the first variant. These
+# are the types of the other variants, which real documents use.
+_EXTRA_CHILDREN = {
+    "mediaSingle": ("caption",),
+}
+_EXTRA_MARKS = {
+    "text": ("code",),
+}
+
+
+def _compile_fields(fields: tuple[T_FIELD_SPEC, ...]) -> tuple[T_FIELD_CHECK, ...]:
+    checks = []
+    for name, annotation, required in fields:
+        check = compile_check(annotation)
+        if check is None:
+            checks.append((name, required, None, ""))
+        else:
+            checks.append((name, required, *check))
+    return tuple(checks)
+
+
+@dataclasses.dataclass(frozen=True)
+class _Table:
+    """
+    The compiled checks of one node or mark type.
+    """
+
+    type: str
+    fields: tuple[T_FIELD_CHECK, ...]
+    attrs: tuple[T_FIELD_CHECK, ...]
+    attrs_required: bool
+    has_attrs: bool
+    children: frozenset[str]
+    content_required: bool
+    has_content: bool
+    marks: frozenset[str]
+    has_marks: bool
+
+    @classmethod
+    def from_spec(cls, spec: TypeSpec) -> "_Table":
+        fields = spec.klass.get_fields()
+        return cls(
+            type=spec.type,
+            fields=_compile_fields(spec.fields),
+            attrs=_compile_fields(spec.attrs),
+            attrs_required=spec.attrs_required,
+            has_attrs="attrs" in fields,
+            children=frozenset(spec.children + _EXTRA_CHILDREN.get(spec.type, ())),
+            content_required=spec.content_required,
+            has_content="content" in fields,
+            marks=frozenset(spec.marks + _EXTRA_MARKS.get(spec.type, ())),
+            has_marks="marks" in fields,
+        )
+
+
+def _join(prefix: str, name: str) -> str:
+    return f"{prefix}.{name}" if prefix else name
+
+
+def _check_fields(
+    dct: dict,
+    checks: tuple[T_FIELD_CHECK, ...],
+    prefix: str,
+    type_value: str,
+    issues: list[ValidationIssue],
+):
+    for name, required, check, expected in checks:
+        try:
+            value = dct[name]
+        except KeyError:
+            if required:
+                issues.append(
+                    ValidationIssue(
+                        _join(prefix, name),
+                        type_value,
+                        f"missing required field {name!r}",
+                    )
+                )
+            continue
+        if check is not None and not check(value):
+            issues.append(
+                ValidationIssue(
+                    _join(prefix, name),
+                    type_value,
+                    f"{value!r} is not {expected}",
+                )
+            )
+
+
+class Validator:
+    """
+    Validate raw ADF dicts against the check tables compiled from the
+    content model.
+
+    Create it once and reuse it, or use the module level :func:`validate`.
+    """
+
+    def __init__(self):
+        specs = build_specs()
+        self.nodes: dict[str, _Table] = {
+            t: _Table.from_spec(spec)
+            for t, spec in specs.items()
+            if spec.category == "node"
+        }
+        self.marks: dict[str, _Table] = {
+            t: _Table.from_spec(spec)
+            for t, spec in specs.items()
+            if spec.category == "mark"
+        }
+
+    def _check_attrs(
+        self,
+        dct: dict,
+        table: _Table,
+        prefix: str,
+        issues: list[ValidationIssue],
+    ):
+        if "attrs" not in dct:
+            if table.attrs_required:
+                issues.append(
+                    ValidationIssue(
+                        _join(prefix, "attrs"),
+                        table.type,
+                        "missing required field 'attrs'",
+                    )
+                )
+            return
+        if not table.has_attrs:
+            return
+        attrs = dct["attrs"]
+        path = _join(prefix, "attrs")
+        if not isinstance(attrs, dict):
+            issues.append(ValidationIssue(path, table.type, f"{attrs!r} is not object"))
+            return
+        _check_fields(attrs, table.attrs, path, table.type, issues)
+
+    def _check_marks(
+        self,
+        marks: T.Any,
+        table: _Table,
+        prefix: str,
+        issues: list[ValidationIssue],
+    ):
+        path = _join(prefix, "marks")
+        if not isinstance(marks, list):
+            issues.append(ValidationIssue(path, table.type, f"{marks!r} is not array"))
+            return
+        for i, mark in enumerate(marks):
+            mark_path = f"{path}[{i}]"
+            if not isinstance(mark, dict):
+                issues.append(ValidationIssue(mark_path, None, f"{mark!r} is not object"))
+                continue
+            mark_type = mark.get("type")
+            if not isinstance(mark_type, str):
+                issues.append(
+                    ValidationIssue(mark_path, None, "missing or invalid 'type'")
+                )
+                continue
+            try:
+                mark_table = self.marks[mark_type]
+            except KeyError:  # unimplemented mark type, skipped by the parser
+                continue
+            if mark_type not in table.marks:
+                issues.append(
+                    ValidationIssue(
+                        mark_path,
+                        mark_type,
+                        f"mark {mark_type!r} is not allowed on {table.type!r}",
+                    )
+                )
+            _check_fields(mark, mark_table.fields, mark_path, mark_type, issues)
+            self._check_attrs(mark, mark_table, mark_path, issues)
+
+    def validate(self, dct: T_DATA) -> list[ValidationIssue]:
+        """
+        Validate a raw node dict and all its descendants.
+
+        :param dct: The raw node dict, usually a ``doc``.
+        :return: The issues in document order, empty if valid.
+        """
+        issues = list()
+        nodes = self.nodes
+        # (node dict, path, parent table)
+        stack: list[tuple[T.Any, str, T.Optional[_Table]]] = [(dct, "", None)]
+        while stack:
+            node, prefix, parent = stack.pop()
+            if not isinstance(node, dict):
+                issues.append(
+                    ValidationIssue(prefix or "@", None, f"{node!r} is not object")
+                )
+                continue
+            type_value = node.get("type")
+            if not isinstance(type_value, str):
+                issues.append(
+                    ValidationIssue(prefix or "@", None, "missing or invalid 'type'")
+                )
+                continue
+            try:
+                table = nodes[type_value]
+            except KeyError:  # unimplemented node type, skipped by the parser
+                continue
+            if parent is not None and type_value not in parent.children:
+                issues.append(
+                    ValidationIssue(
+                        prefix,
+                        type_value,
+                        f"{type_value!r} is not allowed in {parent.type!r}",
+                    )
+                )
+            _check_fields(node, table.fields, prefix, type_value, issues)
+            self._check_attrs(node, table, prefix, issues)
+            if "marks" in node and table.has_marks:
+                self._check_marks(node["marks"], table, prefix, issues)
+            if "content" in node:
+                if not table.has_content:
+                    continue
+                content = node["content"]
+                path = _join(prefix, "content")
+                if not isinstance(content, list):
+                    issues.append(
+                        ValidationIssue(path, type_value, f"{content!r} is not array")
+                    )
+                    continue
+                # reversed, so the children are popped in document order
+                for i in range(len(content) - 1, -1, -1):
+                    stack.append((content[i], f"{path}[{i}]", table))
+            elif table.content_required:
+                issues.append(
+                    ValidationIssue(
+                        _join(prefix, "content"),
+                        type_value,
+                        "missing required field 'content'",
+                    )
+                )
+        return issues
+
+    def is_valid(self, dct: T_DATA) -> bool:
+        return not self.validate(dct)
+
+
+@functools.lru_cache(maxsize=None)
+def get_validator() -> Validator:
+    """
+    Get the shared :class:`Validator`, compiled on first use.
+    """
+    return Validator()
+
+
+def validate(dct: T_DATA) -> list[ValidationIssue]:
+    """
+    Validate a raw node dict with the shared :class:`Validator`.
+    """
+    return get_validator().validate(dct)
+
+
+# ------------------------------------------------------------------------------
+# Trusted parse
+# ------------------------------------------------------------------------------
+def _defaults(klass: type) -> dict[str, T.Any]:
+    return {
+        name: field.default
+        for name, field in klass.get_fields().items()
+        if field.default is not dataclasses.MISSING
+    }
+
+
+def _copy(value: T.Any) -> T.Any:
+    # scalars are immutable, only containers need a copy, which is frozen as
+    # in ``__post_init__``
+    if isinstance(value, (dict, list)):
+        return freeze(value)
+    return value
+
+
+@dataclasses.dataclass(frozen=True)
+class _Plan:
+    """
+    How to build the object of one node or mark type without ``__init__``.
+    """
+
+    klass: type
+    defaults: dict[str, T.Any]
+    fields: tuple[str, ...]
+    attrs_class: T.Optional[type]
+    attrs_defaults: dict[str, T.Any]
+    attrs_fields: tuple[str, ...]
+    has_attrs: bool
+    has_content: bool
+    has_marks: bool
+
+    @classmethod
+    def from_spec(cls, spec: TypeSpec) -> "_Plan":
+        fields = spec.klass.get_fields()
+        attrs_class = spec.attrs_class
+        return cls(
+            klass=spec.klass,
+            defaults=_defaults(spec.klass),
+            fields=("type",) + tuple(name for name, _, _ in spec.fields),
+            attrs_class=attrs_class,
+            attrs_defaults=_defaults(attrs_class) if attrs_class else {},
+            attrs_fields=tuple(name for name, _, _ in spec.attrs),
+            has_attrs="attrs" in fields,
+            has_content="content" in fields,
+            has_marks="marks" in fields,
+        )
+
+
+def _new(klass: type, defaults: dict[str, T.Any], values: dict[str, T.Any]):
+    """
+    Create a dataclass instance without ``__init__`` and ``__post_init__``.
+    """
+    obj = object.__new__(klass)
+    obj.__dict__.update(defaults)
+    obj.__dict__.update(values)
+    return obj
+
+
+class TrustedParser:
+    """
+    Build node objects from validated raw dicts, without the defensive deep
+    copies and the required field checks of ``from_dict()``.
+
+    The result is equal to ``from_dict()`` for valid input. For invalid input
+    the behavior is undefined, validate first, or use
+    :func:`parse_validated`.
+    """
+
+    def __init__(self):
+        specs = build_specs()
+        self.nodes: dict[str, _Plan] = {
+            t: _Plan.from_spec(spec)
+            for t, spec in specs.items()
+            if spec.category == "node"
+        }
+        self.marks: dict[str, _Plan] = {
+            t: _Plan.from_spec(spec)
+            for t, spec in specs.items()
+            if spec.category == "mark"
+        }
+
+    def _values(self, dct: T_DATA, plan: _Plan) -> dict[str, T.Any]:
+        values = {name: _copy(dct[name]) for name in plan.fields if name in dct}
+        if plan.has_attrs and "attrs" in dct:
+            attrs = dct["attrs"]
+            if plan.attrs_class is None:
+                values["attrs"] = _copy(attrs)
+            else:
+                values["attrs"] = intern_object(
+                    _new(
+                        plan.attrs_class,
+                        plan.attrs_defaults,
+                        {
+                            name: _copy(attrs[name])
+                            for name in plan.attrs_fields
+                            if name in attrs
+                        },
+                    )
+                )
+        return values
+
+    def _mark(self, dct: T_DATA):
+        type_value = dct["type"]
+        try:
+            plan = self.marks[type_value]
+        except KeyError:
+            report_unimplemented_type(type_value, "mark")
+            return None
+        return intern_object(_new(plan.klass, plan.defaults, self._values(dct, plan)))
+
+    def parse(self, dct: T_DATA) -> T.Optional["T_NODE"]:
+        """
+        Parse a validated raw node dict, ``None`` if its type is unimplemented.
+        """
+        type_value = dct["type"]
+        try:
+            plan = self.nodes[type_value]
+        except KeyError:
+            report_unimplemented_type(type_value, "node")
+            return None
+        values = self._values(dct, plan)
+        if plan.has_content and "content" in dct:
+            content = []
+            for child in dct["content"]:
+                node = self.parse(child)
+                if node is not None:
+                    content.append(node)
+            values["content"] = FrozenList(content)
+        if plan.has_marks and "marks" in dct:
+            marks = []
+            for mark_dct in dct["marks"]:
+                mark = self._mark(mark_dct)
+                if mark is not None:
+                    marks.append(mark)
+            values["marks"] = FrozenList(marks)
+        return intern_object(_new(plan.klass, plan.defaults, values))
+
+
+@functools.lru_cache(maxsize=None)
+def get_trusted_parser() -> TrustedParser:
+    """
+    Get the shared :class:`TrustedParser`, compiled on first use.
+    """
+    return TrustedParser()
+
+
+def parse_trusted(dct: T_DATA) -> "T_NODE":
+    """
+    Parse a raw node dict that already passed :func:`validate`.
+
+    :raises UnimplementedTypeError: If the root node type is unimplemented.
+    """
+    parser = get_trusted_parser()
+    if dct["type"] not in parser.nodes:
+        raise UnimplementedTypeError(dct["type"], "node")
+    with doc_scope():
+        return parser.parse(dct)
+
+
+def parse_validated(dct: T_DATA) -> "T_NODE":
+    """
+    Validate a raw node dict, then parse it with :func:`parse_trusted`.
+
+    :raises ValidationError: If the dict is invalid, the issues are in
+        ``ValidationError.issues``.
+    """
+    issues = validate(dct)
+    if issues:
+        raise ValidationError(issues)
+    return parse_trusted(dct)
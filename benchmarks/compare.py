@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compare a benchmark result with the baseline and flag regressions.
+
+Usage::
+
+    python benchmarks/compare.py
+    python benchmarks/compare.py benchmarks/results/latest.json --baseline benchmarks/baseline.json --threshold 0.2
+
+A case / operation is a regression if its best time is more than
+``threshold`` (relative) slower than the baseline. The exit code is 1 if there
+is any regression, so it can be used in CI.
+"""
+
+import typing as T
+import sys
+import json
+import argparse
+from pathlib import Path
+
+dir_here = Path(__file__).absolute().parent
+
+
+def compare(
+    baseline: dict[str, T.Any],
+    current: dict[str, T.Any],
+    threshold: float = 0.2,
+) -> list[dict[str, T.Any]]:
+    """
+    Compare two results of ``run.py``.
+
+    :return: One row per case / operation present in both results, with the
+        ``ratio`` of current to baseline time and a ``regression`` flag.
+    """
+    rows = []
+    for name, case in current["cases"].items():
+        base_case = baseline["cases"].get(name)
+        if base_case is None:
+            continue
+        for op, stats in case.items():
+            if not isinstance(stats, dict) or op not in base_case:
+                continue
+            ratio = stats["best"] / base_case[op]["best"]
+            rows.append(
+                {
+                    "case": name,
+                    "operation": op,
+                    "baseline": base_case[op]["best"],
+                    "current": stats["best"],
+                    "ratio": ratio,
+                    "regression": ratio > 1 + threshold,
+                }
+            )
+    return rows
+
+
+def main(args: T.Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "current",
+        nargs="?",
+        default=str(dir_here / "results" / "latest.json"),
+    )
+    parser.add_argument("--baseline", default=str(dir_here / "baseline.json"))
+    parser.add_argument("--threshold", type=float, default=0.2)
+    ns = parser.parse_args(args)
+
+    path_baseline = Path(ns.baseline)
+    if not path_baseline.exists():
+        print(
+            f"{path_baseline} not found, record it first with: "
+            f"python benchmarks/run.py --output {path_baseline}"
+        )
+        return 2
+    baseline = json.loads(path_baseline.read_text(encoding="utf-8"))
+    current = json.loads(Path(ns.current).read_text(encoding="utf-8"))
+    rows = compare(baseline, current, threshold=ns.threshold)
+    for row in rows:
+        flag = "REGRESSION" if row["regression"] else ""
+        print(
+            f"{row['case']:<30} {row['operation']:<12} "
+            f"{row['baseline'] * 1000:10.3f}ms -> {row['current'] * 1000:10.3f}ms "
+            f"{row['ratio']:6.2f}x {flag}"
+        )
+    n_regression = sum(row["regression"] for row in rows)
+    print(f"{n_regression} regression(s) in {len(rows)} comparison(s)")
+    return 1 if n_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
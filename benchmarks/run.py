@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+
+"""
+Run the benchmark suite and write the result as JSON.
+
+Usage::
+
+    # write benchmarks/results/latest.json
+    python benchmarks/run.py
+    # record the baseline of this machine, it is not committed
+    python benchmarks/run.py --output benchmarks/baseline.json
+    # only run the cases whose name contains "synthetic"
+    python benchmarks/run.py --filter synthetic
+
+Operations measured on every case:
+
+- ``from_dict``: ``NodeDoc.from_dict(data)``
+- ``to_dict``: ``doc.to_dict()``
+- ``to_markdown``: ``doc.to_markdown()``
+- ``render``: ``DEFAULT_RENDERER.render(doc)``, the dispatch table renderer
+- ``round_trip``: ``NodeDoc.from_dict(data).to_dict()`` then ``to_markdown()``
+
+Each timing is the best of ``--repeat`` runs, divided by the number of loops
+of a run (auto-ranged to at least 0.2 second), in seconds.
+
+The synthetic documents come from :mod:`atlas_doc_parser.synthetic`, the
+same generator as the tests.
+"""
+
+import typing as T
+import json
+import time
+import timeit
+import argparse
+import platform
+import datetime
+from pathlib import Path
+
+from atlas_doc_parser import settings
+from atlas_doc_parser._version import __version__
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.nodes.parse_node import NODE_TYPE_TO_CLASS_MAPPING
+from atlas_doc_parser.paths import path_enum
+from atlas_doc_parser.renderer import DEFAULT_RENDERER
+from atlas_doc_parser.synthetic import DocGenerator, make_doc
+
+OPERATIONS = ["from_dict", "to_dict", "to_markdown", "render", "round_trip"]
+
+TEXT_TYPES = ("paragraph", "heading", "text")
+LIST_TYPES = (
+    "bulletList",
+    "orderedList",
+    "taskList",
+    "listItem",
+    "taskItem",
+    "paragraph",
+    "text",
+)
+TABLE_TYPES = ("table", "tableRow", "tableHeader", "tableCell", "paragraph", "text")
+
+
+def load_samples() -> list[dict]:
+    datas = []
+    for path in sorted(path_enum.dir_adf_samples.glob("*.json")):
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("type") == "doc":
+            datas.append(data)
+    return datas
+
+
+def composite(data: dict, n: int) -> dict:
+    """
+    Scale up a document by repeating its content ``n`` times.
+    """
+    return {"type": "doc", "version": 1, "content": data["content"] * n}
+
+
+def only(*types: str) -> frozenset[str]:
+    """
+    The ``exclude`` argument of :class:`~atlas_doc_parser.synthetic.DocGenerator`
+    to generate the given node types only.
+    """
+    return frozenset(NODE_TYPE_TO_CLASS_MAPPING).difference(types, ["doc"])
+
+
+def make_table_doc(n_rows: int, n_cols: int, seed: int = 0) -> dict:
+    """
+    Generate a document with one table of ``n_rows x n_cols`` cells.
+    """
+    gen = DocGenerator(
+        seed=seed,
+        table_rows=n_rows,
+        table_cols=n_cols,
+        exclude=only(*TABLE_TYPES),
+    )
+    return {"type": "doc", "version": 1, "content": [gen.node("table", 1)]}
+
+
+def get_cases() -> dict[str, list[dict]]:
+    """
+    Benchmark case name to the list of documents converted in one loop.
+    """
+    samples = load_samples()
+    node_doc = json.loads(
+        path_enum.dir_adf_samples.joinpath("node_doc.json").read_text(encoding="utf-8")
+    )
+    cases = {
+        "samples/all": samples,
+        "samples/node_doc": [node_doc],
+        "composite/node_doc_x10": [composite(node_doc, 10)],
+    }
+    for n_nodes in [100, 1000, 3000]:
+        cases[f"synthetic/mixed_{n_nodes}"] = [make_doc(n_nodes=n_nodes)]
+    # a list nesting level takes two levels of nodes
+    for max_depth in [3, 7, 11]:
+        cases[f"synthetic/lists_depth_{max_depth}"] = [
+            make_doc(n_nodes=300, max_depth=max_depth, exclude=only(*LIST_TYPES))
+        ]
+    cases["synthetic/text_1000"] = [make_doc(n_nodes=1000, exclude=only(*TEXT_TYPES))]
+    cases["synthetic/tables_1000"] = [
+        make_doc(n_nodes=1000, exclude=only(*TABLE_TYPES))
+    ]
+    # table shapes, tall tables come from Jira exports
+    cases["tables/tall_1000x4"] = [make_table_doc(1000, 4)]
+    cases["tables/wide_10x200"] = [make_table_doc(10, 200)]
+    return cases
+
+
+def count_nodes(dct: dict) -> int:
+    return 1 + sum(count_nodes(child) for child in dct.get("content", []))
+
+
+def measure(func: T.Callable, repeat: int) -> dict[str, T.Any]:
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()  # at least 0.2 second per run
+    times = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return {"best": min(times), "mean": sum(times) / len(times), "loops": number}
+
+
+def run_case(
+    datas: list[dict],
+    repeat: int,
+) -> dict[str, dict[str, T.Any]]:
+    docs = [NodeDoc.from_dict(data) for data in datas]
+
+    def from_dict():
+        for data in datas:
+            NodeDoc.from_dict(data)
+
+    def to_dict():
+        for doc in docs:
+            doc.to_dict()
+
+    def to_markdown():
+        for doc in docs:
+            doc.to_markdown()
+
+    def render():
+        for doc in docs:
+            DEFAULT_RENDERER.render(doc)
+
+    def round_trip():
+        for data in datas:
+            NodeDoc.from_dict(NodeDoc.from_dict(data).to_dict()).to_markdown()
+
+    funcs = {
+        "from_dict": from_dict,
+        "to_dict": to_dict,
+        "to_markdown": to_markdown,
+        "render": render,
+        "round_trip": round_trip,
+    }
+    return {op: measure(funcs[op], repeat) for op in OPERATIONS}
+
+
+def main(args: T.Optional[list[str]] = None) -> dict[str, T.Any]:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--output",
+        default=str(path_enum.dir_benchmarks / "results" / "latest.json"),
+    )
+    parser.add_argument("--filter", default="")
+    parser.add_argument("--repeat", type=int, default=3)
+    ns = parser.parse_args(args)
+
+    result = {
+        "meta": {
+            "version": __version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "datetime": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        },
+        "cases": {},
+    }
+    with settings.warn_unimplemented_type(False):
+        for name, datas in get_cases().items():
+            if ns.filter not in name:
+                continue
+            start = time.perf_counter()
+            case = run_case(datas, ns.repeat)
+            case["n_docs"] = len(datas)
+            case["n_nodes"] = sum(count_nodes(data) for data in datas)
+            result["cases"][name] = case
+            print(
+                f"{name:<30} "
+                + " ".join(
+                    f"{op}={case[op]['best'] * 1000:.3f}ms" for op in OPERATIONS
+                )
+                + f" ({time.perf_counter() - start:.1f}s)"
+            )
+
+    path = Path(ns.output)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(result, indent=4), encoding="utf-8")
+    print(f"result written to {path}")
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import io
+
 from atlas_doc_parser.nodes.node_table import NodeTable
 
 from atlas_doc_parser.tests.data.samples import AdfSampleEnum
@@ -10,6 +12,88 @@ class TestNodeTable:
         node = AdfSampleEnum.node_table_simple.test(NodeTable)
         node = AdfSampleEnum.node_table_complicated.test(NodeTable)
 
+    def test_iter_records(self):
+        node = NodeTable.from_dict(
+            table(
+                [cell("Host", "tableHeader"), cell("Owner", "tableHeader")],
+                [cell("web-1", rowspan=2), cell("Alice")],
+                [cell("Bob")],
+                [cell("db-1", colspan=2)],
+                [cell("db-2")],
+                [cell("x"), cell("y"), cell("z")],
+            )
+        )
+        assert node.has_header_row() is True
+        assert list(node.iter_rows()) == [
+            ["Host", "Owner"],
+            ["web-1", "Alice"],
+            ["web-1", "Bob"],
+            ["db-1", "db-1"],
+            ["db-2", ""],
+            ["x", "y", "z"],
+        ]
+        assert list(node.iter_records()) == [
+            {"Host": "web-1", "Owner": "Alice"},
+            {"Host": "web-1", "Owner": "Bob"},
+            {"Host": "db-1", "Owner": "db-1"},
+            {"Host": "db-2", "Owner": ""},
+            {"Host": "x", "Owner": "y", "column_3": "z"},
+        ]
+        records = list(node.iter_records(columns=["h", "o"], fill_spans=False))
+        assert records[1] == {"h": "", "o": "Bob"}
+        assert records[2] == {"h": "db-1", "o": ""}
+
+        # without header row, all rows are records
+        node = NodeTable.from_dict(table([cell("a"), cell("b")]))
+        assert node.has_header_row() is False
+        assert list(node.iter_records()) == [{"column_1": "a", "column_2": "b"}]
+        assert list(node.iter_records(columns=["x", "y"])) == [{"x": "a", "y": "b"}]
+
+    def test_to_csv(self):
+        node = NodeTable.from_dict(
+            table(
+                [cell("name", "tableHeader"), cell("note", "tableHeader")],
+                [cell("a"), cell('say "hi", bye')],
+            )
+        )
+        f = io.StringIO(newline="")
+        assert node.to_csv(f) == 2
+        assert f.getvalue() == 'name,note\r\na,"say ""hi"", bye"\r\n'
+
+        f = io.StringIO(newline="")
+        assert node.to_csv(f, header=False, lineterminator="\n") == 1
+        assert f.getvalue() == 'a,"say ""hi"", bye"\n'
+
+    def test_export_samples(self):
+        for sample in [
+            AdfSampleEnum.node_table_simple,
+            AdfSampleEnum.node_table_complicated,
+        ]:
+            node = NodeTable.from_dict(sample.data)
+            rows = list(node.iter_rows())
+            assert len(rows) == len(node.content)
+            f = io.StringIO(newline="")
+            assert node.to_csv(f) == len(rows)
+            n_records = len(rows) - int(node.has_header_row())
+            assert len(list(node.iter_records())) == n_records
+
+
+def cell(text: str, type_: str = "tableCell", colspan: int = 1, rowspan: int = 1):
+    dct = {
+        "type": type_,
+        "content": [{"type": "paragraph", "content": [{"type": "text", "text": text}]}],
+    }
+    if (colspan, rowspan) != (1, 1):
+        dct["attrs"] = {"colspan": colspan, "rowspan": rowspan}
+    return dct
+
+
+def table(*rows: list[dict]) -> dict:
+    return {
+        "type": "table",
+        "content": [{"type": "tableRow", "content": row} for row in rows],
+    }
+
 
 if __name__ == "__main__":
     from atlas_doc_parser.tests import run_cov_test
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+import pytest
+
+from atlas_doc_parser.aio import aconvert, aconvert_many
+
+
+def make_doc(text: str) -> dict:
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {"type": "paragraph", "content": [{"type": "text", "text": text}]},
+        ],
+    }
+
+
+def test_aconvert():
+    assert asyncio.run(aconvert(make_doc("hello"))) == "hello\n"
+
+
+async def collect(items, **kwargs) -> list[str]:
+    return [md async for md in aconvert_many(items, **kwargs)]
+
+
+def test_aconvert_many():
+    docs = [make_doc(str(i)) for i in range(20)]
+    expected = [f"{i}\n" for i in range(20)]
+
+    # sync iterable, default executor
+    assert asyncio.run(collect(docs, concurrency=3)) == expected
+
+    # async iterable, thread executor
+    async def agen():
+        for doc in docs:
+            await asyncio.sleep(0)
+            yield doc
+
+    with ThreadPoolExecutor(2) as executor:
+        assert asyncio.run(collect(agen(), executor=executor)) == expected
+
+    # process executor
+    with ProcessPoolExecutor(2) as executor:
+        assert asyncio.run(collect(docs[:4], executor=executor)) == expected[:4]
+
+
+def test_aconvert_many_backpressure():
+    pulled = []
+
+    def gen():
+        for i in range(10):
+            pulled.append(i)
+            yield make_doc(str(i))
+
+    async def main():
+        results = []
+        async for md in aconvert_many(gen(), concurrency=2):
+            results.append(md)
+            # never more than ``concurrency`` documents ahead of the consumer
+            assert len(pulled) - len(results) <= 2
+        return results
+
+    assert len(asyncio.run(main())) == 10
+
+
+def test_aconvert_many_error():
+    # ``version`` is a required field of the doc node
+    docs = [make_doc("a"), {"type": "doc"}, make_doc("b")]
+    with pytest.raises(Exception):
+        asyncio.run(collect(docs))
+    with pytest.raises(ValueError):
+        asyncio.run(collect(docs, concurrency=0))
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "atlas_doc_parser.aio",
+        preview=False,
+    )
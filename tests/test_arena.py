@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+import gc
+import json
+import tracemalloc
+
+import pytest
+
+from atlas_doc_parser.arena import ArenaDoc
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.paths import path_enum
+
+SAMPLE_PATHS = sorted(path_enum.dir_adf_samples.glob("*.json"))
+
+
+@pytest.mark.parametrize("path", SAMPLE_PATHS, ids=lambda p: p.stem)
+def test_round_trip_and_markdown(path):
+    data = json.loads(path.read_text(encoding="utf-8"))
+    doc = NodeDoc.from_dict(data)
+    expected = doc.to_markdown()
+
+    arena = ArenaDoc.from_dict(data)
+    assert arena.to_node() == doc
+    assert arena.to_markdown() == expected
+
+    arena = ArenaDoc.from_node(doc)
+    assert arena.to_node() == doc
+    assert arena.to_markdown() == expected
+
+
+def test_arena_structure():
+    data = {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {
+                "type": "paragraph",
+                "content": [
+                    {"type": "text", "text": "a", "marks": [{"type": "strong"}]},
+                    {"type": "text", "text": "b", "marks": [{"type": "strong"}]},
+                    {"type": "bodiedExtension"},  # unimplemented, skipped
+                ],
+            },
+            {"type": "rule"},
+        ],
+    }
+    arena = ArenaDoc.from_dict(data)
+    assert len(arena) == 5
+    assert arena.type_of(0) == "doc"
+    assert list(arena.iter_children(0)) == [1, 4]
+    assert list(arena.iter_children(1)) == [2, 3]
+    assert arena.parent[3] == 1
+    assert arena.text == "ab"
+    assert arena.get_text(3) == "b"
+    # both text nodes share the same mark set
+    assert arena.mark_set[2] == arena.mark_set[3]
+    assert len(arena.mark_sets) == 1
+    assert arena.to_markdown() == "**a****b**\n\n---\n\n"
+
+
+def traced_memory(func) -> tuple[object, int]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        obj = func()
+        gc.collect()
+        return obj, tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+def test_memory():
+    path = path_enum.dir_adf_samples / "node_doc.json"
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data = {**data, "content": data["content"] * 3}
+    # warm up the class level caches
+    ArenaDoc.from_dict(data)
+    NodeDoc.from_dict(data)
+    arena, arena_size = traced_memory(lambda: ArenaDoc.from_dict(data))
+    doc, doc_size = traced_memory(lambda: NodeDoc.from_dict(data))
+    # about a fourth on this page
+    assert arena_size < doc_size / 3
+    # nbytes is a fair estimate of the allocated memory
+    assert arena_size / 2 < arena.nbytes < arena_size * 2
+
+def _cell(text: str, type_: str = "tableCell", **attrs) -> dict:
+    cell = {
+        "type": type_,
+        "content": [{"type": "paragraph", "content": [{"type": "text", "text": text}]}],
+    }
+    if attrs:
+        cell["attrs"] = attrs
+    return cell
+
+
+def test_table_spans_and_header_column():
+    data = {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {
+                "type": "table",
+                "content": [
+                    {"type": "tableRow", "content": [_cell("a", colspan=2)]},
+                    {"type": "tableRow", "content": [_cell("b", rowspan=2), _cell("c")]},
+                    {"type": "tableRow", "content": [_cell("d")]},
+                ],
+            },
+            {
+                "type": "table",
+                "content": [
+                    {
+                        "type": "tableRow",
+                        "content": [_cell("h1", "tableHeader"), _cell("x")],
+                    },
+                    {
+                        "type": "tableRow",
+                        "content": [_cell("h2", "tableHeader"), _cell("y")],
+                    },
+                ],
+            },
+        ],
+    }
+    expected = NodeDoc.from_dict(data).to_markdown()
+    assert "|  | d<br> |" in expected
+    assert expected.count("| --- | --- |") == 1
+    assert ArenaDoc.from_dict(data).to_markdown() == expected
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "atlas_doc_parser.arena",
+        preview=False,
+    )
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+from atlas_doc_parser import builder
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.nodes.node_table import NodeTable
+from atlas_doc_parser.nodes.node_table_row import NodeTableRow
+from atlas_doc_parser.nodes.node_table_cell import NodeTableCell
+from atlas_doc_parser.nodes.node_table_header import NodeTableHeader
+from atlas_doc_parser.nodes.node_paragraph import NodeParagraph
+from atlas_doc_parser.nodes.node_text import NodeText
+from atlas_doc_parser.validator import validate, parse_trusted
+
+
+def test_table_from_rows():
+    data = builder.table_from_rows(
+        (row for row in [["a", 1], [None, 2.5]]),
+        header=["name", "value"],
+    )
+
+    def cell(klass, text):
+        content = [NodeText(text=text)] if text else []
+        return klass(content=[NodeParagraph(content=content)])
+
+    expected = NodeTable(
+        content=[
+            NodeTableRow(
+                content=[cell(NodeTableHeader, "name"), cell(NodeTableHeader, "value")]
+            ),
+            NodeTableRow(content=[cell(NodeTableCell, "a"), cell(NodeTableCell, "1")]),
+            NodeTableRow(content=[cell(NodeTableCell, ""), cell(NodeTableCell, "2.5")]),
+        ]
+    )
+    assert NodeTable.from_dict(data) == expected
+    assert data == expected.to_dict()
+
+
+def test_doc():
+    data = builder.doc(
+        [
+            builder.heading("Report", level=2),
+            builder.paragraph("bold", marks=[{"type": "strong"}]),
+            *builder.paragraphs(["a", "", None, 3]),
+            builder.bullet_list(["x", "y"]),
+            builder.table_from_rows([["1", "2"]], header=["k", "v"]),
+            builder.table_from_rows([]),
+        ]
+    )
+    assert validate(data) == []
+    doc = NodeDoc.from_dict(data)
+    assert parse_trusted(data) == doc
+    assert doc.to_dict() == data
+    assert doc.to_markdown() == (
+        "\n\n## Report\n\n"
+        "**bold**\n\n"
+        "a\n\n"
+        "3\n\n"
+        "- x\n"
+        "- y\n\n"
+        "| k<br> | v<br> |\n"
+        "| --- | --- |\n"
+        "| 1<br> | 2<br> |\n"
+    )
+
+    payload = builder.to_json(data)
+    assert " " not in payload.replace("## Report", "")
+    assert json.loads(payload) == data
+    assert builder.to_json(builder.paragraph("é")) == (
+        '{"type":"paragraph","content":[{"type":"text","text":"é"}]}'
+    )
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_unit_test
+
+    run_unit_test(__file__)
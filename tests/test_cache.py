@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+from atlas_doc_parser.cache import make_cache_key, ConversionCache
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.paths import path_enum
+
+
+def load_doc() -> dict:
+    path = path_enum.dir_adf_samples / "node_doc.json"
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def make_doc(text: str) -> dict:
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {"type": "paragraph", "content": [{"type": "text", "text": text}]},
+        ],
+    }
+
+
+def test_make_cache_key():
+    data = {"type": "doc", "version": 1, "content": []}
+    # key order does not matter
+    same_data = {"content": [], "version": 1, "type": "doc"}
+    assert make_cache_key(data) == make_cache_key(same_data)
+    # render options are part of the key
+    assert make_cache_key(data) != make_cache_key(data, ignore_error=True)
+    # content is part of the key
+    assert make_cache_key(make_doc("a")) != make_cache_key(make_doc("b"))
+
+
+class TestConversionCache:
+    def test_convert(self):
+        data = load_doc()
+        expected = NodeDoc.from_dict(data).to_markdown()
+        with ConversionCache() as cache:
+            assert cache.convert(data) == expected
+            assert cache.stats.hits == 0
+            assert cache.stats.misses == 1
+            assert cache.convert(data) == expected
+            assert cache.stats.hits == 1
+            assert cache.stats.misses == 1
+            assert cache.stats.hit_rate == 0.5
+            assert len(cache) == 1
+
+            cache.convert(data, ignore_error=True)
+            assert cache.stats.misses == 2
+            assert len(cache) == 2
+
+            cache.clear()
+            assert len(cache) == 0
+            assert cache.size == 0
+
+    def test_persistence(self, tmp_path):
+        path = tmp_path / "cache.sqlite"
+        data = make_doc("hello")
+        with ConversionCache(path=path) as cache:
+            cache.convert(data)
+        with ConversionCache(path=path) as cache:
+            assert cache.convert(data) == "hello\n"
+            assert cache.stats.to_dict()["hits"] == 1
+
+    def test_eviction(self):
+        with ConversionCache(max_size=20) as cache:
+            for text in ["a" * 8, "b" * 8, "c" * 8]:
+                cache.convert(make_doc(text))
+            # each entry is 9 bytes, only two of them fit into 20 bytes
+            assert len(cache) == 2
+            assert cache.size <= 20
+            assert cache.stats.evictions == 1
+            # the least recently used entry is the one that was evicted
+            assert cache.get(make_cache_key(make_doc("a" * 8))) is None
+            assert cache.get(make_cache_key(make_doc("c" * 8))) == "c" * 8 + "\n"
+
+    def test_running_size(self):
+        with ConversionCache(max_size=50) as cache:
+            for i in range(20):
+                cache.set(f"k{i % 7}", "x" * (i % 5 + 1))
+                assert cache._size == cache._get_size()
+                assert cache._size <= 50
+
+    def test_lazy_access_time(self, tmp_path):
+        path = tmp_path / "cache.sqlite"
+        with ConversionCache(path=path, max_size=20) as cache:
+            for text in ["a" * 8, "b" * 8]:
+                cache.convert(make_doc(text))
+            # a hit doesn't write to the database
+            changes = cache._conn.total_changes
+            assert cache.convert(make_doc("a" * 8)) == "a" * 8 + "\n"
+            assert cache._conn.total_changes == changes
+            # the pending access time is written before eviction, "b" is
+            # now the least recently used entry
+            cache.convert(make_doc("c" * 8))
+            assert cache.get(make_cache_key(make_doc("b" * 8))) is None
+            assert cache.get(make_cache_key(make_doc("a" * 8))) == "a" * 8 + "\n"
+        # reopened, the total size is read from the file
+        with ConversionCache(path=path, max_size=20) as cache:
+            assert cache._size == cache.size == 18
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "atlas_doc_parser.cache",
+        preview=False,
+    )
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+import json
+import copy
+import pickle
+import functools
+
+import pytest
+
+from atlas_doc_parser.frozen import FrozenList, FrozenDict, freeze, thaw
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.nodes.node_paragraph import NodeParagraph
+from atlas_doc_parser.nodes.node_table_cell import NodeTableCell, NodeTableCellAttrs
+from atlas_doc_parser.nodes.node_text import NodeText
+from atlas_doc_parser.paths import path_enum
+from atlas_doc_parser.validator import parse_trusted
+
+
+def test_frozen_list():
+    lst = FrozenList([1, 2])
+    assert lst == [1, 2] and [1, 2] == lst
+    assert isinstance(lst, list)
+    assert hash(lst) == hash((1, 2)) == hash(FrozenList([1, 2]))
+    assert lst[:1] == [1] and lst + [3] == [1, 2, 3]
+    for method, args in [
+        ("append", (3,)),
+        ("extend", ([3],)),
+        ("insert", (0, 3)),
+        ("pop", ()),
+        ("remove", (1,)),
+        ("clear", ()),
+        ("sort", ()),
+        ("reverse", ()),
+        ("__setitem__", (0, 3)),
+        ("__delitem__", (0,)),
+    ]:
+        with pytest.raises(TypeError):
+            getattr(lst, method)(*args)
+    with pytest.raises(TypeError):
+        lst += [3]
+    assert lst == [1, 2]
+    assert copy.copy(lst) is lst
+    assert pickle.loads(pickle.dumps(lst)) == lst
+    assert type(copy.deepcopy(lst)) is FrozenList
+    assert repr(lst) == "FrozenList([1, 2])"
+
+
+def test_frozen_dict():
+    dct = FrozenDict({"a": 1})
+    assert dct == {"a": 1}
+    assert hash(dct) == hash(FrozenDict({"a": 1}))
+    for method, args in [
+        ("__setitem__", ("b", 2)),
+        ("__delitem__", ("a",)),
+        ("update", ({"b": 2},)),
+        ("pop", ("a",)),
+        ("popitem", ()),
+        ("setdefault", ("b", 2)),
+        ("clear", ()),
+    ]:
+        with pytest.raises(TypeError):
+            getattr(dct, method)(*args)
+    assert pickle.loads(pickle.dumps(dct)) == dct
+
+
+def test_freeze_thaw():
+    data = {"a": [1, {"b": [2]}], "c": "d"}
+    frozen = freeze(data)
+    assert type(frozen) is FrozenDict
+    assert type(frozen["a"]) is FrozenList
+    assert type(frozen["a"][1]["b"]) is FrozenList
+    assert frozen == data
+    hash(frozen)
+    plain = thaw(frozen)
+    assert plain == data
+    assert type(plain) is dict and type(plain["a"][1]["b"]) is list
+    assert json.dumps(frozen) == json.dumps(data)
+
+
+def test_hashable_nodes():
+    para = NodeParagraph(content=[NodeText(text="a")])
+    assert type(para.content) is FrozenList
+    assert hash(para) == hash(NodeParagraph(content=[NodeText(text="a")]))
+    assert len({para, NodeParagraph(content=[NodeText(text="a")])}) == 1
+    with pytest.raises(TypeError):
+        para.content.append(NodeText(text="b"))
+
+    cell = NodeTableCell(attrs=NodeTableCellAttrs(colwidth=[100]), content=[para])
+    hash(cell)
+    assert cell.to_dict() == {
+        "type": "tableCell",
+        "attrs": {"colwidth": [100]},
+        "content": [{"type": "paragraph", "content": [{"type": "text", "text": "a"}]}],
+    }
+    assert type(cell.to_dict()["attrs"]["colwidth"]) is list
+
+    calls = []
+
+    @functools.lru_cache(maxsize=None)
+    def render(node):
+        calls.append(node)
+        return node.to_markdown()
+
+    render(para)
+    render(NodeParagraph(content=[NodeText(text="a")]))
+    assert len(calls) == 1
+
+
+def test_samples():
+    path = path_enum.dir_adf_samples / "node_doc.json"
+    data = json.loads(path.read_text(encoding="utf-8"))
+    doc = NodeDoc.from_dict(data)
+    trusted = parse_trusted(data)
+    assert hash(doc) == hash(trusted)
+    assert doc == trusted
+    # from_dict accepts the to_dict output
+    assert NodeDoc.from_dict(doc.to_dict()) == doc
+    assert pickle.loads(pickle.dumps(doc)) == doc
+
+    # the edited trees are hashable too
+    new_doc = doc.replace_at("content[0]", NodeParagraph(content=[]))
+    assert type(new_doc.content) is FrozenList
+    assert hash(new_doc) != hash(doc)
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_unit_test
+
+    run_unit_test(__file__)
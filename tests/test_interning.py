@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+from atlas_doc_parser.interning import (
+    InternTable,
+    make_intern_key,
+    get_intern_table,
+    interning,
+)
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.nodes.node_heading import NodeHeading, NodeHeadingAttrs
+from atlas_doc_parser.paths import path_enum
+from atlas_doc_parser.validator import parse_trusted
+
+
+def load() -> dict:
+    path = path_enum.dir_adf_samples / "node_doc.json"
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def test_make_intern_key():
+    a = NodeHeadingAttrs(level=1)
+    assert make_intern_key(a) == make_intern_key(NodeHeadingAttrs(level=1))
+    assert make_intern_key(a) != make_intern_key(NodeHeadingAttrs(level=2))
+    assert make_intern_key(a) != make_intern_key(NodeHeadingAttrs(level=True))
+    assert make_intern_key(a) != make_intern_key(NodeHeadingAttrs(level=1.0))
+    # the children are compared by identity
+    b = NodeHeadingAttrs(level=1)
+    assert make_intern_key(NodeHeading(attrs=a)) != make_intern_key(NodeHeading(attrs=b))
+    assert make_intern_key(NodeHeading(attrs=a)) == make_intern_key(NodeHeading(attrs=a))
+
+
+def test_interning():
+    data = load()
+    assert get_intern_table() is None
+    plain = NodeDoc.from_dict(data)
+    assert NodeDoc.from_dict(data).content[0] is not plain.content[0]
+
+    with interning() as table:
+        assert get_intern_table() is table
+        doc1 = NodeDoc.from_dict(data)
+        doc2 = NodeDoc.from_dict(data)
+        doc3 = parse_trusted(data)
+    assert get_intern_table() is None
+    assert doc1 == plain
+    assert doc1 is doc2
+    assert doc3 is doc1
+    assert table.hits > 0 and table.misses == len(table)
+
+    # a table can be shared by several blocks
+    with interning(table=table):
+        assert NodeDoc.from_dict(data) is doc1
+
+    # the subtrees are shared across documents
+    other = {**data, "content": data["content"][:3]}
+    with interning(table=table):
+        doc4 = NodeDoc.from_dict(other)
+    assert doc4 is not doc1
+    assert all(a is b for a, b in zip(doc4.content, doc1.content))
+    assert doc4.to_markdown() == NodeDoc.from_dict(other).to_markdown()
+
+    table.clear()
+    assert (len(table), table.hits, table.misses) == (0, 0, 0)
+
+
+def test_maxsize():
+    data = load()
+    with interning(maxsize=10) as table:
+        doc = NodeDoc.from_dict(data)
+        assert len(table) == 10
+        assert NodeDoc.from_dict(data) == doc
+    assert doc.to_markdown() == NodeDoc.from_dict(data).to_markdown()
+
+
+def test_intern_table():
+    table = InternTable(maxsize=2)
+    a1, a2 = NodeHeadingAttrs(level=1), NodeHeadingAttrs(level=1)
+    b, c = NodeHeadingAttrs(level=2), NodeHeadingAttrs(level=3)
+    assert table.intern(a1) is a1
+    assert table.intern(b) is b
+    assert table.intern(a2) is a1  # a1 is now the most recent
+    assert table.intern(c) is c  # b is evicted
+    assert table.intern(NodeHeadingAttrs(level=1)) is a1
+    assert table.intern(NodeHeadingAttrs(level=2)) is not b
+    assert (table.hits, table.misses) == (2, 4)
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_unit_test
+
+    run_unit_test(__file__)
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+from atlas_doc_parser.links import Edge, extract_edges, collect_edges
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.paths import path_enum
+
+
+def link(text: str, href: str) -> dict:
+    return {
+        "type": "text",
+        "text": text,
+        "marks": [{"type": "strong"}, {"type": "link", "attrs": {"href": href}}],
+    }
+
+
+def make_data() -> dict:
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {
+                "type": "paragraph",
+                "content": [
+                    link("a", "https://a.com"),
+                    {"type": "mention", "attrs": {"id": "user-1", "text": "@Alice"}},
+                    {"type": "inlineCard", "attrs": {"url": "https://b.com"}},
+                    link("a again", "https://a.com"),
+                ],
+            },
+            {"type": "blockCard", "attrs": {"url": "https://c.com"}},
+            {
+                "type": "mediaSingle",
+                "attrs": {"layout": "center"},
+                "content": [
+                    {
+                        "type": "media",
+                        "attrs": {"type": "file", "id": "m-1", "collection": "c"},
+                        "marks": [{"type": "link", "attrs": {"href": "https://d.com"}}],
+                    }
+                ],
+            },
+        ],
+    }
+
+
+def test_extract_edges():
+    data = make_data()
+    doc = NodeDoc.from_dict(data)
+    expected = [
+        Edge("link", "href", "https://a.com", "content[0].content[0].marks[1]"),
+        Edge("mention", "id", "user-1", "content[0].content[1]"),
+        Edge("inlineCard", "url", "https://b.com", "content[0].content[2]"),
+        Edge("link", "href", "https://a.com", "content[0].content[3].marks[1]"),
+        Edge("blockCard", "url", "https://c.com", "content[1]"),
+        Edge("media", "id", "m-1", "content[2].content[0]"),
+        Edge("link", "href", "https://d.com", "content[2].content[0].marks[0]"),
+    ]
+    assert list(extract_edges(data)) == expected
+    assert list(extract_edges(doc)) == expected
+
+    # root node
+    card = {"type": "embedCard", "attrs": {"url": "https://e.com", "layout": "wide"}}
+    assert list(extract_edges(card, doc_id="p1")) == [
+        Edge("embedCard", "url", "https://e.com", "@", "p1"),
+    ]
+    # missing or empty attributes give no edge
+    assert list(extract_edges({"type": "blockCard", "attrs": {"url": ""}})) == []
+    assert list(extract_edges({"type": "mention"})) == []
+
+
+def test_collect_edges():
+    data = make_data()
+    docs = [("p1", data), ("p2", NodeDoc.from_dict(data))]
+    edges = collect_edges(docs)
+    # the second link to https://a.com is dropped
+    assert len(edges) == 2 * 6
+    assert edges[0].to_dict() == {
+        "type": "link",
+        "attr": "href",
+        "target": "https://a.com",
+        "path": "content[0].content[0].marks[1]",
+        "doc_id": "p1",
+    }
+    assert {edge.doc_id for edge in edges} == {"p1", "p2"}
+    assert len(collect_edges(iter(docs), dedupe=False)) == 2 * 7
+
+
+def test_sample():
+    path = path_enum.dir_adf_samples / "node_doc.json"
+    data = json.loads(path.read_text(encoding="utf-8"))
+    edges = list(extract_edges(data))
+    assert edges
+    assert list(extract_edges(NodeDoc.from_dict(data))) == edges
+
+
+def test_unimplemented_types():
+    data = {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {
+                "type": "fooBar",
+                "content": [
+                    {"type": "paragraph", "content": [link("x", "https://x.com")]}
+                ],
+            },
+            {
+                "type": "paragraph",
+                "content": [
+                    {"type": "bazQux", "attrs": {"url": "https://y.com"}},
+                    {
+                        "type": "text",
+                        "text": "a",
+                        "marks": [
+                            {"type": "fooMark"},
+                            {"type": "link", "attrs": {"href": "https://a.com"}},
+                        ],
+                    },
+                ],
+            },
+        ],
+    }
+    edges = list(extract_edges(data))
+    # the paths index the parsed tree, where the unimplemented types are dropped
+    assert edges == [
+        Edge("link", "href", "https://a.com", "content[0].content[0].marks[0]")
+    ]
+    doc = NodeDoc.from_dict(data)
+    assert list(extract_edges(doc)) == edges
+    assert doc.get_at(edges[0].path).attrs.href == "https://a.com"
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "atlas_doc_parser.links",
+        preview=False,
+    )
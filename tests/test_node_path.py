@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+import json
+import dataclasses
+
+import pytest
+
+from atlas_doc_parser.exc import ParamError
+from atlas_doc_parser.links import extract_edges
+from atlas_doc_parser.marks.mark_strong import MarkStrong
+from atlas_doc_parser.node_path import parse_path
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.nodes.node_paragraph import NodeParagraph
+from atlas_doc_parser.nodes.node_text import NodeText
+from atlas_doc_parser.paths import path_enum
+
+
+def make_doc() -> NodeDoc:
+    return NodeDoc(
+        content=[
+            NodeParagraph(content=[NodeText(text="a"), NodeText(text="b")]),
+            NodeParagraph(
+                content=[NodeText(text="c", marks=[MarkStrong()])],
+            ),
+        ]
+    )
+
+
+def test_parse_path():
+    assert parse_path("@") == ()
+    assert parse_path("") == ()
+    assert parse_path("content[3].marks[0]") == (("content", 3), ("marks", 0))
+    assert parse_path((3, 0)) == (("content", 3), ("content", 0))
+    for path in ["content", "content[x]", "attrs[0]", "content[0]..content[1]"]:
+        with pytest.raises(ParamError):
+            parse_path(path)
+
+
+def test_get_at():
+    doc = make_doc()
+    assert doc.get_at("@") is doc
+    assert doc.get_at("content[1]") is doc.content[1]
+    assert doc.get_at((0, 1)).text == "b"
+    assert doc.get_at("content[1].content[0].marks[0]") == MarkStrong()
+    with pytest.raises(ParamError):
+        doc.get_at("content[2]")
+    with pytest.raises(ParamError):
+        doc.get_at("content[0].content[0].content[0]")
+    with pytest.raises(ParamError):
+        doc.get_at("content[0].content[0].marks[0]")
+
+    # the paths of the edges point to the nodes and marks
+    path = path_enum.dir_adf_samples / "node_doc.json"
+    doc = NodeDoc.from_dict(json.loads(path.read_text(encoding="utf-8")))
+    edges = list(extract_edges(doc))
+    assert edges
+    for edge in edges:
+        assert doc.get_at(edge.path).type == edge.type
+
+
+def test_replace_at():
+    doc = make_doc()
+    before = doc.to_dict()
+    new_doc = doc.replace_at("content[0].content[1]", NodeText(text="x"))
+    assert doc.to_dict() == before
+    assert new_doc.to_markdown() == "ax\n\n**c**\n"
+    # only the ancestors are copied
+    assert new_doc is not doc
+    assert new_doc.content[0] is not doc.content[0]
+    assert new_doc.content[0].content[0] is doc.content[0].content[0]
+    assert new_doc.content[1] is doc.content[1]
+    assert NodeDoc.from_dict(new_doc.to_dict()) == new_doc
+
+    assert doc.replace_at("@", doc.content[0]) is doc.content[0]
+    new_doc = doc.replace_at("content[1].content[0].marks[0]", MarkStrong())
+    assert new_doc == doc
+
+
+def test_update():
+    doc = make_doc()
+    new_doc = doc.update(
+        (1, 0),
+        lambda node: dataclasses.replace(node, text=node.text.upper(), marks=[]),
+    )
+    assert new_doc.to_markdown() == "ab\n\nC\n"
+    assert new_doc.content[0] is doc.content[0]
+    assert doc.to_markdown() == "ab\n\n**c**\n"
+
+    # edits chain
+    for i in range(100):
+        new_doc = new_doc.update((0, 0), lambda node: NodeText(text=node.text + "a"))
+    assert new_doc.content[0].content[0].text == "a" * 101
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_unit_test
+
+    run_unit_test(__file__)
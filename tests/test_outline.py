@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+import pytest
+
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.outline import OutlineItem
+from atlas_doc_parser.paths import path_enum
+
+
+def heading(level: int, text: str) -> dict:
+    return {
+        "type": "heading",
+        "attrs": {"level": level},
+        "content": [{"type": "text", "text": text}],
+    }
+
+
+def para(text: str) -> dict:
+    return {"type": "paragraph", "content": [{"type": "text", "text": text}]}
+
+
+def make_data() -> dict:
+    # code mark can't contain newline, this paragraph fails to render
+    broken = {
+        "type": "paragraph",
+        "content": [{"type": "text", "text": "a\nb", "marks": [{"type": "code"}]}],
+    }
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            para("intro"),  # 0
+            heading(1, "A"),  # 1
+            para("a"),  # 2
+            heading(3, "A.1"),  # 3, skipped level
+            para("a.1"),  # 4
+            heading(2, "A.2"),  # 5
+            broken,  # 6
+            heading(1, "B"),  # 7
+            {"type": "heading", "attrs": {"level": 2, "localId": "x"}},  # 8
+            para("b"),  # 9
+        ],
+    }
+
+
+def test_outline():
+    doc = NodeDoc.from_dict(make_data())
+    assert doc.outline() == [
+        OutlineItem(1, "A", 1),
+        OutlineItem(3, "A.1", 3),
+        OutlineItem(2, "A.2", 5),
+        OutlineItem(1, "B", 7),
+        OutlineItem(2, "", 8, "x"),
+    ]
+    assert doc.outline()[0].to_dict() == {
+        "level": 1,
+        "title": "A",
+        "index": 1,
+        "local_id": None,
+    }
+
+
+def test_sections():
+    doc = NodeDoc.from_dict(make_data())
+    root = doc.sections()
+    assert [
+        (s.level, s.title, s.index, s.body_end, s.end) for s in root.walk()
+    ] == [
+        (0, "", -1, 1, 10),
+        (1, "A", 1, 3, 7),
+        (3, "A.1", 3, 5, 5),
+        (2, "A.2", 5, 7, 7),
+        (1, "B", 7, 8, 10),
+        (2, "", 8, 10, 10),
+    ]
+    a, b = root.children
+    assert [s.title for s in a.children] == ["A.1", "A.2"]
+
+    assert root.to_markdown(include_subsections=False) == "intro\n"
+    assert a.to_markdown(include_subsections=False) == "\n\n# A\n\na\n"
+    assert a.to_markdown(include_heading=False, include_subsections=False) == "a\n"
+    assert a.children[0].extract_text() == "A.1\na.1"
+    assert b.extract_text(include_heading=False) == "b"
+    assert a.nodes(include_subsections=False) == [doc.content[2]]
+
+    # the bodies are rendered on request only, a broken section doesn't
+    # affect the others
+    assert b.to_markdown() == "\n\n# B\n\n## \n\nb\n"
+    with pytest.raises(ValueError):
+        a.to_markdown()
+    assert a.to_markdown(ignore_error=True) == (
+        "\n\n# A\n\na\n\n### A.1\n\na.1\n\n## A.2\n\n"
+    )
+
+
+def test_sample():
+    path = path_enum.dir_adf_samples / "node_doc.json"
+    doc = NodeDoc.from_dict(json.loads(path.read_text(encoding="utf-8")))
+    root = doc.sections()
+    assert root.to_markdown() == doc.to_markdown()
+    assert doc.extract_text() == root.extract_text()
+    sections = list(root.walk())[1:]
+    assert [(s.level, s.title, s.index) for s in sections] == [
+        (item.level, item.title, item.index) for item in doc.outline()
+    ]
+    # the top level sections cover the whole document
+    ends = [root.body_end] + [s.end for s in root.children]
+    assert [s.index for s in root.children] == ends[:-1]
+    assert ends[-1] == len(doc.content)
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "atlas_doc_parser.outline",
+        preview=False,
+    )
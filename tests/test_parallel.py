@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+import json
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from atlas_doc_parser import settings
+from atlas_doc_parser import telemetry
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.parallel import partition
+from atlas_doc_parser.paths import path_enum
+from atlas_doc_parser.synthetic import DocGenerator
+
+
+def test_partition():
+    assert partition([], 4) == []
+    assert partition([1, 2, 3], 1) == [[1, 2, 3]]
+    assert partition([1, 2, 3], 10, weight=lambda x: 1) == [[1], [2], [3]]
+    items = list(range(12))
+    assert partition(items, 3, weight=lambda x: 1) == [
+        [0, 1, 2, 3],
+        [4, 5, 6, 7],
+        [8, 9, 10, 11],
+    ]
+    # a heavy item fills the share of the first group and more
+    assert partition([1, 1, 10, 1, 1], 3, weight=lambda x: x) == [
+        [1, 1, 10],
+        [1],
+        [1],
+    ]
+    # default weight is the number of nodes
+    blocks = [
+        {"type": "paragraph", "content": [{"type": "text", "text": "a"}] * 5},
+        {"type": "paragraph"},
+        {"type": "paragraph"},
+        {"type": "paragraph"},
+        {"type": "paragraph"},
+        {"type": "paragraph"},
+    ]
+    assert [len(group) for group in partition(blocks, 2)] == [1, 5]
+
+
+def test_parallel():
+    path = path_enum.dir_adf_samples / "node_doc.json"
+    data = json.loads(path.read_text(encoding="utf-8"))
+    docs = [
+        {**data, "content": data["content"] * 3},
+        DocGenerator(seed=3, n_nodes=2000).generate(),
+    ]
+    with ThreadPoolExecutor(3) as executor:
+        for data in docs:
+            doc = NodeDoc.from_dict(data)
+            md = doc.to_markdown()
+            for n_groups in [1, 2, 5, 1000]:
+                kwargs = dict(executor=executor, n_groups=n_groups, min_blocks=1)
+                assert NodeDoc.from_dict(data, **kwargs) == doc
+                assert doc.to_markdown(**kwargs) == md
+    with ProcessPoolExecutor(2) as executor:
+        data = docs[0]
+        doc = NodeDoc.from_dict(data)
+        kwargs = dict(executor=executor, n_groups=4, min_blocks=1)
+        assert NodeDoc.from_dict(data, **kwargs) == doc
+        assert doc.to_markdown(**kwargs) == doc.to_markdown()
+
+
+def test_min_blocks():
+    data = DocGenerator(seed=3, n_nodes=200).generate()
+
+    class Executor(ThreadPoolExecutor):
+        n_submit = 0
+
+        def submit(self, *args, **kwargs):
+            self.n_submit += 1
+            return super().submit(*args, **kwargs)
+
+    with Executor(2) as executor:
+        doc = NodeDoc.from_dict(data, executor=executor)
+        doc.to_markdown(executor=executor)
+        assert executor.n_submit == 0
+        min_blocks = len(data["content"])
+        doc = NodeDoc.from_dict(data, executor=executor, min_blocks=min_blocks)
+        doc.to_markdown(executor=executor, min_blocks=min_blocks)
+        assert executor.n_submit > 0
+
+
+def test_thread_context():
+    data = {
+        "type": "doc",
+        "content": [
+            {"type": "paragraph"},
+            {"type": "notAType"},
+            {"type": "paragraph"},
+            {"type": "notAType"},
+        ],
+    }
+    telemetry.reset()
+    with ThreadPoolExecutor(2) as executor:
+        with settings.warn_unimplemented_type(False):
+            doc = NodeDoc.from_dict(data, executor=executor, min_blocks=1)
+    assert len(doc.content) == 2
+    [stat] = telemetry.get_stats()
+    assert (stat.type, stat.occurrences, stat.docs) == ("notAType", 2, 1)
+    telemetry.reset()
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_unit_test
+
+    run_unit_test(__file__)
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.paths import path_enum
+from atlas_doc_parser.preview import (
+    truncate_text,
+    PreviewRenderer,
+    render_preview,
+)
+from atlas_doc_parser.renderer import render_nothing
+from atlas_doc_parser.synthetic import DocGenerator
+from atlas_doc_parser.validator import parse_trusted
+
+
+def test_truncate_text():
+    assert truncate_text("hello world", 20) == "hello world"
+    assert truncate_text("hello world", 8) == "hello"
+    assert truncate_text("hello world", 5) == "hello"
+    assert truncate_text("helloworld", 5) == "hello"
+    assert truncate_text("hello world", 0) == ""
+
+
+def para(*texts: str, marks=None) -> dict:
+    content = []
+    for text in texts:
+        node = {"type": "text", "text": text}
+        if marks:
+            node["marks"] = marks
+        content.append(node)
+    return {"type": "paragraph", "content": content}
+
+
+def cell(text: str, type_: str = "tableCell") -> dict:
+    return {"type": type_, "content": [para(text)]}
+
+
+def make_data() -> dict:
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            para("The quick brown fox ", "jumps over", marks=[{"type": "strong"}]),
+            {
+                "type": "codeBlock",
+                "attrs": {"language": "python"},
+                "content": [{"type": "text", "text": "a = 1\nb = 2\nc = 3\n"}],
+            },
+            {
+                "type": "table",
+                "content": [
+                    {
+                        "type": "tableRow",
+                        "content": [cell("k", "tableHeader"), cell("v", "tableHeader")],
+                    },
+                ]
+                + [
+                    {"type": "tableRow", "content": [cell(f"k{i}"), cell(f"v{i}")]}
+                    for i in range(100)
+                ],
+            },
+        ],
+    }
+
+
+def test_render_preview():
+    doc = NodeDoc.from_dict(make_data())
+
+    # the marks are applied to the cut text
+    assert render_preview(doc, max_chars=12) == "**The quick...**\n"
+    assert render_preview(doc, max_chars=12, ellipsis="") == "**The quick**\n"
+
+    # the code fence is closed
+    md = render_preview(doc, max_chars=41)
+    assert md.endswith("```python\na = 1\nb = 2...\n```\n")
+
+    # the table keeps its header and ends on a complete row
+    md = render_preview(doc, max_chars=54)
+    lines = md.split("\n")
+    assert lines[-3:] == [
+        "| k<br> | v<br> |",
+        "| --- | --- |",
+        "| k0<br> | v0<br> |",
+    ]
+    # the cells after the budget are empty
+    md = render_preview(doc, max_chars=52)
+    assert md.split("\n")[-1] == "| k0<br> |  |"
+
+    # a token budget is converted to characters
+    assert render_preview(doc, max_tokens=3) == render_preview(doc, max_chars=12)
+    assert render_preview(doc, max_chars=0) == ""
+
+    # large enough budget, same as to_markdown()
+    renderer = PreviewRenderer(max_chars=10_000)
+    assert renderer.render(doc) == doc.to_markdown()
+    assert renderer.truncated is False
+    renderer = PreviewRenderer(max_chars=52)
+    renderer.render(doc)
+    assert renderer.truncated is True
+
+
+def test_handlers():
+    doc = NodeDoc.from_dict(make_data())
+    md = render_preview(doc, max_chars=100, node_handlers={"codeBlock": render_nothing})
+    assert "```" not in md
+    renderer = PreviewRenderer(max_chars=12).with_handlers(
+        mark_handlers={"strong": lambda text, mark: f"<b>{text}</b>"}
+    )
+    assert renderer.render(doc) == "<b>The quick...</b>\n"
+
+
+def test_large_cell():
+    big_cell = {
+        "type": "tableCell",
+        "content": [
+            {
+                "type": "codeBlock",
+                "content": [{"type": "text", "text": "x = 1; " * 2000}],
+            },
+            {
+                "type": "bulletList",
+                "content": [
+                    {"type": "listItem", "content": [para("item " * 20)]}
+                    for _ in range(100)
+                ],
+            },
+        ],
+    }
+    data = {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {
+                "type": "table",
+                "content": [
+                    {"type": "tableRow", "content": [cell("a"), big_cell, cell("b")]},
+                    {"type": "tableRow", "content": [cell("c"), big_cell, cell("d")]},
+                ],
+            },
+        ],
+    }
+    doc = NodeDoc.from_dict(data)
+    for max_chars in [10, 200, 1000]:
+        md = render_preview(doc, max_chars=max_chars)
+        # the content is cut inside the cell, only the syntax is on top
+        assert len(md) < max_chars + 50
+        assert md.count("\n") == 0
+        assert md.startswith("| a<br> | ```<br>x = 1;")
+        assert md.endswith(" |  |")
+
+
+def test_well_formed():
+    path = path_enum.dir_adf_samples / "node_doc.json"
+    docs = [NodeDoc.from_dict(json.loads(path.read_text(encoding="utf-8")))]
+    for seed in range(30):
+        docs.append(parse_trusted(DocGenerator(seed=seed, n_nodes=150).generate()))
+    for doc in docs:
+        try:
+            expected = doc.to_markdown()
+        except Exception:
+            continue
+        assert render_preview(doc, max_chars=len(expected) * 2) == expected
+        for max_chars in [1, 10, 50, 200]:
+            md = render_preview(doc, max_chars=max_chars)
+            assert md.count("```") % 2 == 0
+            for line in md.split("\n"):
+                if line.startswith("| "):
+                    assert line.endswith(" |")
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "atlas_doc_parser.preview",
+        preview=False,
+    )
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+import pytest
+
+from atlas_doc_parser.profiler import Profiler
+from atlas_doc_parser.renderer import DEFAULT_RENDERER, NODE_HANDLERS
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.nodes.node_text import NodeText
+from atlas_doc_parser.nodes.node_bullet_list import NodeBulletList
+from atlas_doc_parser.paths import path_enum
+
+
+def test_profiler():
+    path = path_enum.dir_adf_samples / "node_doc.json"
+    data = json.loads(path.read_text(encoding="utf-8"))
+    expected = NodeDoc.from_dict(data).to_markdown()
+
+    text_from_dict = NodeText.__dict__.get("from_dict")
+    doc_from_dict = NodeDoc.__dict__["from_dict"]
+    doc_to_markdown = NodeDoc.__dict__["to_markdown"]
+
+    with Profiler() as profiler:
+        doc = NodeDoc.from_dict(data)
+        assert doc.to_markdown() == expected
+        with pytest.raises(RuntimeError):
+            Profiler().start()
+
+    # the original methods are restored
+    assert NodeText.__dict__.get("from_dict") is text_from_dict
+    assert NodeDoc.__dict__["from_dict"] is doc_from_dict
+    assert NodeDoc.__dict__["to_markdown"] is doc_to_markdown
+    assert DEFAULT_RENDERER.node_handlers == NODE_HANDLERS
+
+    data = profiler.to_dict()
+    doc_stats = data["NodeDoc"]
+    assert doc_stats["from_dict"]["calls"] == 1
+    assert doc_stats["to_markdown"]["calls"] == 1
+    assert doc_stats["to_markdown"]["output_bytes"] == len(expected.encode("utf-8"))
+    for method in ["from_dict", "to_markdown"]:
+        stats = doc_stats[method]
+        # the root's self time excludes all the children
+        assert 0 < stats["self_time"] < stats["cum_time"]
+        cum_time = sum(d[method]["self_time"] for d in data.values() if method in d)
+        assert cum_time == pytest.approx(stats["cum_time"], rel=0.05)
+
+    # nested bullet lists call to_markdown recursively
+    list_stats = data["NodeBulletList"]["to_markdown"]
+    assert list_stats["calls"] > 1
+    assert list_stats["self_time"] <= list_stats["cum_time"]
+
+    profiler.reset()
+    assert profiler.to_dict() == {}
+
+    # profiler can be restarted
+    with Profiler(classes=[NodeBulletList]) as profiler:
+        NodeDoc.from_dict({"type": "doc", "version": 1, "content": []})
+    assert profiler.to_dict() == {}
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "atlas_doc_parser.profiler",
+        preview=False,
+    )
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+import pytest
+
+from atlas_doc_parser.exc import UnimplementedTypeError
+from atlas_doc_parser.raw_render import raw_to_markdown, raw_extract_text
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.paths import path_enum
+
+SAMPLE_PATHS = sorted(path_enum.dir_adf_samples.glob("*.json"))
+
+
+@pytest.mark.parametrize("path", SAMPLE_PATHS, ids=lambda p: p.stem)
+def test_byte_identical_to_node_doc(path):
+    data = json.loads(path.read_text(encoding="utf-8"))
+    for ignore_error in [False, True]:
+        expected = NodeDoc.from_dict(data).to_markdown(ignore_error=ignore_error)
+        assert raw_to_markdown(data, ignore_error=ignore_error) == expected
+
+
+@pytest.mark.parametrize("path", SAMPLE_PATHS, ids=lambda p: p.stem)
+def test_extract_text_identical_to_node_doc(path):
+    data = json.loads(path.read_text(encoding="utf-8"))
+    doc = NodeDoc.from_dict(data)
+    assert raw_extract_text(data) == doc.extract_text()
+    kwargs = dict(block_sep="\n\n", cell_sep=" | ")
+    assert raw_extract_text(data, **kwargs) == doc.extract_text(**kwargs)
+
+
+def test_edge_cases():
+    data = {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {
+                "type": "orderedList",
+                "attrs": {"order": 3},
+                "content": [
+                    {
+                        "type": "listItem",
+                        "content": [
+                            {
+                                "type": "paragraph",
+                                "content": [
+                                    {
+                                        "type": "text",
+                                        "text": "link",
+                                        "marks": [
+                                            {"type": "unknownMark"},
+                                            {
+                                                "type": "link",
+                                                "attrs": {"href": "https://a.com"},
+                                            },
+                                            {"type": "strong"},
+                                        ],
+                                    },
+                                    {"type": "placeholder"},
+                                ],
+                            },
+                        ],
+                    },
+                ],
+            },
+            {
+                "type": "decisionList",
+                "attrs": {"localId": "1"},
+                "content": [
+                    {
+                        "type": "decisionItem",
+                        "attrs": {"localId": "2", "state": "DECIDED"},
+                        "content": [{"type": "text", "text": "decided"}],
+                    },
+                ],
+            },
+            {
+                "type": "mediaSingle",
+                "content": [
+                    {
+                        "type": "media",
+                        "attrs": {"type": "file", "id": "abc", "collection": "c"},
+                    }
+                ],
+            },
+        ],
+    }
+    expected = NodeDoc.from_dict(data).to_markdown()
+    assert raw_to_markdown(data) == expected
+    assert "3. **[link](https://a.com)**" in expected
+
+    with pytest.raises(UnimplementedTypeError):
+        raw_to_markdown({"type": "bodiedExtension"})
+    with pytest.raises(UnimplementedTypeError):
+        raw_extract_text({"type": "bodiedExtension"})
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "atlas_doc_parser.raw_render",
+        preview=False,
+    )
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+from atlas_doc_parser.render_report import to_markdown_with_report
+from atlas_doc_parser.interning import interning
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+
+
+def make_data() -> dict:
+    code_text = {
+        "type": "text",
+        "text": "a\nb",
+        "marks": [{"type": "code"}],  # code mark can't contain newline
+    }
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {"type": "paragraph", "content": [{"type": "text", "text": "ok"}]},
+            {"type": "paragraph", "content": [code_text]},
+            {
+                "type": "bulletList",
+                "content": [
+                    {
+                        "type": "listItem",
+                        "content": [
+                            {"type": "paragraph", "content": [code_text]},
+                        ],
+                    }
+                ],
+            },
+        ],
+    }
+
+
+def test_to_markdown_with_report():
+    data = make_data()
+    doc = NodeDoc.from_dict(data)
+    for node in [doc, data]:
+        md, report = to_markdown_with_report(node)
+        assert md == doc.to_markdown(ignore_error=True)
+        assert report.ok is False
+        assert report.to_dict() == {
+            "errors": [
+                {
+                    "path": "content[1]",
+                    "type": "paragraph",
+                    "error": "ValueError",
+                    "origin_path": "content[1].content[0]",
+                    "origin_type": "text",
+                },
+                {
+                    "path": "content[2]",
+                    "type": "bulletList",
+                    "error": "ValueError",
+                    "origin_path": "content[2].content[0].content[0].content[0]",
+                    "origin_type": "text",
+                },
+            ],
+            "lost_nodes": 2 + 4,
+        }
+
+    data["content"] = data["content"][:1]
+    md, report = to_markdown_with_report(NodeDoc.from_dict(data))
+    assert md == "ok\n"
+    assert report.ok is True
+    assert report.to_dict() == {"errors": [], "lost_nodes": 0}
+
+
+def test_shared_nodes():
+    data = make_data()
+    ok_paragraph, code_paragraph = data["content"][:2]
+    data["content"] = [
+        code_paragraph,
+        ok_paragraph,
+        code_paragraph,
+        {
+            "type": "table",
+            "content": [
+                {
+                    "type": "tableRow",
+                    "content": [
+                        {"type": "tableCell", "content": [ok_paragraph]},
+                        {"type": "tableCell", "content": [code_paragraph]},
+                    ],
+                },
+            ],
+        },
+    ]
+    with interning():
+        doc = NodeDoc.from_dict(data)
+    # the identical nodes are the same object
+    assert doc.content[0] is doc.content[2]
+
+    # the dicts loaded from JSON are not shared
+    for node in [doc, json.loads(json.dumps(data))]:
+        md, report = to_markdown_with_report(node)
+        assert md == doc.to_markdown(ignore_error=True)
+        assert [
+            (error.path, error.type, error.origin_path, error.origin_type)
+            for error in report.errors
+        ] == [
+            ("content[0]", "paragraph", "content[0].content[0]", "text"),
+            ("content[2]", "paragraph", "content[2].content[0]", "text"),
+            (
+                "content[3]",
+                "table",
+                "content[3].content[0].content[1].content[0].content[0]",
+                "text",
+            ),
+        ]
+        assert report.lost_nodes == 2 + 2 + 8
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "atlas_doc_parser.render_report",
+        preview=False,
+    )
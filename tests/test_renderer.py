@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+import pytest
+
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.renderer import (
+    MarkdownRenderer,
+    DEFAULT_RENDERER,
+    NODE_HANDLERS,
+    render_nothing,
+)
+from atlas_doc_parser.raw_render import raw_to_markdown
+from atlas_doc_parser.nodes.parse_node import NODE_TYPE_TO_CLASS_MAPPING
+from atlas_doc_parser.paths import path_enum
+from atlas_doc_parser.synthetic import DocGenerator
+from atlas_doc_parser.validator import parse_trusted
+
+
+def iter_docs():
+    for path in sorted(path_enum.dir_adf_samples.glob("*.json")):
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("type") == "doc":
+            yield NodeDoc.from_dict(data)
+    for seed in range(100):
+        yield parse_trusted(DocGenerator(seed=seed, n_nodes=150).generate())
+
+
+def render_or_error(func, ignore_error: bool):
+    try:
+        return func(ignore_error=ignore_error)
+    except Exception as e:
+        return type(e)
+
+
+def test_default_renderer():
+    # the raw engine has its own rules, it checks the handlers
+    for doc in iter_docs():
+        data = doc.to_dict()
+        for ignore_error in [False, True]:
+            expected = render_or_error(
+                lambda ignore_error: raw_to_markdown(data, ignore_error),
+                ignore_error,
+            )
+            md = render_or_error(
+                lambda ignore_error: DEFAULT_RENDERER.render(doc, ignore_error),
+                ignore_error,
+            )
+            assert md == expected
+            assert render_or_error(doc.to_markdown, ignore_error) == md
+
+
+def test_every_type_has_handler():
+    assert set(NODE_HANDLERS) == set(NODE_TYPE_TO_CLASS_MAPPING)
+
+
+def make_data() -> dict:
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {
+                "type": "paragraph",
+                "content": [
+                    {"type": "text", "text": "see ", "marks": [{"type": "strong"}]},
+                    {
+                        "type": "text",
+                        "text": "docs",
+                        "marks": [{"type": "link", "attrs": {"href": "https://a.com"}}],
+                    },
+                ],
+            },
+            {
+                "type": "mediaSingle",
+                "attrs": {"layout": "center"},
+                "content": [
+                    {
+                        "type": "media",
+                        "attrs": {"type": "external", "url": "https://a.com/x.png"},
+                    }
+                ],
+            },
+            {
+                "type": "bulletList",
+                "content": [
+                    {
+                        "type": "listItem",
+                        "content": [
+                            {
+                                "type": "extension",
+                                "attrs": {
+                                    "extensionType": "com.atlassian.confluence.macro.core",
+                                    "extensionKey": "toc",
+                                },
+                            }
+                        ],
+                    }
+                ],
+            },
+        ],
+    }
+
+
+def test_override():
+    doc = NodeDoc.from_dict(make_data())
+    assert DEFAULT_RENDERER.render(doc) == doc.to_markdown()
+    assert "![media](https://a.com/x.png)" in doc.to_markdown()
+    assert "- [Extension: com.atlassian.confluence.macro.core/toc]" in doc.to_markdown()
+
+    def render_extension(renderer, node, ignore_error, level):
+        return f"<!-- macro: {node.attrs.extensionKey} -->"
+
+    renderer = MarkdownRenderer(
+        node_handlers={
+            "media": render_nothing,
+            "extension": render_extension,
+        },
+    )
+    md = renderer.render(doc)
+    assert "![media]" not in md
+    # nested handlers are looked up in the table too
+    assert "- <!-- macro: toc -->" in md
+
+    # with_handlers() keeps the existing overrides and doesn't change self
+    renderer_2 = renderer.with_handlers(
+        mark_handlers={"link": lambda text, mark: f"<{mark.attrs.href}>"},
+    )
+    md_2 = renderer_2.render(doc)
+    assert "**see **<https://a.com>" in md_2
+    assert "<!-- macro: toc -->" in md_2
+    assert "[docs](https://a.com)" in renderer.render(doc)
+    assert DEFAULT_RENDERER.render(doc) == doc.to_markdown()
+
+
+def test_ignore_error():
+    def fail(renderer, node, ignore_error, level):
+        raise ValueError(node.type)
+
+    doc = NodeDoc.from_dict(make_data())
+    renderer = MarkdownRenderer(node_handlers={"media": fail})
+    with pytest.raises(ValueError):
+        renderer.render(doc)
+    md = renderer.render(doc, ignore_error=True)
+    assert md.startswith("**see **[docs](https://a.com)")
+    assert "media" not in md
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "atlas_doc_parser.renderer",
+        preview=False,
+    )
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.renderer import render_nothing
+from atlas_doc_parser.resolve import (
+    BaseResolver,
+    InMemoryResolver,
+    ResolverCache,
+    References,
+    collect_references,
+    resolve_references,
+    ResolvingRenderer,
+    render_resolved,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def mention(account_id: str, text: str = "@Old Name") -> dict:
+    return {"type": "mention", "attrs": {"id": account_id, "text": text}}
+
+
+def inline_card(url: str) -> dict:
+    return {"type": "inlineCard", "attrs": {"url": url}}
+
+
+def media(media_id: str) -> dict:
+    return {
+        "type": "mediaSingle",
+        "content": [
+            {
+                "type": "media",
+                "attrs": {"type": "file", "id": media_id, "collection": "c"},
+            }
+        ],
+    }
+
+
+def make_doc(*content: dict) -> NodeDoc:
+    return NodeDoc.from_dict({"type": "doc", "version": 1, "content": list(content)})
+
+
+def make_docs() -> list[NodeDoc]:
+    return [
+        make_doc(
+            {
+                "type": "paragraph",
+                "content": [
+                    mention("u1"),
+                    {"type": "text", "text": " see "},
+                    inline_card("https://a.example.com"),
+                ],
+            },
+            media("m1"),
+        ),
+        make_doc(
+            {"type": "paragraph", "content": [mention("u1"), mention("u2")]},
+            {"type": "blockCard", "attrs": {"url": "https://b.example.com"}},
+        ),
+    ]
+
+
+def make_resolver() -> InMemoryResolver:
+    return InMemoryResolver(
+        users={"u1": "Alice", "u2": "Bob"},
+        media={"m1": "https://cdn.example.com/m1.png"},
+        urls={"https://a.example.com": "Page A"},
+    )
+
+
+def test_collect_references():
+    docs = make_docs()
+    refs = collect_references(docs)
+    assert refs == References(
+        users=["u1", "u2"],
+        media=["m1"],
+        urls=["https://a.example.com", "https://b.example.com"],
+    )
+    # raw dicts work too
+    assert collect_references([doc.to_dict() for doc in docs]) == refs
+
+
+def test_render_resolved():
+    docs = make_docs()
+    resolver = make_resolver()
+    md_list = render_resolved(docs, resolver)
+    assert md_list == [
+        "@Alice see [Page A](https://a.example.com)\n"
+        "\n![media](https://cdn.example.com/m1.png)",
+        "@Alice@Bob\n\n[https://b.example.com](https://b.example.com)\n",
+    ]
+    # one bulk call per kind for the whole batch
+    assert resolver.calls == [
+        ("user", ["u1", "u2"]),
+        ("media", ["m1"]),
+        ("url", ["https://a.example.com", "https://b.example.com"]),
+    ]
+
+    # nothing resolved, same as to_markdown()
+    md_list = render_resolved(docs, BaseResolver())
+    assert md_list == [doc.to_markdown() for doc in docs]
+
+    # custom handlers are kept
+    md_list = render_resolved(
+        docs, make_resolver(), node_handlers={"mention": render_nothing}
+    )
+    assert md_list[1].startswith("\n")
+    renderer = ResolvingRenderer(resolve_references(References(), BaseResolver()))
+    renderer = renderer.with_handlers(node_handlers={"mediaSingle": render_nothing})
+    assert renderer.render(docs[0]) == docs[0].to_markdown().replace(
+        "![media](media:m1)", ""
+    )
+
+
+def test_nested_containers():
+    doc = make_doc(
+        {
+            "type": "decisionList",
+            "attrs": {"localId": "l1"},
+            "content": [
+                {
+                    "type": "decisionItem",
+                    "attrs": {"state": "DECIDED", "localId": "i1"},
+                    "content": [mention("u1")],
+                }
+            ],
+        },
+        {
+            "type": "panel",
+            "attrs": {"panelType": "info"},
+            "content": [{"type": "paragraph", "content": [mention("u2")]}],
+        },
+        {
+            "type": "table",
+            "content": [
+                {
+                    "type": "tableRow",
+                    "content": [
+                        {
+                            "type": "tableCell",
+                            "content": [
+                                {
+                                    "type": "paragraph",
+                                    "content": [inline_card("https://a.example.com")],
+                                }
+                            ],
+                        }
+                    ],
+                }
+            ],
+        },
+    )
+    (md,) = render_resolved([doc], make_resolver())
+    assert "> @Alice" in md
+    assert "> @Bob" in md
+    assert "| [Page A](https://a.example.com)<br> |" in md
+    assert "Old Name" not in md
+
+
+def test_media_inline():
+    def media_inline(media_id: str, **attrs) -> dict:
+        return {
+            "type": "mediaInline",
+            "attrs": {"id": media_id, "collection": "c", **attrs},
+        }
+
+    doc = make_doc(
+        {
+            "type": "paragraph",
+            "content": [
+                media_inline("m1", type="file", alt="spec.pdf"),
+                {"type": "text", "text": " "},
+                media_inline("m1", type="image"),
+                media_inline("m2"),
+            ],
+        }
+    )
+    resolver = make_resolver()
+    (md,) = render_resolved([doc], resolver)
+    assert md == (
+        "[spec.pdf](https://cdn.example.com/m1.png) "
+        "![media](https://cdn.example.com/m1.png)\n"
+    )
+    assert resolver.calls == [("media", ["m1", "m2"])]
+
+
+def test_cache_ttl():
+    docs = make_docs()
+    resolver = make_resolver()
+    clock = FakeClock()
+    cache = ResolverCache(ttl=60, clock=clock)
+    first = render_resolved(docs, resolver, cache=cache)
+    assert len(resolver.calls) == 3
+    assert len(cache) == 5
+
+    # everything is cached, the unresolved URL included
+    clock.now = 59
+    assert render_resolved(docs, resolver, cache=cache) == first
+    assert len(resolver.calls) == 3
+    assert cache.hits == 5
+
+    # only the new key is looked up
+    new_doc = make_doc({"type": "paragraph", "content": [mention("u1"), mention("u3")]})
+    assert render_resolved([new_doc], resolver, cache=cache) == ["@Alice@Old Name\n"]
+    assert resolver.calls[-1] == ("user", ["u3"])
+    assert len(resolver.calls) == 4
+
+    # expired
+    clock.now = 60
+    assert render_resolved(docs, resolver, cache=cache) == first
+    assert resolver.calls[-3:] == [
+        ("user", ["u1", "u2"]),
+        ("media", ["m1"]),
+        ("url", ["https://a.example.com", "https://b.example.com"]),
+    ]
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == 0
+
+
+def test_cache_eviction():
+    cache = ResolverCache(maxsize=2, clock=FakeClock())
+    cache.set_many("user", {"u1": "Alice", "u2": "Bob"})
+    # u1 is now the most recently used
+    assert cache.get_many("user", ["u1"]) == ({"u1": "Alice"}, [])
+    cache.set_many("user", {"u3": None})
+    assert len(cache) == 2
+    assert cache.get_many("user", ["u1", "u2", "u3"]) == (
+        {"u1": "Alice", "u3": None},
+        ["u2"],
+    )
+    # the kinds don't collide
+    assert cache.get_many("url", ["u1"]) == ({}, ["u1"])
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "atlas_doc_parser.resolve",
+        preview=False,
+    )
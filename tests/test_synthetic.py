@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+import pytest
+
+from atlas_doc_parser import synthetic
+from atlas_doc_parser.synthetic import DocGenerator, make_doc, write_jsonl
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.raw_render import raw_to_markdown
+
+
+def walk(dct: dict, depth: int = 0):
+    yield dct, depth
+    for child in dct.get("content", []):
+        yield from walk(child, depth + 1)
+
+
+def test_deterministic():
+    assert make_doc(seed=1) == make_doc(seed=1)
+    assert make_doc(seed=1) != make_doc(seed=2)
+    gen = DocGenerator(seed=1)
+    assert gen.generate() != gen.generate()
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("max_depth", [2, 4, 8])
+def test_valid(seed, max_depth):
+    data = make_doc(seed=seed, n_nodes=100, max_depth=max_depth, mark_density=0.5)
+    md = NodeDoc.from_dict(data).to_markdown()
+    assert raw_to_markdown(data) == md
+
+    nodes = list(walk(data))
+    assert len(nodes) >= 100
+    # lists need 3 levels, tables need 4, so the limit holds from 4 on
+    if max_depth >= 4:
+        assert max(depth for _, depth in nodes) <= max_depth
+
+
+def test_controls():
+    data = make_doc(seed=1, n_nodes=2000, mark_density=0.0)
+    assert len(list(walk(data))) < 2200
+    assert all("marks" not in node for node, _ in walk(data))
+
+    data = make_doc(seed=1, n_nodes=2000, mark_density=1.0)
+    paragraphs = [node for node, _ in walk(data) if node["type"] == "paragraph"]
+    assert all("marks" in node for node in paragraphs)
+    texts = [
+        child
+        for node in paragraphs
+        for child in node.get("content", [])
+        if child["type"] == "text"
+    ]
+    assert all("marks" in node for node in texts)
+
+    data = make_doc(
+        seed=1, n_nodes=300, table_rows=3, table_cols=5, exclude=["extension"]
+    )
+    tables = [node for node, _ in walk(data) if node["type"] == "table"]
+    assert tables
+    for table in tables:
+        assert len(table["content"]) == 3
+        assert all(len(row["content"]) == 5 for row in table["content"])
+
+    data = make_doc(seed=1, n_nodes=300, exclude=["extension", "table"])
+    assert all(node["type"] != "table" for node, _ in walk(data))
+
+    with pytest.raises(ValueError):
+        DocGenerator(n_nodes=0)
+
+
+def test_write_jsonl(tmp_path, monkeypatch):
+    path = tmp_path / "corpus.jsonl"
+    n_bytes = write_jsonl(path, n_docs=5, seed=1, n_nodes=50)
+    assert path.stat().st_size == n_bytes
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 5
+    gen = DocGenerator(seed=1, n_nodes=50)
+    assert [json.loads(line) for line in lines] == [gen.generate() for _ in range(5)]
+
+    # the non ASCII characters are written as is, in UTF-8
+    monkeypatch.setattr(synthetic, "WORDS", ("café", "日本語"))
+    n_bytes = write_jsonl(path, n_docs=5, seed=1, n_nodes=50)
+    assert path.stat().st_size == n_bytes
+    assert "日本語" in path.read_text(encoding="utf-8")
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "atlas_doc_parser.synthetic",
+        preview=False,
+    )
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from atlas_doc_parser.table_grid import (
+    escape_table_cell,
+    raw_cell_spans,
+    iter_row_texts,
+    make_column_names,
+    TableGrid,
+)
+from atlas_doc_parser.nodes.node_table import NodeTable
+from atlas_doc_parser.raw_render import raw_to_markdown
+
+
+def old_escape_table_cell(md: str) -> str:
+    md = md.replace("|", "\\|")
+    lines = []
+    for line in md.split("\n"):
+        stripped = line.lstrip(" ")
+        leading_spaces = len(line) - len(stripped)
+        if leading_spaces > 0:
+            line = "&nbsp;" * leading_spaces + stripped
+        lines.append(line)
+    return "<br>".join(lines)
+
+
+@pytest.mark.parametrize(
+    "md",
+    [
+        "",
+        "a",
+        "a | b",
+        " a",
+        "a\nb",
+        "- a\n    - b\n  c \n",
+        "\n\n  ",
+        "a  b\n |",
+    ],
+)
+def test_escape_table_cell(md):
+    assert escape_table_cell(md) == old_escape_table_cell(md)
+
+
+def cell(text: str, type_: str = "tableCell", colspan: int = 1, rowspan: int = 1):
+    dct = {
+        "type": type_,
+        "content": [{"type": "paragraph", "content": [{"type": "text", "text": text}]}],
+    }
+    if (colspan, rowspan) != (1, 1):
+        dct["attrs"] = {"colspan": colspan, "rowspan": rowspan}
+    return dct
+
+
+def table(*rows: list[dict]) -> dict:
+    return {
+        "type": "table",
+        "content": [{"type": "tableRow", "content": row} for row in rows],
+    }
+
+
+def test_from_rows():
+    # a | b b | c
+    # a | d | e | f
+    # g | h h h
+    #     (short row)
+    rows = [
+        ["a", "b", "c"],
+        ["d", "e", "f"],
+        ["g", "h"],
+        [],
+    ]
+    spans = {"a": (1, 2), "b": (2, 1), "h": (3, 5)}
+    grid = TableGrid.from_rows(rows, lambda c: spans.get(c, (1, 1)))
+    assert grid.n_rows == 4
+    assert grid.n_cols == 4
+    assert grid.slots == [
+        ["a", "b", "b", "c"],
+        ["a", "d", "e", "f"],
+        ["g", "h", "h", "h"],
+        [None, "h", "h", "h"],
+    ]
+    assert grid.origins == [
+        [True, True, False, True],
+        [False, True, True, True],
+        [True, True, False, False],
+        [True, False, False, False],
+    ]
+    assert grid.to_markdown(str.upper, header=True) == "\n".join(
+        [
+            "| A | B |  | C |",
+            "| --- | --- | --- | --- |",
+            "|  | D | E | F |",
+            "| G | H |  |  |",
+            "|  |  |  |  |",
+        ]
+    )
+
+    grid = TableGrid.from_rows([[], []], lambda c: (1, 1))
+    assert (grid.n_rows, grid.n_cols) == (2, 0)
+
+
+def test_spans():
+    data = table(
+        [cell("h1", "tableHeader", colspan=2), cell("h2", "tableHeader")],
+        [cell("a", rowspan=2), cell("b"), cell("c")],
+        [cell("d"), cell("e")],
+        [cell("f")],
+    )
+    expected = "\n".join(
+        [
+            "| h1<br> |  | h2<br> |",
+            "| --- | --- | --- |",
+            "| a<br> | b<br> | c<br> |",
+            "|  | d<br> | e<br> |",
+            "| f<br> |  |  |",
+        ]
+    )
+    assert NodeTable.from_dict(data).to_markdown() == expected
+    assert raw_to_markdown(data) == expected
+    assert raw_cell_spans({"type": "tableCell", "attrs": {"colspan": 0}}) == (1, 1)
+
+
+def test_header_column():
+    # only the first row can be the header row of a Markdown table
+    data = table(
+        [cell("k1", "tableHeader"), cell("v1")],
+        [cell("k2", "tableHeader"), cell("v2")],
+    )
+    expected = "| k1<br> | v1<br> |\n| --- | --- |\n| k2<br> | v2<br> |"
+    assert NodeTable.from_dict(data).to_markdown() == expected
+    assert raw_to_markdown(data) == expected
+
+
+def test_iter_row_texts():
+    rows = [
+        ["a", "b", "c"],
+        ["d", "e", "f"],
+        ["g", "h"],
+        [],
+    ]
+    spans = {"a": (1, 2), "b": (2, 1), "h": (3, 5)}
+    calls = []
+
+    def get_text(c):
+        calls.append(c)
+        return c.upper()
+
+    texts = list(iter_row_texts(rows, lambda c: spans.get(c, (1, 1)), get_text))
+    assert texts == [
+        ["A", "B", "B", "C"],
+        ["A", "D", "E", "F"],
+        ["G", "H", "H", "H"],
+        ["", "H", "H", "H"],
+    ]
+    # the text of a cell is extracted once
+    assert sorted(calls) == list("abcdefgh")
+
+    texts = list(
+        iter_row_texts(rows, lambda c: spans.get(c, (1, 1)), str.upper, fill_spans=False)
+    )
+    assert texts == [
+        ["A", "B", "", "C"],
+        ["", "D", "E", "F"],
+        ["G", "H", "", ""],
+        ["", "", "", ""],
+    ]
+
+
+def test_make_column_names():
+    assert make_column_names(["a", "", "b", "a", "a", "a_2"]) == [
+        "a",
+        "column_2",
+        "b",
+        "a_2",
+        "a_3",
+        "a_2_2",
+    ]
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "atlas_doc_parser.table_grid",
+        preview=False,
+    )
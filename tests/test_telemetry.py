@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+import pickle
+import logging
+
+from atlas_doc_parser import telemetry
+from atlas_doc_parser.exc import UnimplementedTypeError
+from atlas_doc_parser.arena import ArenaDoc
+from atlas_doc_parser.raw_render import raw_to_markdown
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.nodes.node_paragraph import NodeParagraph
+
+
+def make_doc(n: int) -> dict:
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {
+                "type": "paragraph",
+                "content": [
+                    {"type": "text", "text": "a", "marks": [{"type": "unknownMark"}]},
+                ],
+            },
+        ]
+        + [{"type": "bodiedExtension"}] * n,
+    }
+
+
+def test_unimplemented_type_error():
+    e = UnimplementedTypeError("bodiedExtension", "node")
+    assert str(e).startswith("Node type 'bodiedExtension' is not yet implemented.")
+    e = pickle.loads(pickle.dumps(e))
+    assert (e.type_value, e.category) == ("bodiedExtension", "node")
+
+
+def test_telemetry(caplog):
+    telemetry.reset()
+    with caplog.at_level(logging.WARNING, logger="atlas_doc_parser"):
+        NodeDoc.from_dict(make_doc(3))
+        NodeDoc.from_dict(make_doc(2))
+        raw_to_markdown(make_doc(1))
+        ArenaDoc.from_dict(make_doc(1))
+        # not a document, only occurrences are counted
+        NodeParagraph.from_dict(make_doc(0)["content"][0])
+    # one warning per type
+    assert len(caplog.records) == 2
+
+    stats = telemetry.get_stats()
+    assert [stat.to_dict() for stat in stats] == [
+        dict(category="node", type="bodiedExtension", occurrences=7, docs=4),
+        dict(category="mark", type="unknownMark", occurrences=5, docs=4),
+    ]
+    assert telemetry.summary() == (
+        "node 'bodiedExtension': 7 occurrences in 4 docs\n"
+        "mark 'unknownMark': 5 occurrences in 4 docs"
+    )
+
+    telemetry.reset()
+    assert telemetry.get_stats() == []
+    caplog.clear()
+    with caplog.at_level(logging.WARNING, logger="atlas_doc_parser"):
+        NodeDoc.from_dict(make_doc(1))
+    # warnings are logged again after reset
+    assert len(caplog.records) == 2
+    telemetry.reset()
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "atlas_doc_parser.telemetry",
+        preview=False,
+    )
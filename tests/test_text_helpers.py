@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+
+DATA = {
+    "type": "doc",
+    "version": 1,
+    "content": [
+        {
+            "type": "heading",
+            "attrs": {"level": 1},
+            "content": [{"type": "text", "text": "Title"}],
+        },
+        {
+            "type": "paragraph",
+            "content": [
+                {"type": "text", "text": "run ", "marks": [{"type": "strong"}]},
+                {"type": "text", "text": "x", "marks": [{"type": "code"}]},
+                {"type": "text", "text": " by "},
+                {"type": "mention", "attrs": {"id": "1", "text": "@alice"}},
+                {"type": "text", "text": " "},
+                {"type": "emoji", "attrs": {"shortName": ":smile:", "text": "😄"}},
+                {"type": "hardBreak"},
+                {"type": "status", "attrs": {"text": "DONE", "color": "green"}},
+                {"type": "text", "text": " "},
+                {"type": "inlineCard", "attrs": {"url": "https://a.com"}},
+            ],
+        },
+        {"type": "paragraph"},
+        {"type": "rule"},
+        {
+            "type": "bulletList",
+            "content": [
+                {
+                    "type": "listItem",
+                    "content": [
+                        {
+                            "type": "paragraph",
+                            "content": [{"type": "text", "text": "a"}],
+                        },
+                        {
+                            "type": "bulletList",
+                            "content": [
+                                {
+                                    "type": "listItem",
+                                    "content": [
+                                        {
+                                            "type": "paragraph",
+                                            "content": [{"type": "text", "text": "b"}],
+                                        }
+                                    ],
+                                }
+                            ],
+                        },
+                    ],
+                }
+            ],
+        },
+        {
+            "type": "table",
+            "content": [
+                {
+                    "type": "tableRow",
+                    "content": [
+                        {
+                            "type": "tableHeader",
+                            "content": [
+                                {
+                                    "type": "paragraph",
+                                    "content": [{"type": "text", "text": "k"}],
+                                }
+                            ],
+                        },
+                        {
+                            "type": "tableHeader",
+                            "content": [
+                                {
+                                    "type": "paragraph",
+                                    "content": [{"type": "text", "text": "v"}],
+                                }
+                            ],
+                        },
+                    ],
+                },
+                {
+                    "type": "tableRow",
+                    "content": [
+                        {
+                            "type": "tableCell",
+                            "content": [
+                                {
+                                    "type": "paragraph",
+                                    "content": [{"type": "text", "text": "1"}],
+                                },
+                                {
+                                    "type": "paragraph",
+                                    "content": [{"type": "text", "text": "2"}],
+                                },
+                            ],
+                        },
+                        {
+                            "type": "tableCell",
+                            "content": [{"type": "paragraph"}],
+                        },
+                    ],
+                },
+            ],
+        },
+        {"type": "blockCard", "attrs": {"url": "https://b.com"}},
+    ],
+}
+
+
+def test_extract_text():
+    doc = NodeDoc.from_dict(DATA)
+    assert doc.extract_text() == (
+        "Title\n"
+        "run x by @alice 😄\n"
+        "DONE https://a.com\n"
+        "a\n"
+        "b\n"
+        "k\tv\n"
+        "1 2\t\n"
+        "https://b.com"
+    )
+    assert doc.extract_text(block_sep="\n\n", cell_sep=" | ") == (
+        "Title\n\n"
+        "run x by @alice 😄\n\n"
+        "DONE https://a.com\n\n"
+        "a\n\n"
+        "b\n\n"
+        "k | v\n\n"
+        "1 2 | \n\n"
+        "https://b.com"
+    )
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "atlas_doc_parser.text_helpers",
+        preview=False,
+    )
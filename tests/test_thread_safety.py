@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from atlas_doc_parser import settings
+from atlas_doc_parser import mark_or_node
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.nodes.parse_node import NODE_TYPE_TO_CLASS_MAPPING
+from atlas_doc_parser.paths import path_enum
+
+SAMPLE_PATHS = sorted(path_enum.dir_adf_samples.glob("*.json"))
+
+
+def convert(data: dict) -> str:
+    return NodeDoc.from_dict(data).to_markdown(ignore_error=True)
+
+
+def test_concurrent_conversion():
+    datas = [json.loads(p.read_text(encoding="utf-8")) for p in SAMPLE_PATHS]
+    with settings.warn_unimplemented_type(False):
+        expected = [convert(data) for data in datas]
+    # start from an empty class fields cache, so threads race to fill it
+    mark_or_node._CLASS_FIELD.clear()
+    barrier = threading.Barrier(8)
+
+    def worker(_) -> list[str]:
+        barrier.wait(timeout=10)
+        with settings.warn_unimplemented_type(False):
+            return [convert(data) for data in datas]
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(worker, range(8)))
+    for result in results:
+        assert result == expected
+
+
+def test_get_fields():
+    mark_or_node._CLASS_FIELD.clear()
+    classes = list(NODE_TYPE_TO_CLASS_MAPPING.values())
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(lambda cls: cls.get_fields(), classes * 8))
+    for cls, fields in zip(classes * 8, results):
+        # every thread gets the same cached dict
+        assert fields is cls.get_fields()
+        assert "type" in fields
+
+
+def test_warn_unimplemented_type():
+    assert settings.is_warn_unimplemented_type() is settings.WARN_UNIMPLEMENTED_TYPE
+    seen = {}
+
+    def worker(flag: bool):
+        with settings.warn_unimplemented_type(flag):
+            seen[flag] = settings.is_warn_unimplemented_type()
+
+    threads = [threading.Thread(target=worker, args=(flag,)) for flag in (True, False)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert seen == {True: True, False: False}
+    assert settings.is_warn_unimplemented_type() is settings.WARN_UNIMPLEMENTED_TYPE
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "atlas_doc_parser.settings",
+        preview=False,
+    )
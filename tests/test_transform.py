@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+import json
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.nodes.node_text import NodeText
+from atlas_doc_parser.paths import path_enum
+from atlas_doc_parser.transform import Transformer, remove
+
+
+def rewrite_link(mark):
+    href = mark.attrs.href.replace("https://old.example.com", "https://new.example.com")
+    return dataclasses.replace(mark, attrs=dataclasses.replace(mark.attrs, href=href))
+
+
+def mention_to_text(node):
+    return [NodeText(text="@"), NodeText(text=node.attrs.text.lstrip("@"))]
+
+
+def drop_empty(node):
+    return node if node.content else None
+
+
+TRANSFORMER = Transformer(
+    node_callbacks={
+        "media": remove,
+        "mediaSingle": drop_empty,
+        "paragraph": drop_empty,
+        "mention": mention_to_text,
+    },
+    mark_callbacks={"link": rewrite_link, "strong": remove},
+)
+
+
+def para(*content) -> dict:
+    return {"type": "paragraph", "content": list(content)}
+
+
+def text(value: str, *marks) -> dict:
+    node = {"type": "text", "text": value}
+    if marks:
+        node["marks"] = list(marks)
+    return node
+
+
+DATA = {
+    "type": "doc",
+    "version": 1,
+    "content": [
+        para(text("keep me")),
+        para(
+            text("see "),
+            text("docs", {"type": "link", "attrs": {"href": "https://old.example.com/a"}}),
+            text(" "),
+            text("now", {"type": "strong"}, {"type": "em"}),
+        ),
+        para({"type": "mention", "attrs": {"id": "u1", "text": "@Alice"}}),
+        {
+            "type": "mediaSingle",
+            "content": [
+                {"type": "media", "attrs": {"type": "file", "id": "m1", "collection": ""}}
+            ],
+        },
+        para(),
+        {"type": "bulletList", "content": [{"type": "listItem", "content": [para(text("x"))]}]},
+    ],
+}
+
+
+def test_transform():
+    doc = NodeDoc.from_dict(DATA)
+    before = doc.to_dict()
+    new_doc = TRANSFORMER.transform(doc)
+    assert doc.to_dict() == before
+    assert new_doc.to_markdown() == (
+        "keep me\n"
+        "\n"
+        "see [docs](https://new.example.com/a) *now*\n"
+        "\n"
+        "@Alice\n"
+        "\n"
+        "- x\n"
+    )
+    assert len(new_doc.content) == 4
+    # the unchanged subtrees are shared
+    assert new_doc.content[0] is doc.content[0]
+    assert new_doc.content[3] is doc.content[5]
+    assert new_doc.content[1].content[0] is doc.content[1].content[0]
+    assert NodeDoc.from_dict(new_doc.to_dict()) == new_doc
+
+
+def test_unchanged():
+    path = path_enum.dir_adf_samples / "node_doc.json"
+    doc = NodeDoc.from_dict(json.loads(path.read_text(encoding="utf-8")))
+    assert Transformer().transform(doc) is doc
+    assert Transformer(mark_callbacks={"code": lambda m: m}).transform(doc) is doc
+    assert Transformer(node_callbacks={"doc": remove}).transform(doc) is None
+
+
+def test_transform_many():
+    docs = [NodeDoc.from_dict(DATA) for _ in range(4)]
+    expected = [TRANSFORMER.transform(doc) for doc in docs]
+    assert list(TRANSFORMER.transform_many(docs)) == expected
+    with ThreadPoolExecutor(2) as executor:
+        assert list(TRANSFORMER.transform_many(docs, executor=executor)) == expected
+    with ProcessPoolExecutor(2) as executor:
+        assert list(TRANSFORMER.transform_many(docs, executor=executor)) == expected
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_unit_test
+
+    run_unit_test(__file__)
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+import pytest
+
+from atlas_doc_parser import telemetry
+from atlas_doc_parser.exc import UnimplementedTypeError, ValidationError
+from atlas_doc_parser.validator import (
+    Validator,
+    validate,
+    parse_trusted,
+    parse_validated,
+)
+from atlas_doc_parser.synthetic import make_doc
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.paths import path_enum
+
+sample_paths = sorted(path_enum.dir_adf_samples.glob("*.json"))
+
+
+@pytest.mark.parametrize("path", sample_paths, ids=lambda p: p.stem)
+def test_samples(path):
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert validate(data) == []
+    assert parse_trusted(data) == NodeDoc.from_dict(data)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_synthetic(seed):
+    data = make_doc(seed=seed, n_nodes=200, mark_density=0.5)
+    assert validate(data) == []
+    doc = parse_validated(data)
+    assert doc == NodeDoc.from_dict(data)
+    assert doc.to_markdown() == NodeDoc.from_dict(data).to_markdown()
+
+
+def test_invalid():
+    data = {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {"type": "heading", "content": [{"type": "text", "text": "a"}]},
+            {
+                "type": "paragraph",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": 1,
+                        "marks": [{"type": "link"}, {"type": "border"}],
+                    },
+                    {"type": "paragraph"},
+                ],
+            },
+            {
+                "type": "mediaSingle",
+                "content": [
+                    {"type": "media", "attrs": {"type": "video", "width": "1"}}
+                ],
+            },
+            {"type": "bulletList"},
+            {"type": "table", "content": {}},
+            {"type": "rule", "attrs": []},
+            {"type": "bodiedExtension", "content": "ignored"},
+            "text",
+            {"content": []},
+        ],
+    }
+    issues = Validator().validate(data)
+    assert [str(issue) for issue in issues] == [
+        "content[0].attrs: missing required field 'attrs'",
+        "content[1].content[0].text: 1 is not string",
+        "content[1].content[0].marks[0].attrs: missing required field 'attrs'",
+        "content[1].content[0].marks[1]: mark 'border' is not allowed on 'text'",
+        "content[1].content[0].marks[1].attrs: missing required field 'attrs'",
+        "content[1].content[1]: 'paragraph' is not allowed in 'paragraph'",
+        "content[2].content[0].attrs.type: 'video' is not one of 'file', 'link', 'external'",
+        "content[2].content[0].attrs.width: '1' is not integer",
+        "content[3].content: missing required field 'content'",
+        "content[4].content: {} is not array",
+        "content[5].attrs: [] is not object",
+        "content[7]: 'text' is not object",
+        "content[8]: missing or invalid 'type'",
+    ]
+    assert issues[0].to_dict() == {
+        "path": "content[0].attrs",
+        "type": "heading",
+        "message": "missing required field 'attrs'",
+    }
+
+    with pytest.raises(ValidationError) as e:
+        parse_validated(data)
+    assert e.value.issues == issues
+    assert str(e.value).startswith("13 validation issue(s):\n")
+    assert "... and 3 more" in str(e.value)
+
+    assert [str(issue) for issue in validate([])] == ["@: [] is not object"]
+
+
+def test_parse_trusted():
+    data = {
+        "type": "doc",
+        "content": [
+            {
+                "type": "table",
+                "content": [
+                    {
+                        "type": "tableRow",
+                        "content": [
+                            {
+                                "type": "tableCell",
+                                "attrs": {"colwidth": [100]},
+                                "content": [{"type": "paragraph"}],
+                            }
+                        ],
+                    }
+                ],
+            },
+            {"type": "bodiedExtension"},
+            {
+                "type": "paragraph",
+                "content": [
+                    {"type": "text", "text": "a", "marks": [{"type": "unknownMark"}]}
+                ],
+            },
+        ],
+    }
+    telemetry.reset()
+    doc = parse_trusted(data)
+    assert doc == NodeDoc.from_dict(data)
+    assert doc.version == 1
+    assert len(doc.content) == 2
+    assert doc.content[1].content[0].marks == []
+    stats = {(stat.category, stat.type): stat.docs for stat in telemetry.get_stats()}
+    assert stats == {("node", "bodiedExtension"): 2, ("mark", "unknownMark"): 2}
+
+    # the node objects don't share mutable values with the input
+    data["content"][0]["content"][0]["content"][0]["attrs"]["colwidth"].append(1)
+    assert doc.content[0].content[0].content[0].attrs.colwidth == [100]
+
+    with pytest.raises(UnimplementedTypeError):
+        parse_trusted({"type": "bodiedExtension"})
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "atlas_doc_parser.validator",
+        preview=False,
+    )
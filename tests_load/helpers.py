@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+
+"""
+Shared helpers of the load tests.
+"""
+
+import timeit
+
+NUMBER = 20
+
+
+def timing(func, number: int = NUMBER, repeat: int = 3) -> float:
+    """
+    Time ``func``, the best of ``repeat`` runs of ``number`` calls.
+
+    :return: Seconds per call.
+    """
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+"""
+Build a 5k row table with :mod:`atlas_doc_parser.builder` and with the node
+constructors, the JSON payload is the same, the builder must be at least an
+order of magnitude faster.
+
+Run with ``pytest tests_load -s`` to see the timing table.
+"""
+
+import json
+
+from atlas_doc_parser import builder
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.nodes.node_table import NodeTable
+from atlas_doc_parser.nodes.node_table_row import NodeTableRow
+from atlas_doc_parser.nodes.node_table_cell import NodeTableCell
+from atlas_doc_parser.nodes.node_table_header import NodeTableHeader
+from atlas_doc_parser.nodes.node_paragraph import NodeParagraph
+from atlas_doc_parser.nodes.node_text import NodeText
+
+from helpers import timing
+
+N_ROWS = 5000
+HEADER = ["key", "summary", "status", "owner", "points"]
+
+
+def make_rows() -> list[list[str]]:
+    return [
+        [f"PROJ-{i}", f"summary of issue {i}", "Done", f"user{i % 7}", str(i % 13)]
+        for i in range(N_ROWS)
+    ]
+
+
+def naive(rows: list[list[str]]) -> str:
+    def cell(klass, value):
+        return klass(content=[NodeParagraph(content=[NodeText(text=value)])])
+
+    table = NodeTable(
+        content=[
+            NodeTableRow(content=[cell(NodeTableHeader, value) for value in HEADER]),
+            *[
+                NodeTableRow(content=[cell(NodeTableCell, value) for value in row])
+                for row in rows
+            ],
+        ]
+    )
+    return builder.to_json(NodeDoc(content=[table]).to_dict())
+
+
+def build(rows: list[list[str]]) -> str:
+    table = builder.table_from_rows(rows, header=HEADER)
+    return builder.to_json(builder.doc([table]))
+
+
+def test_builder_vs_constructors():
+    rows = make_rows()
+    assert json.loads(build(rows)) == json.loads(naive(rows))
+    t_naive = timing(lambda: naive(rows), number=1, repeat=1)
+    t_build = timing(lambda: build(rows), number=1, repeat=1)
+    print()
+    print(f"{N_ROWS} rows x {len(HEADER)} columns")
+    print(f"constructors + to_dict() {t_naive * 1000:10.1f} ms")
+    print(f"builder                  {t_build * 1000:10.1f} ms")
+    assert t_build * 10 < t_naive
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_unit_test
+
+    run_unit_test(__file__)
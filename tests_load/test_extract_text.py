@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compare plain text extraction with Markdown rendering, on both the node
+objects and the raw dict.
+
+Run with ``pytest tests_load -s`` to see the timing table.
+"""
+
+import json
+
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.raw_render import raw_to_markdown, raw_extract_text
+from atlas_doc_parser.paths import path_enum
+
+from helpers import timing
+
+
+def test_extract_text_vs_to_markdown():
+    path = path_enum.dir_adf_samples / "node_doc.json"
+    data = json.loads(path.read_text(encoding="utf-8"))
+    doc = NodeDoc.from_dict(data)
+
+    results = {
+        "NodeDoc.to_markdown()": timing(lambda: doc.to_markdown(), number=50),
+        "NodeDoc.extract_text()": timing(lambda: doc.extract_text(), number=50),
+        "raw_to_markdown()": timing(lambda: raw_to_markdown(data), number=50),
+        "raw_extract_text()": timing(lambda: raw_extract_text(data), number=50),
+        "from_dict + to_markdown()": timing(
+            lambda: NodeDoc.from_dict(data).to_markdown(),
+            number=50,
+        ),
+    }
+    print()
+    for name, elapsed in results.items():
+        print(f"{name:<28} {elapsed * 1000:8.3f} ms")
+
+    assert results["NodeDoc.extract_text()"] < results["NodeDoc.to_markdown()"]
+    assert results["raw_extract_text()"] < results["raw_to_markdown()"]
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_unit_test
+
+    run_unit_test(__file__)
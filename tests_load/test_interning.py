@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+"""
+Memory of a corpus of templated issues with and without interning: every
+issue is the same template plus a unique summary paragraph.
+
+Run with ``pytest tests_load -s`` to see the numbers.
+"""
+
+import gc
+import json
+import time
+import tracemalloc
+
+from atlas_doc_parser import settings
+from atlas_doc_parser.interning import interning
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.paths import path_enum
+from atlas_doc_parser.validator import parse_trusted
+
+N_DOCS = 200
+
+
+def make_corpus() -> list[dict]:
+    path = path_enum.dir_adf_samples / "node_doc.json"
+    template = json.loads(path.read_text(encoding="utf-8"))
+    return [
+        {
+            **template,
+            "content": [
+                {
+                    "type": "paragraph",
+                    "content": [{"type": "text", "text": f"issue {i} summary"}],
+                },
+                *template["content"],
+            ],
+        }
+        for i in range(N_DOCS)
+    ]
+
+
+def measure(corpus: list[dict], intern: bool) -> tuple[list[NodeDoc], int, float]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    if intern:
+        with interning() as table:
+            docs = [parse_trusted(data) for data in corpus]
+        table.clear()
+    else:
+        docs = [parse_trusted(data) for data in corpus]
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return docs, size, elapsed
+
+
+def test_interning_memory():
+    corpus = make_corpus()
+    with settings.warn_unimplemented_type(False):
+        plain, plain_size, plain_time = measure(corpus, intern=False)
+        shared, shared_size, shared_time = measure(corpus, intern=True)
+    assert plain == shared
+    print()
+    print(f"{N_DOCS} templated docs")
+    print(f"plain    {plain_size / 1e6:8.2f} MB {plain_time:6.2f} s")
+    print(f"interned {shared_size / 1e6:8.2f} MB {shared_time:6.2f} s")
+    assert shared_size * 10 < plain_size
+
+    # the shared subtrees are compared by identity
+    def compare(docs):
+        start = time.perf_counter()
+        assert docs[1].content[1:] == docs[0].content[1:]
+        return time.perf_counter() - start
+
+    t_plain, t_shared = compare(plain), compare(shared)
+    print(f"compare plain {t_plain * 1e6:8.1f} us, interned {t_shared * 1e6:8.1f} us")
+    assert t_shared < t_plain
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_unit_test
+
+    run_unit_test(__file__)
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+"""
+An edit by path copies the ancestors only, its cost doesn't grow with the
+document size, unlike a ``to_dict()`` / ``from_dict()`` round trip.
+
+Run with ``pytest tests_load -s`` to see the timing table.
+"""
+
+import json
+import time
+
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.nodes.node_text import NodeText
+from atlas_doc_parser.paths import path_enum
+from atlas_doc_parser.synthetic import DocGenerator
+from atlas_doc_parser.validator import parse_trusted
+
+N_EDITS = 1000
+
+
+def text_paths(doc: NodeDoc) -> list[str]:
+    """
+    The paths of all the text nodes, the deepest first.
+    """
+    paths = []
+    stack = [(doc, "")]
+    while stack:
+        node, path = stack.pop()
+        if node.type == "text":
+            paths.append(path)
+        content = getattr(node, "content", None)
+        if isinstance(content, list):
+            for i, child in enumerate(content):
+                prefix = f"{path}." if path else ""
+                stack.append((child, f"{prefix}content[{i}]"))
+    paths.sort(key=lambda path: -path.count("."))
+    return paths
+
+
+def edit_rate(doc: NodeDoc) -> float:
+    paths = text_paths(doc)[:50]
+    start = time.perf_counter()
+    for i in range(N_EDITS):
+        doc = doc.replace_at(paths[i % len(paths)], NodeText(text=str(i)))
+    return N_EDITS / (time.perf_counter() - start)
+
+
+def test_edit_cost():
+    path = path_enum.dir_adf_samples / "node_doc.json"
+    data = json.loads(path.read_text(encoding="utf-8"))
+    small = NodeDoc.from_dict(data)
+    large = parse_trusted(DocGenerator(seed=1, n_nodes=20000).generate())
+    rate_small = edit_rate(small)
+    rate_large = edit_rate(large)
+    start = time.perf_counter()
+    NodeDoc.from_dict(large.to_dict())
+    t_round_trip = time.perf_counter() - start
+    print()
+    print(f"replace_at() small doc {rate_small:12,.0f} edits/s")
+    print(f"replace_at() 20k nodes {rate_large:12,.0f} edits/s")
+    print(f"round trip   20k nodes {1 / t_round_trip:12,.1f} edits/s")
+    assert rate_large > 1000
+    assert rate_large * 5 > rate_small
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_unit_test
+
+    run_unit_test(__file__)
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compare the outline and the section tree with rendering the whole document
+and scanning it for ``#`` lines.
+
+Run with ``pytest tests_load -s`` to see the timing table.
+"""
+
+import re
+import json
+
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.paths import path_enum
+
+from helpers import timing
+
+_RE_HEADING = re.compile(r"^(#{1,6}) (.*)$", re.MULTILINE)
+
+
+def test_outline_vs_render():
+    path = path_enum.dir_adf_samples / "node_doc.json"
+    data = json.loads(path.read_text(encoding="utf-8"))
+    # a long document, the sample repeated
+    data = {**data, "content": data["content"] * 20}
+    doc = NodeDoc.from_dict(data)
+
+    results = {
+        "to_markdown() + regex": timing(
+            lambda: _RE_HEADING.findall(doc.to_markdown()),
+            number=50,
+        ),
+        "outline()": timing(lambda: doc.outline(), number=50),
+        "sections()": timing(lambda: doc.sections(), number=50),
+    }
+    print()
+    for name, elapsed in results.items():
+        print(f"{name:<24} {elapsed * 1000:8.3f} ms")
+
+    assert len(doc.outline()) == len(_RE_HEADING.findall(doc.to_markdown()))
+    assert results["outline()"] * 5 < results["to_markdown() + regex"]
+    assert results["sections()"] * 5 < results["to_markdown() + regex"]
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_unit_test
+
+    run_unit_test(__file__)
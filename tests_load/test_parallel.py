@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+"""
+Parse and render one giant document with a ``ProcessPoolExecutor``.
+
+With 4 or more CPUs parallel parsing must be faster, on fewer CPUs the
+numbers show the overhead of shipping the blocks to the workers. Parallel
+rendering with processes is expected to be slower, see
+:mod:`atlas_doc_parser.parallel`.
+
+Run with ``pytest tests_load -s`` to see the timing table.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from atlas_doc_parser import settings
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.synthetic import DocGenerator
+
+from helpers import timing
+
+
+def test_parallel_giant_doc():
+    data = DocGenerator(seed=1, n_nodes=20000).generate()
+    n_cpus = os.cpu_count() or 1
+    with settings.warn_unimplemented_type(False):
+        doc = NodeDoc.from_dict(data)
+        md = doc.to_markdown()
+        with ProcessPoolExecutor(n_cpus) as executor:
+            # warm up the workers
+            NodeDoc.from_dict(data, executor=executor, min_blocks=1)
+            assert NodeDoc.from_dict(data, executor=executor, min_blocks=1) == doc
+            assert doc.to_markdown(executor=executor, min_blocks=1) == md
+            t_parse = timing(lambda: NodeDoc.from_dict(data), number=1, repeat=1)
+            t_render = timing(lambda: doc.to_markdown(), number=1, repeat=1)
+            t_parse_par = timing(
+                lambda: NodeDoc.from_dict(data, executor=executor, min_blocks=1),
+                number=1,
+                repeat=1,
+            )
+            t_render_par = timing(
+                lambda: doc.to_markdown(executor=executor, min_blocks=1),
+                number=1,
+                repeat=1,
+            )
+    print()
+    print(f"{len(data['content'])} top level blocks, {n_cpus} CPUs")
+    print(f"from_dict   sequential {t_parse:.3f} s, parallel {t_parse_par:.3f} s")
+    print(f"to_markdown sequential {t_render:.3f} s, parallel {t_render_par:.3f} s")
+    if n_cpus >= 4:
+        assert t_parse_par < t_parse
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_unit_test
+
+    run_unit_test(__file__)
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+"""
+The cost of a preview depends on the budget, not on the document size.
+
+Run with ``pytest tests_load -s`` to see the timing table.
+"""
+
+import json
+
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.paths import path_enum
+from atlas_doc_parser.preview import render_preview
+
+from helpers import timing
+
+
+def test_preview_cost():
+    path = path_enum.dir_adf_samples / "node_doc.json"
+    data = json.loads(path.read_text(encoding="utf-8"))
+    small = NodeDoc.from_dict(data)
+    large = NodeDoc.from_dict({**data, "content": data["content"] * 50})
+    assert render_preview(small, max_chars=200) == render_preview(large, max_chars=200)
+    t_small = timing(lambda: render_preview(small, max_chars=200))
+    t_large = timing(lambda: render_preview(large, max_chars=200))
+    t_full = timing(lambda: large.to_markdown())
+    print()
+    print(f"preview x1  {t_small * 1000:8.3f} ms")
+    print(f"preview x50 {t_large * 1000:8.3f} ms")
+    print(f"to_markdown x50 {t_full * 1000:8.3f} ms")
+    assert t_large < t_small * 3
+    assert t_large * 5 < t_full
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_unit_test
+
+    run_unit_test(__file__)
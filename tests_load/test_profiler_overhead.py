@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+"""
+Measure the overhead of :class:`~atlas_doc_parser.profiler.Profiler`.
+
+A disabled profiler must not slow down the conversion, because ``stop()``
+restores the original methods. The enabled overhead is printed for reference.
+
+Run with ``pytest tests_load -s`` to see the timing table.
+"""
+
+import json
+
+from atlas_doc_parser.profiler import Profiler
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.paths import path_enum
+
+from helpers import timing
+
+
+def test_profiler_overhead():
+    path = path_enum.dir_adf_samples / "node_doc.json"
+    data = json.loads(path.read_text(encoding="utf-8"))
+
+    def convert():
+        return NodeDoc.from_dict(data).to_markdown()
+
+    before = timing(convert, number=10, repeat=5)
+    with Profiler():
+        enabled = timing(convert, number=10, repeat=5)
+    after = timing(convert, number=10, repeat=5)
+
+    print()
+    print(f"never enabled     {before * 1000:8.3f} ms")
+    print(f"enabled           {enabled * 1000:8.3f} ms")
+    print(f"after disabled    {after * 1000:8.3f} ms")
+    # no measurable overhead once disabled, allow for timing noise
+    assert after < before * 1.2
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_unit_test
+
+    run_unit_test(__file__)
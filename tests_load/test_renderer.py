@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compare the dispatch table renderer with the raw renderer, which has its own
+rules, the output is the same. ``to_markdown()`` renders with the default
+renderer, it costs no more than ``render()``.
+
+Run with ``pytest tests_load -s`` to see the timing table.
+"""
+
+import json
+
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.paths import path_enum
+from atlas_doc_parser.raw_render import raw_to_markdown
+from atlas_doc_parser.renderer import DEFAULT_RENDERER
+from atlas_doc_parser.synthetic import DocGenerator
+from atlas_doc_parser.validator import parse_trusted
+
+from helpers import timing
+
+
+def test_render_vs_to_markdown():
+    path = path_enum.dir_adf_samples / "node_doc.json"
+    data = json.loads(path.read_text(encoding="utf-8"))
+    docs = {
+        "node_doc x10": NodeDoc.from_dict({**data, "content": data["content"] * 10}),
+        "synthetic 5000": parse_trusted(DocGenerator(seed=1, n_nodes=5000).generate()),
+    }
+    total_method, total_render = 0.0, 0.0
+    print()
+    for name, doc in docs.items():
+        dct = doc.to_dict()
+        md = DEFAULT_RENDERER.render(doc)
+        assert md == raw_to_markdown(dct)
+        assert doc.to_markdown() == md
+        t_render = timing(lambda: DEFAULT_RENDERER.render(doc))
+        t_method = timing(lambda: doc.to_markdown())
+        t_raw = timing(lambda: raw_to_markdown(dct))
+        print(
+            f"{name:<16} render() {t_render * 1000:8.3f} ms, "
+            f"to_markdown() {t_method * 1000:8.3f} ms, "
+            f"raw_to_markdown() {t_raw * 1000:8.3f} ms"
+        )
+        total_method += t_method
+        total_render += t_render
+    assert total_method < total_render * 1.2
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_unit_test
+
+    run_unit_test(__file__)
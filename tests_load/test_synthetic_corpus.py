@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+"""
+Throughput of the synthetic corpus writer, and conversion of a large
+generated document.
+
+Run with ``pytest tests_load -s`` to see the timing table.
+"""
+
+import time
+
+from atlas_doc_parser.synthetic import make_doc, write_jsonl
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+
+
+def test_write_jsonl(tmp_path):
+    path = tmp_path / "corpus.jsonl"
+    start = time.perf_counter()
+    n_bytes = write_jsonl(path, n_docs=20, seed=1, n_nodes=10_000)
+    elapsed = time.perf_counter() - start
+    print()
+    print(f"write_jsonl: {n_bytes / 1_000_000:.1f} MB in {elapsed:.2f} s")
+    print(f"             {n_bytes / 1_000_000 / elapsed:.1f} MB/s")
+
+
+def test_large_doc():
+    data = make_doc(seed=1, n_nodes=100_000)
+    start = time.perf_counter()
+    md = NodeDoc.from_dict(data).to_markdown()
+    elapsed = time.perf_counter() - start
+    print()
+    print(f"100_000 nodes: from_dict + to_markdown in {elapsed:.2f} s")
+    assert md
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_unit_test
+
+    run_unit_test(__file__)
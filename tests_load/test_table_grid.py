@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+"""
+Render tall and wide tables, the time per cell must stay within a fixed
+budget whatever the table shape.
+
+Run with ``pytest tests_load -s`` to see the timing table.
+"""
+
+import io
+import time
+import tracemalloc
+
+from atlas_doc_parser.validator import parse_trusted
+from atlas_doc_parser.raw_render import raw_to_markdown
+
+# max render time per cell, in seconds
+CELL_BUDGET = 20e-6
+
+
+def make_table(n_rows: int, n_cols: int) -> dict:
+    rows = []
+    for i in range(n_rows):
+        cell_type = "tableHeader" if i == 0 else "tableCell"
+        rows.append(
+            {
+                "type": "tableRow",
+                "content": [
+                    {
+                        "type": cell_type,
+                        "attrs": {"colspan": 1, "rowspan": 1},
+                        "content": [
+                            {
+                                "type": "paragraph",
+                                "content": [{"type": "text", "text": f"r{i} c{j}"}],
+                            }
+                        ],
+                    }
+                    for j in range(n_cols)
+                ],
+            }
+        )
+    return {"type": "doc", "version": 1, "content": [{"type": "table", "content": rows}]}
+
+
+def test_table_shapes():
+    print()
+    for n_rows, n_cols in [(50_000, 4), (20, 500), (500, 40)]:
+        data = make_table(n_rows, n_cols)
+        doc = parse_trusted(data)
+        n_cells = n_rows * n_cols
+        for name, func in [
+            ("NodeDoc.to_markdown()", doc.to_markdown),
+            ("raw_to_markdown()", lambda: raw_to_markdown(data)),
+        ]:
+            start = time.perf_counter()
+            md = func()
+            per_cell = (time.perf_counter() - start) / n_cells
+            print(
+                f"{n_rows:>6} x {n_cols:<4} {name:<24} "
+                f"{per_cell * 1e6:6.2f} us/cell"
+            )
+            assert md.count("\n") == n_rows
+            assert per_cell < CELL_BUDGET
+
+
+def test_stream_csv():
+    # the export holds one row at a time, the peak memory doesn't grow with
+    # the number of rows
+    print()
+    peaks = []
+    for n_rows in [5_000, 50_000]:
+        table = parse_trusted(make_table(n_rows, 4)).content[0]
+        tracemalloc.start()
+        start = time.perf_counter()
+        n_records = sum(1 for _ in table.iter_records())
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        per_cell = elapsed / (n_rows * 4)
+        print(
+            f"{n_rows:>6} x 4    iter_records() "
+            f"{peak:>8} B peak, {per_cell * 1e6:6.2f} us/cell"
+        )
+        assert n_records == n_rows - 1
+        peaks.append(peak)
+        f = io.StringIO(newline="")
+        assert table.to_csv(f) == n_rows
+    assert peaks[1] < peaks[0] * 2
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_unit_test
+
+    run_unit_test(__file__)
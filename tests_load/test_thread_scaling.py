@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+"""
+Measure conversion throughput with a ``ThreadPoolExecutor``.
+
+On the free-threaded build (``python3.13t``) throughput should scale with
+the number of threads. On the standard build the GIL serializes the work,
+the numbers show the threading overhead instead, which should be small.
+
+Run with ``pytest tests_load -s`` to see the timing table.
+"""
+
+import sys
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from atlas_doc_parser import settings
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.paths import path_enum
+
+N_DOCS = 64
+THREADS = [1, 2, 4, 8]
+
+
+def convert(data: dict) -> str:
+    with settings.warn_unimplemented_type(False):
+        return NodeDoc.from_dict(data).to_markdown()
+
+
+def is_gil_enabled() -> bool:
+    try:
+        return sys._is_gil_enabled()
+    except AttributeError:  # Python < 3.13
+        return True
+
+
+def test_thread_scaling():
+    path = path_enum.dir_adf_samples / "node_doc.json"
+    data = json.loads(path.read_text(encoding="utf-8"))
+    datas = [data] * N_DOCS
+    expected = convert(data)
+
+    print()
+    print(f"Python {sys.version.split()[0]}, GIL enabled: {is_gil_enabled()}")
+    baseline = None
+    for n_thread in THREADS:
+        with ThreadPoolExecutor(n_thread) as executor:
+            start = time.perf_counter()
+            results = list(executor.map(convert, datas))
+            elapsed = time.perf_counter() - start
+        assert results == [expected] * N_DOCS
+        throughput = N_DOCS / elapsed
+        if baseline is None:
+            baseline = throughput
+        print(
+            f"{n_thread} thread(s): {throughput:8.1f} docs/s, "
+            f"speedup {throughput / baseline:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_unit_test
+
+    run_unit_test(__file__)
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compare ``NodeDoc.from_dict()`` with validation plus trusted parsing.
+
+Run with ``pytest tests_load -s`` to see the timing table.
+"""
+
+import json
+
+from atlas_doc_parser.nodes.node_doc import NodeDoc
+from atlas_doc_parser.validator import validate, parse_trusted, parse_validated
+from atlas_doc_parser.synthetic import make_doc
+from atlas_doc_parser.paths import path_enum
+
+from helpers import timing
+
+
+def test_validate_then_trust():
+    path = path_enum.dir_adf_samples / "node_doc.json"
+    cases = {
+        "node_doc.json": json.loads(path.read_text(encoding="utf-8")),
+        "synthetic 5_000 nodes": make_doc(seed=1, n_nodes=5_000),
+    }
+    print()
+    for name, data in cases.items():
+        results = {
+            "NodeDoc.from_dict()": timing(lambda: NodeDoc.from_dict(data), number=10),
+            "validate()": timing(lambda: validate(data), number=10),
+            "parse_trusted()": timing(lambda: parse_trusted(data), number=10),
+            "parse_validated()": timing(lambda: parse_validated(data), number=10),
+        }
+        print(name)
+        for label, elapsed in results.items():
+            print(f"    {label:<24} {elapsed * 1000:8.3f} ms")
+        assert results["parse_validated()"] < results["NodeDoc.from_dict()"]
+
+
+if __name__ == "__main__":
+    from atlas_doc_parser.tests import run_unit_test
+
+    run_unit_test(__file__)